@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+This script benchmarks the cocktail index on synthetic data, so the cost of
+the IR code can be measured on databases much bigger than cocktails.xml.
+"""
+import argparse
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+import xml.etree.cElementTree as cet
+sys.path.append(os.path.join(os.getcwd(), r'brains'))
+import cocktail_ir
+from nltk.corpus import stopwords
+from nltk.stem import SnowballStemmer
+
+
+FIELDS = ('prime', 'description', 'history', 'trivia', 'comments',
+          'ingredients', 'mixing')
+
+
+def enlarge_database(dbfile, outfile, size, seed=0):
+    """
+    This function writes a synthetic database of the given number of
+    cocktails. Every cocktail is a copy of a real one with its sentences
+    shuffled and a few made-up words sprinkled in, so the vocabulary keeps
+    growing with the database like it would with real data.
+
+    INPUT:
+        dbfile  --  full path to cocktails database to copy from
+        outfile --  full path of the synthetic database
+        size    --  number of cocktails to write
+        seed    --  random seed, the same seed writes the same database
+    """
+    rnd = random.Random(seed)
+    docs = cocktail_ir.parse_cocktails_database(dbfile)
+    names = sorted(docs)
+    root = cet.Element('data')
+    for i in range(size):
+        name = names[i % len(names)]
+        cocktail = cet.SubElement(root, 'cocktail',
+                                  name='{0} {1}'.format(name, i))
+        for field in FIELDS:
+            text = docs[name].get(field) or ''
+            if field in ('description', 'history', 'trivia', 'comments'):
+                lines = [line.strip() for line in text.split('\n')
+                         if line.strip()]
+                rnd.shuffle(lines)
+                lines += ['Made with {0}word{1}.'.format(
+                    field, rnd.randrange(size)) for _ in range(3)]
+                text = '\n'.join(lines)
+            cet.SubElement(cocktail, field).text = text
+    cet.ElementTree(root).write(outfile, encoding='UTF-8',
+                                xml_declaration=True)
+
+
+def timed(func, *args):
+    """
+    This function calls func and returns its result and the wall time spent.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_build(argz):
+    """
+    This function times every step of building the tf-idf index of a
+    synthetic database, and loading the index it saved.
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        dbfile = os.path.join(tmpdir, 'cocktails.xml')
+        index_file = os.path.join(tmpdir, 'cocktails.idx')
+        enlarge_database(argz.db, dbfile, argz.cocktails)
+        docs, parse_time = timed(cocktail_ir.parse_cocktails_database, dbfile)
+        wordsbag, stem_time = timed(cocktail_ir.make_wordsbag, docs)
+        (counts, _, _), count_time = timed(cocktail_ir.count_terms, wordsbag)
+        matrix, matrix_time = timed(cocktail_ir.TfidfMatrix.from_counts,
+                                    counts, docs)
+        _, index_time = timed(cocktail_ir.CocktailIndex, dbfile, index_file)
+        _, load_time = timed(cocktail_ir.CocktailIndex, dbfile, index_file)
+        print('{0} cocktails, {1} terms, {2} postings'.format(
+            len(docs), len(matrix.vocab), len(matrix.data)))
+        for label, secs in (('parse xml', parse_time),
+                            ('stem', stem_time),
+                            ('count terms', count_time),
+                            ('tf-idf matrix', matrix_time),
+                            ('index cold build', index_time),
+                            ('index warm load', load_time)):
+            print('{0:<20}{1:10.3f} s'.format(label, secs))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def legacy_stems(text):
+    """
+    This function normalizes text the way cocktail_ir did before the shared
+    Normalizer: stop words reloaded as a list and an uncached stemmer on
+    every call. It is only kept as the baseline of bench_normalize.
+    """
+    sst = SnowballStemmer('english')
+    stop = stopwords.words('english')
+    trans = {ord(c): None for c in string.punctuation}
+    return [sst.stem(tok) for tok in text.lower().translate(trans).split()
+            if tok not in stop]
+
+
+def bench_normalize(argz):
+    """
+    This function measures the normalization throughput on the text blocks
+    of the database, in tokens per second.
+    """
+    docs = cocktail_ir.parse_cocktails_database(argz.db)
+    texts = [doc[block] for doc in docs.values()
+             for block in ('description', 'history', 'trivia', 'comments')
+             if doc[block]] * argz.repeat
+    tokens = sum(len(text.split()) for text in texts)
+    normalizer = cocktail_ir.get_normalizer()
+    for label, stems in (('legacy', legacy_stems),
+                         ('normalizer', normalizer.stems)):
+        _, secs = timed(lambda: [stems(text) for text in texts])
+        print('{0:<20}{1:10.0f} tokens/s'.format(label, tokens / secs))
+
+
+if __name__ == '__main__':
+    prs = argparse.ArgumentParser()
+    prs.add_argument('--db', default='cocktails.xml',
+                     help='Cocktails database the synthetic data is made of.')
+    sub = prs.add_subparsers(dest='bench')
+    sub.required = True
+    build = sub.add_parser('build', help='Time building the tf-idf index.')
+    build.add_argument('-n', '--cocktails', type=int, default=10000,
+                       help='Number of cocktails in the synthetic database.')
+    build.set_defaults(func=bench_build)
+    normalize = sub.add_parser('normalize',
+                               help='Time the text normalization pipeline.')
+    normalize.add_argument('-r', '--repeat', type=int, default=10,
+                           help='Number of passes over the database text.')
+    normalize.set_defaults(func=bench_normalize)
+    argz = prs.parse_args()
+    argz.func(argz)
@@ -5,35 +5,44 @@ and tf-idf statistics. It uses cocktails.xml as a data source. The script
 evaluates user query and returns the most relevant document.
 """
 
+import dbm
+import functools
+import hashlib
+import json
 import os
 import string
+import struct
+import tempfile
 import xml.etree.cElementTree as cet
 import numpy as np
 import math
+import random
 import sys
-from collections import Counter, defaultdict
+import threading
+from collections import Counter, OrderedDict, defaultdict
 from nltk import word_tokenize, pos_tag
 from nltk.stem import SnowballStemmer
 from nltk.corpus import stopwords
 from nltk.corpus import wordnet as wn
 
 
+class EmptyQueryError(ValueError):
+    """
+    Raised when nothing is left of the user query after normalization, so
+    there is nothing to compare the documents with.
+    """
+    pass
+
+
 # @profile
-def init_cocktails_database(dbfile, tf_file=False, idf_file=False):
+def parse_cocktails_database(dbfile):
     """
-    This function reads db_file, does basic text normalization steps and
-    converts all data into a bad of words model. The scipt also writes tf and
-    tfidf index files for faster processing.
+    This function reads db_file and creates its dict representation.
 
     INPUT:
         db_file --  full path to cocktails database
-        tf_file --  filename with .tf extension
-        idf_file    --  filename with .idf extension
     OUTPUT:
-        cocktails.tf    --  file containing term freq values
-        cocktails.tfidf --  file containing term freq - inverted doc freq values
         docs    --  dict representation of db_file
-        # wordsbag    --  normalized dictionary of terms per doc
     """
     # parsing xml file and creating its dict representation
     docs = {}
@@ -60,59 +69,422 @@ def init_cocktails_database(dbfile, tf_file=False, idf_file=False):
                 docs[docid].update({'mixing': elem.text})
             elem.clear()
     del xml_iter
+    return docs
+
+
+# @profile
+def make_wordsbag(docs):
+    """
+    This function does basic text normalization steps and converts all data
+    into a bag of words model.
+
+    INPUT:
+        docs    --  dict representation of db_file
+    OUTPUT:
+        wordsbag    --  normalized dictionary of terms per doc
+    """
     # normalizing xml file data and creating a bad of words dict
-    # initializing SnowballStemmer from nltk
-    sst = SnowballStemmer('english')
-    # taking stopwords from nltk
-    stop = stopwords.words('english')
-    # creating translation table to remove punctuation
-    transpunct = {ord(c): None for c in string.punctuation}
-    # first we remove any punctuation and concatenate specific nodes into one
+    normalizer = get_normalizer()
+    # first we concatenate specific nodes into one
     dirtywordsbag = {}
     for doc in docs:
-        dirtywordsbag[doc] = ""
         nodes = filter(lambda x: x in
                        ['description', 'history', 'trivia', 'comments'],
                        docs[doc])
-        for node in nodes:
-            node_text = (docs[doc][node] or "")  # in case node is empty
-            dirtywordsbag[doc] += node_text.lower().translate(transpunct)
-    # now we remove stop words and stem the rest
-    wordsbag = {doc: tuple(sst.stem(tok) for tok in text.split()
-                           if tok not in stop)
+        # in case node is empty
+        dirtywordsbag[doc] = ''.join(docs[doc][node] or "" for node in nodes)
+    # now we remove punctuation and stop words and stem the rest
+    wordsbag = {doc: tuple(normalizer.stems(text))
                 for doc, text in dirtywordsbag.items()}
-    # we now create tf and tfidf files from db_file if they do not exist
-    # we flatten our wordsbag and calc term frequency of every word for each doc
-    # we take db_file name without extension and add .tf extension to it
-    # max_freqs is a dict where {doc id: freq of most occurring token, ...}
-    max_freqs = {doc: Counter(tokens).most_common()[0]
-                 for doc, tokens in wordsbag.items()}
-    terms_set = (set(term for d in wordsbag for term in wordsbag[d]))
-    if tf_file and tf_file not in os.listdir(os.getcwd()):
-        with open(tf_file, 'a') as afile:
-            for doc in wordsbag:
-                for term in wordsbag[doc]:
-                    # calculating tf-values and writing them to file
-                    tf_str = str(Counter(wordsbag[doc])[term]/max_freqs[doc][1])
-                    vlst = '\t'.join([doc, term, tf_str])
-                    afile.write(vlst)
-                    afile.write('\n')
-
-    # we take db_file name without extension and add .idf extension to it
-    if idf_file and idf_file not in os.listdir(os.getcwd()):
-        doc_cnt = len(wordsbag)
-        with open(idf_file, 'a') as afile:
-            for term in terms_set:
-                # calculating idf values and writing them to idf file
-                idf = math.log(doc_cnt/len([term for doc in wordsbag
-                                            if term in wordsbag[doc]]))
-                afile.write('\t'.join([term, str(idf)]))
-                afile.write('\n')
-    return docs
+    return wordsbag
+
+
+class Normalizer:
+    """
+    This class is the text normalization pipeline shared by the similarity
+    models: lowercasing, punctuation removal, stop word filtering and
+    Snowball stemming. The stop words are kept in frozensets and the stems
+    of the most recent words are memoized.
+    """
+    def __init__(self, stem_cache_size=None):
+        """
+        INPUT:
+            stem_cache_size --  number of memoized stems, STEM_CACHE_SIZE
+                                if None
+        """
+        if stem_cache_size is None:
+            stem_cache_size = STEM_CACHE_SIZE
+        # taking stopwords from nltk
+        self.stop = frozenset(stopwords.words('english'))
+        # we exclude some words that we do not need in the query
+        self.query_stop = self.stop | frozenset(EXCLUDED)
+        # translation table to remove punctuation
+        self.transpunct = {ord(c): None for c in string.punctuation}
+        self.stem = functools.lru_cache(maxsize=stem_cache_size)(
+            SnowballStemmer('english').stem)
+
+    def tokens(self, text, stop=None):
+        """
+        This function returns the lowercased tokens of text without
+        punctuation and stop words (self.stop if None).
+        """
+        if stop is None:
+            stop = self.stop
+        return [tok for tok in text.lower().translate(self.transpunct).split()
+                if tok not in stop]
+
+    def stems(self, text, stop=None):
+        """
+        This function returns the stems of the tokens of text, see tokens().
+        """
+        stem = self.stem
+        return [stem(tok) for tok in self.tokens(text, stop)]
+
+
+def get_normalizer():
+    """
+    This function returns the process-wide Normalizer.
+    """
+    global _NORMALIZER
+    if _NORMALIZER is None:
+        _NORMALIZER = Normalizer()
+    return _NORMALIZER
+
+
+class CocktailIndex:
+    """
+    This class loads or builds everything the similarity models need only
+    once: the documents, their stemmed bags of words, the tf-idf document
+    vectors, the inverted index and the idf table. Afterwards every query
+    only pays for the scoring itself.
+    """
+    def __init__(self, dbfile, index_file=None, expansions=None):
+        """
+        INPUT:
+            db_file --  full path to cocktails database
+            index_file  --  binary tf-idf index file, see TfidfMatrix.save.
+                            Its manifest is kept in index_file + '.manifest'
+            expansions  --  ExpansionCache to share, e.g. with the index
+                            this one replaces, a new one if None
+        """
+        self.dbfile = dbfile
+        self.index_file = index_file
+        self.manifest_file = index_file and index_file + '.manifest'
+        # the stemmed term counts are only needed to build the tf-idf matrix
+        self.counts = None
+        self.matrix = None
+        # memoized wordnet definitions of query words, see ExpansionCache
+        self.expansions = expansions or ExpansionCache(
+            index_file and index_file.rsplit('.', 1)[0] + '.wordnet')
+        # the WORDNET block tables are built on the first WORDNET query
+        self._block_tables = None
+        self._block_tables_lock = threading.Lock()
+        manifest = read_manifest(self.manifest_file)
+        # the source is checked before it is parsed, so an edit racing with
+        # the parsing only makes the next start rebuild again
+        source = source_info(dbfile, manifest and manifest['source'])
+        self.docs = parse_cocktails_database(dbfile)
+        if manifest and manifest['source']['sha1'] == source['sha1']:
+            try:
+                self.matrix = TfidfMatrix.load(index_file)
+            except (IOError, ValueError) as err:
+                sys.stderr.write('Rebuilding {0}: {1}\n'.format(index_file,
+                                                               err))
+            if self.matrix is not None and manifest['source'] != source:
+                # touched but not changed, just remember the new mtime
+                manifest['source'] = source
+                write_manifest(self.manifest_file, manifest)
+        if self.matrix is None:
+            self._rebuild(source, manifest)
+
+    def _rebuild(self, source, manifest):
+        """
+        This function builds the tf-idf matrix and, if there is an index
+        file, atomically replaces it and its manifest. Only the cocktails
+        whose database entry changed since the manifest was written are
+        stemmed again, the others reuse their term counts from the manifest.
+        """
+        known = manifest['docs'] if manifest else {}
+        entries = {}
+        changed = {}
+        for doc in self.docs:
+            digest = doc_digest(self.docs[doc])
+            if doc in known and known[doc]['hash'] == digest:
+                entries[doc] = known[doc]
+            else:
+                changed[doc] = self.docs[doc]
+        for doc, bag in make_wordsbag(changed).items():
+            entries[doc] = {'hash': doc_digest(self.docs[doc]),
+                            'terms': Counter(bag)}
+        self.counts = dict((doc, entries[doc]['terms']) for doc in self.docs)
+        self.matrix = TfidfMatrix.from_counts(self.counts, self.docs)
+        if self.index_file:
+            self.matrix.save(self.index_file)
+            write_manifest(self.manifest_file, {'version': INDEX_VERSION,
+                                                'source': source,
+                                                'docs': entries})
+
+    def validate(self):
+        """
+        This function checks that the index can answer queries: there is at
+        least one cocktail, every cocktail has the fields the queries return
+        and the tf-idf matrix covers exactly the cocktails of the database.
+        It raises ValueError otherwise.
+        """
+        if not self.docs:
+            raise ValueError('No cocktails in {0}'.format(self.dbfile))
+        for name, doc in self.docs.items():
+            missing = [field for field in DOC_FIELDS
+                       if not isinstance(doc, dict) or field not in doc]
+            if missing:
+                raise ValueError('Cocktail "{0}" has no {1}'.format(
+                    name, ', '.join(missing)))
+        if sorted(self.matrix.docs) != sorted(self.docs) or \
+                len(self.matrix.norms) != len(self.docs):
+            raise ValueError('The index of {0} does not match its '
+                             'cocktails'.format(self.dbfile))
+
+    def query(self, text, analyser, verbosity=0):
+        """
+        This function returns the cocktail that matches the query best.
+
+        INPUT:
+            text    --  unformatted user query
+            analyser    --  similarity model to use: TFIDF or WORDNET
+            verbosity   --  number of text blocks shown to user
+        OUTPUT:
+            cocktail, desc, ing, mix, hist, triv    --  advice tuple
+        """
+        scores = self.scores(text, analyser)
+        cocktail = self.matrix.docs[int(np.argmax(scores))]
+        doc = self.docs[cocktail]
+        if verbosity == 1:
+            hist, triv = doc['history'], doc['trivia']
+        else:
+            hist, triv = '', ''
+        return (cocktail, doc['description'], doc['ingredients'],
+                doc['mixing'], hist, triv)
+
+    def scores(self, text, analyser):
+        """
+        This function scores every document against the query, the scores
+        are in the order of self.matrix.docs.
+
+        INPUT:
+            text    --  unformatted user query
+            analyser    --  similarity model to use: TFIDF or WORDNET
+        OUTPUT:
+            scores  --  array of similarity scores, one per document
+        """
+        # setting default here because aiml returns undetectable empty str ''
+        if analyser == '':
+            analyser = 'TFIDF'  # default analyser
+        if analyser == 'WORDNET':
+            # 1. WORDNET
+            stems = wordnet_stems(expand_with_wordnet(text, self.expansions))
+            return self.block_tables().scores(stems)
+        elif analyser == 'TFIDF':
+            # 2. TF-IDF
+            return self.matrix.cosine(query_tf(text))
+        raise ValueError('Unknown analyser: {0}'.format(analyser))
+
+    def block_tables(self):
+        """
+        This function returns the BlockTables of the documents, in the order
+        of self.matrix.docs. They are only built once.
+        """
+        with self._block_tables_lock:
+            if self._block_tables is None:
+                self._block_tables = BlockTables(self.docs, self.matrix.docs)
+        return self._block_tables
+
+    def search(self, text, k=3, min_score=0.0, analyser='TFIDF'):
+        """
+        This function returns the k cocktails that match the query best.
+        Cocktails that score below min_score or share nothing with the query
+        are left out.
+
+        INPUT:
+            text    --  unformatted user query
+            k   --  maximum number of cocktails to return
+            min_score   --  lowest acceptable similarity score
+            analyser    --  similarity model to use: TFIDF or WORDNET
+        OUTPUT:
+            found   --  list of (cocktail, score) tuples, best match first
+        """
+        scores = self.scores(text, analyser)
+        return [(self.matrix.docs[i], float(scores[i]))
+                for i in top_k(scores, k)
+                if scores[i] > 0 and scores[i] >= min_score]
+
+    def describe(self, name):
+        """
+        This function returns the description and the ingredients of a
+        cocktail. Unknown cocktails raise KeyError.
+        """
+        return self.docs[name]['description'], self.docs[name]['ingredients']
+
+    def field(self, name, field):
+        """
+        This function returns a single field of a cocktail. Unknown cocktails
+        and fields raise KeyError.
+        """
+        return self.docs[name][field]
+
+    def trivia(self):
+        """
+        This function returns a random (cocktail, trivia) pair.
+        """
+        trivias = dict((key, val['trivia']) for key, val in self.docs.items()
+                       if val)
+        choice = random.choice(list(trivias.keys()))
+        return choice, trivias[choice]
+
+
+def top_k(scores, k):
+    """
+    This function returns the indices of the k highest scores, best first,
+    without sorting the whole scores array.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    # argpartition picks any of the scores tied with the k-th one, take
+    # them all so that equal scores keep the database order, like a stable
+    # sort would do
+    best = np.flatnonzero(scores >= kth)
+    return best[np.lexsort((best, -scores[best]))][:k]
+
+
+def atomic_write(filename, chunks):
+    """
+    This function writes chunks of bytes to a temporary file next to filename
+    and renames it over filename, so readers never see a partial file.
+    """
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, tmpname = tempfile.mkstemp(dir=dirname,
+                                   prefix=os.path.basename(filename) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as wfile:
+            for chunk in chunks:
+                wfile.write(chunk)
+        os.replace(tmpname, filename)
+    except BaseException:
+        os.unlink(tmpname)
+        raise
+
+
+def read_manifest(filename):
+    """
+    This function reads an index manifest. It returns None if there is no
+    usable manifest.
+
+    A manifest is a json dict with the keys:
+        version --  INDEX_VERSION of the index it describes
+        source  --  size, mtime and sha1 of the database file, see source_info
+        docs    --  a dict of {doc: {'hash': doc_digest, 'terms': counts}}
+    """
+    if not filename:
+        return None
+    try:
+        with open(filename, 'r') as rfile:
+            manifest = json.load(rfile)
+    except (IOError, ValueError):
+        return None
+    if manifest.get('version') != INDEX_VERSION:
+        return None
+    return manifest
+
+
+def write_manifest(filename, manifest):
+    """
+    This function atomically writes an index manifest.
+    """
+    atomic_write(filename, [json.dumps(manifest).encode('utf-8')])
+
+
+def source_info(dbfile, known=None):
+    """
+    This function describes the database file by its size, mtime and
+    content hash. The file is only hashed when its size or mtime differ
+    from the known description, otherwise the known hash is reused.
+    """
+    stat = os.stat(dbfile)
+    info = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+    if known and known['size'] == info['size'] and \
+            known['mtime'] == info['mtime']:
+        info['sha1'] = known['sha1']
+        return info
+    with open(dbfile, 'rb') as rfile:
+        info['sha1'] = hashlib.sha1(rfile.read()).hexdigest()
+    return info
+
+
+def doc_digest(doc):
+    """
+    This function returns a hash of the dict representation of a single
+    <cocktail> entry of the database.
+    """
+    raw = json.dumps(doc, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()
+
+
+def get_index(dbfile=None):
+    """
+    This function returns the process-wide CocktailIndex of the given
+    database file (cocktails.xml in the current directory by default),
+    building it on first use.
+    """
+    dbfile = dbfile or os.path.join(os.getcwd(), 'cocktails.xml')
+    with _INDEXES_LOCK:
+        if dbfile not in _INDEXES:
+            # the binary index lives next to the database, cocktails.idx
+            index_file = dbfile.rsplit('.', 1)[0] + '.idx'
+            _INDEXES[dbfile] = CocktailIndex(dbfile, index_file)
+        return _INDEXES[dbfile]
+
+
+def reload_index(dbfile=None):
+    """
+    This function builds a new CocktailIndex of the given database file
+    (cocktails.xml in the current directory by default), validates it and
+    makes it the process-wide index, so that get_index returns it from now
+    on. The old index keeps answering while the new one is built, only the
+    cocktails that changed are stemmed again, and the wordnet definitions
+    cached by the old index are kept.
+
+    If the database cannot be read or the new index is invalid, the error
+    is raised and the old index stays in place.
+    """
+    dbfile = dbfile or os.path.join(os.getcwd(), 'cocktails.xml')
+    with _INDEXES_LOCK:
+        old = _INDEXES.get(dbfile)
+    index_file = dbfile.rsplit('.', 1)[0] + '.idx'
+    index = CocktailIndex(dbfile, index_file, old and old.expansions)
+    index.validate()
+    with _INDEXES_LOCK:
+        _INDEXES[dbfile] = index
+    return index
+
+
+def init_cocktails_database(dbfile):
+    """
+    This function returns the dict representation of db_file. It is kept for
+    backwards compatibility, the documents come from the process-wide index.
+    It no longer writes cocktails.tf and cocktails.idf files, the index keeps
+    its own binary index file, see TfidfMatrix.
+
+    INPUT:
+        db_file --  full path to cocktails database
+    OUTPUT:
+        docs    --  dict representation of db_file
+    """
+    return get_index(dbfile).docs
 
 
 # @profile
-def wordnet_sim(query, db):
+def wordnet_sim(query, db, tables=None):
     """
     This function imlements simple wordnet definition lookup and compares it
     with a different block of text. For every word match between the definition
@@ -122,51 +494,86 @@ def wordnet_sim(query, db):
     query  --  string that represents user query expanded with word net defs
     db  --  dict representation of database xml file
 
+    tables  --  BlockTables of db, built if omitted
+
     OUTPUT:
-    maxdoc  --  the document with the highest score
-    """
-    # print('QUERY:', query)
-    # initializing SnowballStemmer from nltk
-    sst = SnowballStemmer('english')
-    # taking stopwords from nltk
-    stop = stopwords.words('english')
-    # creating translation table to remove punctuation
-    transnone = {ord(c): None for c in string.punctuation}
-    # first we remove any punctuation and concatenate specific nodes into one
-    query_nopunct = query.lower().translate(transnone)
-    query_stems = [sst.stem(token) for token in query_nopunct.split()
-                   if token not in stop]
-    doc_scores = defaultdict(float)
-    for doc in db:
-        for block, text in db[doc].items():
-            # normalize block text
-            if not text:
-                continue
-            text_nopunct = text.lower().translate(transnone)
-            text = [sst.stem(t) for t in text_nopunct.split() if t not in stop]
-            if len(text) == 0:
-                text += ' '
-            # here we can finetune the block score multiplicators
-            # some blocks are more important than the others
-            if block == 'description':
-                for s in query_stems:
-                    doc_scores[doc] += text.count(s) / len(text) * 2
-            elif block == 'trivia':
-                for s in query_stems:
-                    doc_scores[doc] += text.count(s) / len(text) * 0.5
-            elif block == 'history':
-                for s in query_stems:
-                    doc_scores[doc] += text.count(s) / len(text) * 0.5
-            elif block == 'comments':
-                for s in query_stems:
-                    doc_scores[doc] += text.count(s) / len(text)
-    maxdoc = max(doc_scores, key=lambda x: doc_scores[x])
-    debug = sorted([(k,v) for k,v in doc_scores.items()], key=lambda x: x[1])
-    return (debug, maxdoc)
+    doc_scores  --  a dict of {doc: score, ...}
+    """
+    query_stems = wordnet_stems(query)
+    if tables is None:
+        tables = BlockTables(db)
+    return dict(zip(tables.docs, tables.scores(query_stems).tolist()))
+
+
+def wordnet_stems(text):
+    """
+    This function lowercases the text, removes punctuation and stop words and
+    stems the rest, the way wordnet_sim compares texts. Queries with nothing
+    left raise EmptyQueryError.
+
+    INPUT:
+        text    --  unformatted text
+    OUTPUT:
+        stems   --  list of stems
+    """
+    stems = get_normalizer().stems(text)
+    if not stems:
+        raise EmptyQueryError(EMPTY_QUERY_REPLY)
+    return stems
+
+
+class BlockTables:
+    """
+    This class keeps the stemmed text blocks of every document the way
+    wordnet_sim scores them: for every block a table of
+    {stem: (doc positions, weighted frequencies)}, where the weighted
+    frequency is count / block length * block weight (see WORDNET_BLOCKS).
+    Scoring a query is then a lookup per block and query stem.
+    """
+    def __init__(self, db, docs=None):
+        """
+        INPUT:
+            db  --  dict representation of database xml file
+            docs    --  document ids, in the order of the scores, db order
+                        if None
+        """
+        self.docs = list(db if docs is None else docs)
+        self.tables = []
+        for block, weight in WORDNET_BLOCKS:
+            postings = defaultdict(lambda: ([], []))
+            for pos, doc in enumerate(self.docs):
+                text = db[doc].get(block)
+                if not text:
+                    continue
+                tokens = get_normalizer().stems(text)
+                if not tokens:
+                    continue
+                for term, cnt in Counter(tokens).items():
+                    postings[term][0].append(pos)
+                    postings[term][1].append(cnt / len(tokens) * weight)
+            self.tables.append(dict(
+                (term, (np.array(positions, dtype=np.int64),
+                        np.array(freqs, dtype=np.float64)))
+                for term, (positions, freqs) in postings.items()))
+
+    def scores(self, stems):
+        """
+        This function scores every document against the query stems, the
+        scores are in the order of self.docs. Query stems count as often as
+        they occur.
+        """
+        scores = np.zeros(len(self.docs))
+        # the same order of additions as block by block, stem by stem
+        for table in self.tables:
+            for stem in stems:
+                hits = table.get(stem)
+                if hits is not None:
+                    scores[hits[0]] += hits[1]
+        return scores
 
 
 # @profile
-def expand_with_wordnet(query):
+def expand_with_wordnet(query, cache=None):
     """
     This function expands every contentful word in the query with its wordnet
     definition. The word itself is not removed. Stop words are removed from the
@@ -175,136 +582,508 @@ def expand_with_wordnet(query):
 
     INPUT:
         query   --  user query that is a simple string
+        cache   --  ExpansionCache to look the definitions up in, WordNet is
+                    asked directly if None
     OUTPUT:
         expanded_query  --  user query + definitions of contentful words
     """
-    stop = stopwords.words('english')
-    stop += EXCLUDED
+    stop = get_normalizer().query_stop
     contentful_tokens = [tok for tok in query.split() if tok not in stop]
-    # take the first definition for the current word
     defs = []
     for token in contentful_tokens:
-        syn1 = wn.synsets(token, pos=wn.ADJ)[:1]
-        syn2 = wn.synsets(token, pos=wn.NOUN)[:1]
-        # we take into account only adj defs
-        if syn1:
-            defs.append(token)
-            def_tokenized = word_tokenize(syn1[0].definition())
-            [defs.append(t[0]) for t in pos_tag(def_tokenized) if t[1] in ['NN', 'JJ']]
-        elif syn2:
+        if cache is not None:
+            words = cache.definition(token)
+        else:
+            words = wordnet_definition(token)
+        if words is not None:
             defs.append(token)
-            def_tokenized = word_tokenize(syn2[0].definition())
-            [defs.append(t[0]) for t in pos_tag(def_tokenized) if t[1] in ['NN', 'JJ']]
+            defs.extend(words)
     # expansion can add some EXCLUDED words back in the query
     defs = set(defs) - set(EXCLUDED)  # removing again
     expanded = ' '.join(defs)
     return expanded
 
 
+def wordnet_definition(token):
+    """
+    This function returns the nouns and adjectives of the first wordnet
+    definition of the token, adjective senses first. Tokens wordnet does not
+    know return None.
+    """
+    # take the first definition for the current word
+    syn1 = wn.synsets(token, pos=wn.ADJ)[:1]
+    syn2 = wn.synsets(token, pos=wn.NOUN)[:1]
+    # we take into account only adj defs
+    synset = syn1 or syn2
+    if not synset:
+        return None
+    def_tokenized = word_tokenize(synset[0].definition())
+    return [t[0] for t in pos_tag(def_tokenized) if t[1] in ['NN', 'JJ']]
+
+
+class ExpansionCache:
+    """
+    This class memoizes wordnet_definition() per lowercased token, so WORDNET
+    queries do not load the WordNet corpus and the pos tagger, nor tag
+    definitions, for words that were looked up before.
+
+    Lookups go to an in-memory LRU first and then to an optional dbm store
+    on disk. The store is filled offline by warm() (see cocktail_query.py
+    --warm-wordnet) and only read by the bot, so any number of bot processes
+    can share it. Definitions looked up at runtime are kept in the LRU only.
+    """
+    def __init__(self, filename=None, maxsize=4096):
+        """
+        INPUT:
+            filename    --  dbm store of definitions, no store if None
+            maxsize --  number of definitions kept in memory
+        """
+        self.filename = filename
+        self.maxsize = maxsize
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lru = OrderedDict()
+        self._store = None
+        self._store_checked = False
+        self._lock = threading.Lock()
+
+    def definition(self, token):
+        """
+        This function returns wordnet_definition(token), from the cache if
+        possible.
+        """
+        key = token.lower()
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return self._lru[key]
+            raw = self._read(key)
+        if raw is None:
+            words = wordnet_definition(key)
+        else:
+            words = json.loads(raw.decode('utf-8'))
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+            self._lru[key] = words
+            if len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+        return words
+
+    def _read(self, key):
+        """
+        This function returns the stored json definition of key or None.
+        It opens the store on first use.
+        """
+        if not self._store_checked:
+            self._store_checked = True
+            if self.filename:
+                try:
+                    self._store = dbm.open(self.filename, 'r')
+                except dbm.error:
+                    self._store = None
+        if self._store is None:
+            return None
+        try:
+            return self._store[key.encode('utf-8')]
+        except KeyError:
+            return None
+
+    def warm(self, tokens):
+        """
+        This function looks up the definitions of all tokens that are not
+        stored yet and adds them to the dbm store. It returns the number of
+        definitions added.
+        """
+        if not self.filename:
+            raise ValueError('ExpansionCache has no store to warm')
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+            self._store = None
+            self._store_checked = False
+        added = 0
+        store = dbm.open(self.filename, 'c')
+        try:
+            for key in sorted(set(token.lower() for token in tokens)):
+                if key.encode('utf-8') in store:
+                    continue
+                words = wordnet_definition(key)
+                store[key.encode('utf-8')] = json.dumps(words).encode('utf-8')
+                added += 1
+        finally:
+            store.close()
+        return added
+
+    def stats(self):
+        """
+        This function returns the cache metrics: the number of memory hits,
+        disk hits and misses (WordNet lookups), the number of definitions in
+        memory and the hit rate of all lookups.
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {'hits': self.hits, 'disk_hits': self.disk_hits,
+                    'misses': self.misses, 'size': len(self._lru),
+                    'hit_rate': ((self.hits + self.disk_hits) / lookups
+                                 if lookups else 0.0)}
+
+
+def vocabulary(docs):
+    """
+    This function returns the set of contentful lowercased words of all
+    fields of the docs, see ExpansionCache.warm().
+    """
+    normalizer = get_normalizer()
+    words = set()
+    for doc in docs.values():
+        for text in doc.values():
+            words.update(tok for tok in normalizer.tokens(text or '')
+                         if tok.isalpha())
+    return words
+
+
 # @profile
-def init_db_vectors(tf_file, idf_file):
+def count_terms(wordsbag):
+    """
+    This function counts the terms of every doc in a single pass and
+    collects the statistics tf-idf needs.
+
+    INPUT:
+        wordsbag    --  normalized dictionary of terms per doc
+    OUTPUT:
+        counts  --  a dict of {doc: Counter of its terms}
+        max_freqs   --  a dict of {doc: freq of its most occurring term}
+        doc_freqs   --  a Counter of {term: number of docs containing it}
+    """
+    counts = {}
+    max_freqs = {}
+    doc_freqs = Counter()
+    for doc, tokens in wordsbag.items():
+        counts[doc] = Counter(tokens)
+        max_freqs[doc] = max(counts[doc].values()) if counts[doc] else 0
+        doc_freqs.update(counts[doc].keys())
+    return counts, max_freqs, doc_freqs
+
+
+def init_db_vectors(wordsbag):
     """
-    This function creates document vectors of tf-idf values as simple dicts
+    This function creates document vectors of tf-idf values as simple dicts.
+    It used to read them from the cocktails.tf and cocktails.idf files, it
+    now computes them from the bags of words, see make_wordsbag.
 
     INPUT:
-        tf_file --  filename with .tf extension
-        idf_file    --  filename with .idf extension
+        wordsbag    --  normalized dictionary of terms per doc
     OUTPUT:
         docvec  --  a dict of {doc: {term: tfidf, ...}}
         invidx  --  a dict of {term: {doc: tfidf, ...}}
         idfdict  --  a dict of {term: idf, ...}
     """
-    # read tf and idf files
-    with open(tf_file, 'r') as rfile:
-        tfdata = rfile.read()
-    with open(idf_file, 'r') as rfile:
-        idfdata = rfile.read()
-    # create tfdict from tf read data
-    tfdict = defaultdict(dict)
-    for line in tfdata.split('\n')[:-1]:
-        doc, term, tf = line.split('\t')
-        tfdict[doc].update({term: float(tf)})
-    # create idfdict from idf read data
-    idfdict = dict((l.split('\t')[0], float(l.split('\t')[1]))
-                   for l in idfdata.split('\n')[:-1])
+    counts, max_freqs, doc_freqs = count_terms(wordsbag)
+    doc_cnt = len(wordsbag)
+    idfdict = dict((term, math.log(doc_cnt/df))
+                   for term, df in doc_freqs.items())
     # create tfidf dict and inverted index dict
     docvec = defaultdict(dict)
     invidx = defaultdict(dict)
-    for doc in tfdict:
-        for term in idfdict:
-            if tfdict[doc].get(term):
-                tfidf = tfdict[doc][term] * idfdict[term]
-                docvec[doc].update({term: tfidf})
-                invidx[term].update({doc: tfidf})  # inverted dict
+    for doc, terms in counts.items():
+        for term, cnt in terms.items():
+            tfidf = cnt/max_freqs[doc] * idfdict[term]
+            docvec[doc][term] = tfidf
+            invidx[term][doc] = tfidf  # inverted dict
     return docvec, invidx, idfdict
 
-# @profile
-def calculate_similarity(docdict, invdict, idfdict, query):
+
+class TfidfMatrix:
     """
-    This function calculates cosine similarity between documents in dvecs and
-    a user query. It then returns the document with highest sim value.
+    This class stores the document tf-idf vectors as a sparse matrix in CSR
+    layout. The rows are terms and the columns are documents (so the matrix
+    is an inverted index), which lets a query touch only the postings of its
+    own terms. Document norms are computed once.
 
-    INPUT:
-        docvec  --  a dict of {doc: {term: tfidf, ...}}
-        invdict  --  a dict of {term: {doc: tfidf, ...}}
-        idfdict  --  a dict of {term: {doc: tfidf, ...}}
-        query   --  user query string
-    OUTPUT:
-        maxsim  --  tuple with sim score and doc id
+    The matrix can be saved to a binary file which load() memory-maps, so
+    several bot processes share its pages instead of parsing it each:
+
+        header  --  magic, format version and the table sizes, see INDEX_HEADER
+        doc-id table    --  int64 offsets + utf-8 bytes of the doc ids
+        vocabulary table    --  int64 offsets + utf-8 bytes of the terms
+        idf --  float32 per term
+        norms   --  float32 per doc
+        indptr  --  int64 per term + 1
+        indices --  int32 per posting (doc ids)
+        data    --  float32 per posting (tf-idf weights)
+    Every section starts at a multiple of 8 bytes.
     """
-    def slow_sim(v1, v2, d):
+    def __init__(self, docs, terms, idf, indptr, indices, data, norms=None):
+        """
+        INPUT:
+            docs    --  document ids, in the order of the matrix columns
+            terms   --  vocabulary, in the order of the matrix rows
+            idf --  array of idf values, one per term
+            indptr, indices, data   --  CSR arrays of the matrix
+            norms   --  array of document norms, computed if omitted
+        """
+        self.docs = list(docs)
+        self.vocab = dict((term, i) for i, term in enumerate(terms))
+        self.idf = idf
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        if norms is None:
+            weights = np.asarray(data, dtype=np.float64)
+            norms = np.sqrt(np.bincount(indices, weights=weights ** 2,
+                                        minlength=len(self.docs)))
+            # same precision as the norms of a loaded index file
+            norms = norms.astype(np.float32)
+        self.norms = norms
+
+    @classmethod
+    def from_counts(cls, counts, docs):
+        """
+        This function builds the matrix straight from the term counts of the
+        docs, with one pass over the counts and no intermediate dicts.
+
+        INPUT:
+            counts  --  a dict of {doc: {term: count, ...}}
+            docs    --  document ids, in the order of the matrix columns
+        OUTPUT:
+            matrix  --  TfidfMatrix
+        """
+        docs = list(docs)
+        doc_freqs = Counter()
+        for doc in docs:
+            doc_freqs.update(counts[doc].keys())
+        terms = sorted(doc_freqs)
+        termids = dict((term, i) for i, term in enumerate(terms))
+        # postings in doc-major order: term id, doc id and tf per posting
+        rows = np.empty(sum(doc_freqs.values()), dtype=np.int64)
+        cols = np.empty(len(rows), dtype=np.int32)
+        tfs = np.empty(len(rows), dtype=np.float64)
+        pos = 0
+        for docid, doc in enumerate(docs):
+            terms_cnt = counts[doc]
+            if not terms_cnt:
+                continue
+            end = pos + len(terms_cnt)
+            rows[pos:end] = [termids[term] for term in terms_cnt]
+            cols[pos:end] = docid
+            tfs[pos:end] = list(terms_cnt.values())
+            tfs[pos:end] /= max(terms_cnt.values())
+            pos = end
+        idf = np.log(len(docs) / np.array([doc_freqs[term] for term in terms],
+                                          dtype=np.float64))
+        # a stable sort keeps the docs of every term in column order
+        order = np.argsort(rows, kind='stable')
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(terms)), out=indptr[1:])
+        return cls(docs, terms,
+                   idf.astype(np.float32),
+                   indptr,
+                   cols[order],
+                   (tfs * idf[rows])[order].astype(np.float32))
+
+    @classmethod
+    def from_index(cls, invidx, idfdict, docs):
         """
-        This function calculates cosine similarity for the given vectors
+        This function builds the matrix from an inverted index.
 
         INPUT:
-            v1  --  first vector of tfidf values
-            v2  --  second vector of tfidf values
-            d   --  document id
+            invidx  --  a dict of {term: {doc: tfidf, ...}}
+            idfdict  --  a dict of {term: idf, ...}
+            docs    --  document ids, in the order of the matrix columns
         OUTPUT:
-            float, d   --  tuple of similarity score, document id
+            matrix  --  TfidfMatrix
         """
-        np.seterr(divide='ignore', invalid='ignore')  # in case of NaN
-        # query norm
-        qnorm = math.sqrt(sum([pow(x, 2) for x in v1]))
-        # doc norm
-        dnorm = math.sqrt(sum([pow(y[1], 2) for y in docdict[d].items()]))
-        return np.dot(v1, v2) / (qnorm * dnorm), d
+        docs = list(docs)
+        docids = dict((doc, i) for i, doc in enumerate(docs))
+        terms = list(idfdict)
+        indptr, indices, data = [0], [], []
+        for term in terms:
+            postings = invidx.get(term, {})
+            indices.extend(docids[doc] for doc in postings)
+            data.extend(postings.values())
+            indptr.append(len(indices))
+        return cls(docs, terms,
+                   np.array([idfdict[term] for term in terms],
+                            dtype=np.float32),
+                   np.array(indptr, dtype=np.int64),
+                   np.array(indices, dtype=np.int32),
+                   np.array(data, dtype=np.float32))
 
+    def save(self, filename):
+        """
+        This function writes the matrix to a binary index file.
+        """
+        terms = sorted(self.vocab, key=self.vocab.get)
+        sections = list(_string_table(self.docs))
+        sections += _string_table(terms)
+        sections += [np.asarray(self.idf, dtype=np.float32),
+                     np.asarray(self.norms, dtype=np.float32),
+                     np.asarray(self.indptr, dtype=np.int64),
+                     np.asarray(self.indices, dtype=np.int32),
+                     np.asarray(self.data, dtype=np.float32)]
+        header = struct.pack(INDEX_HEADER, INDEX_MAGIC, INDEX_VERSION,
+                             len(self.docs), len(terms), len(self.data),
+                             len(sections[1]), len(sections[3]))
+        chunks = [header]
+        pos = len(header)
+        for section in sections:
+            padding = -pos % 8
+            raw = section.tobytes()
+            chunks += [b'\0' * padding, raw]
+            pos += padding + len(raw)
+        atomic_write(filename, chunks)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        This function memory-maps a binary index file written by save().
+        Files of an unknown format raise ValueError.
+        """
+        buf = np.memmap(filename, dtype=np.uint8, mode='r')
+        hsize = struct.calcsize(INDEX_HEADER)
+        if len(buf) < hsize:
+            raise ValueError('truncated index header')
+        magic, version, ndocs, nterms, nnz, docs_size, terms_size = \
+            struct.unpack(INDEX_HEADER, buf[:hsize].tobytes())
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError('unsupported index format version')
+        reader = _SectionReader(buf, hsize)
+        docs = reader.strings(ndocs, docs_size)
+        terms = reader.strings(nterms, terms_size)
+        idf = reader.array(np.float32, nterms)
+        norms = reader.array(np.float32, ndocs)
+        indptr = reader.array(np.int64, nterms + 1)
+        indices = reader.array(np.int32, nnz)
+        data = reader.array(np.float32, nnz)
+        return cls(docs, terms, idf, indptr, indices, data, norms)
+
+    def cosine(self, qtf):
+        """
+        This function calculates cosine similarity between every document and
+        a query with a single sparse matrix-vector product.
+
+        INPUT:
+            qtf --  a dict of {term: query tf, ...}
+        OUTPUT:
+            scores  --  array of similarity scores, one per document
+        """
+        scores = np.zeros(len(self.docs))
+        known = [t for t in qtf if t in self.vocab]
+        if not known:
+            return scores
+        terms = np.array([self.vocab[t] for t in known], dtype=np.int64)
+        qvec = np.array([qtf[t] for t in known]) * self.idf[terms]
+        qnorm = math.sqrt(np.dot(qvec, qvec))
+        # gather the postings of the query terms and scatter them into docs
+        starts = self.indptr[terms]
+        lengths = self.indptr[terms + 1] - starts
+        offsets = lengths.cumsum() - lengths
+        rows = np.repeat(np.arange(len(terms)), lengths)
+        postings = np.repeat(starts - offsets, lengths) + \
+            np.arange(lengths.sum())
+        dots = np.bincount(self.indices[postings],
+                           weights=self.data[postings] * qvec[rows],
+                           minlength=len(self.docs))
+        denom = qnorm * self.norms
+        np.divide(dots, denom, out=scores, where=denom > 0)
+        return scores
+
+
+def _string_table(strings):
+    """
+    This function packs strings into an array of int64 offsets and an array
+    of their concatenated utf-8 bytes.
+    """
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(raw) for raw in encoded])
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+
+class _SectionReader:
+    """
+    This class reads the consecutive, 8-byte aligned sections of a
+    memory-mapped index file without copying them.
+    """
+    def __init__(self, buf, pos):
+        self.buf = buf
+        self.pos = pos
+
+    def array(self, dtype, count):
+        self.pos += -self.pos % 8
+        size = np.dtype(dtype).itemsize * count
+        if self.pos + size > len(self.buf):
+            raise ValueError('truncated index file')
+        section = self.buf[self.pos:self.pos + size].view(dtype)
+        self.pos += size
+        return section
+
+    def strings(self, count, size):
+        offsets = self.array(np.int64, count + 1)
+        raw = self.array(np.uint8, size).tobytes()
+        return [raw[offsets[i]:offsets[i + 1]].decode('utf-8')
+                for i in range(count)]
+
+
+# @profile
+def query_tf(query):
+    """
+    This function normalizes a user query and calculates its term
+    frequencies.
+
+    INPUT:
+        query   --  user query string
+    OUTPUT:
+        qtf --  a dict of {term: query tf, ...}
+    """
     # first, we preprocess query and expand it with synonyms
     # query = expand_with_wordnet(query)
-    # initializing SnowballStemmer from nltk
-    sst = SnowballStemmer('english')
-    # taking stopwords from nltk
-    stop = stopwords.words('english')
-    # we exclude some words that we do not need in the query
-    stop += EXCLUDED
-    # creating translation table to remove punctuation
-    trans = {ord(c): None for c in string.punctuation}
-    # normalizing query
-    sq = [sst.stem(term) for term in query.lower().translate(trans).split()
-          if term not in stop]
-    # handle insufficient info in a query    
+    # normalizing query, we exclude some words that we do not need in it
+    normalizer = get_normalizer()
+    sq = normalizer.stems(query, normalizer.query_stop)
+    # handle insufficient info in a query
     if not sq:
-        print("Nothing, since you're drunk already :D")
-        exit()
+        raise EmptyQueryError(EMPTY_QUERY_REPLY)
 
     # create query vector
     qcnts = Counter(sq)
     maxqt = qcnts.most_common(1)[0][1]
     # calculating tf values for the query, 0.4+(1-0.4) is smoothing with a=0.4
     qtf = dict((q, (0.4+((1-0.4)*qcnts[q])/maxqt)) for q in sq)
-    # fill query vector with tfidf values
-    qvec = [(qtf[t] * idfdict[t]) for t in qtf if t in idfdict]
-    invdocvecs = defaultdict(list)
-    # fill doc vectors with tfidf values only for those terms that are in query
-    [invdocvecs[d].append(invdict[t][d]) for t in qtf for d in invdict[t]]
-    # balancing document vectors with zeros
-    [invdocvecs[d].extend([0 for _ in
-                           range(abs(len(qvec)-len(invdocvecs[d])))])
-     for d in docdict]
-    # find the doc with the highest cos sim
-    max_sim = max(slow_sim(qvec, invdocvecs[doc], doc) for doc in invdocvecs)
-    return max_sim
+    return qtf
+
+
+# @profile
+def calculate_similarity(matrix, query):
+    """
+    This function calculates cosine similarity between the documents of the
+    tf-idf matrix and a user query. It then returns all documents ranked by
+    their sim value.
+
+    INPUT:
+        matrix  --  TfidfMatrix of the documents
+        query   --  user query string
+    OUTPUT:
+        ranked  --  list of (sim score, doc id) tuples, best match first
+    """
+    scores = matrix.cosine(query_tf(query))
+    # stable sort keeps database order among equally scored documents
+    order = np.argsort(-scores, kind='stable')
+    return [(float(scores[i]), matrix.docs[i]) for i in order]
+
+
+def search(query, k=3, min_score=0.0, analyser='TFIDF'):
+    """
+    This function returns the top k (cocktail, score) pairs for a user query,
+    see CocktailIndex.search.
+    """
+    return get_index().search(query, k, min_score, analyser)
+
 
 # @profile
 def process_query(user_query, analyser, verbosity=0):
@@ -320,49 +1099,128 @@ def process_query(user_query, analyser, verbosity=0):
         verbosity   --  number of text blocks shown to user
         analyser  --  specifies which similarity model to use (default wordnet)
     OUTPUT:
-        std.out --  prints the cocktail advice
-    """
-    # initializing database
-    db_file = os.path.join(os.getcwd(), 'cocktails.xml')
-    tf_fpath = os.path.basename(db_file).rsplit('.', 1)[0] + '.tf'
-    idf_fpath = os.path.basename(db_file).rsplit('.', 1)[0] + '.idf'
-    docs_db = init_cocktails_database(db_file, tf_fpath, idf_fpath)
-    # setting default here because aiml returns undetectable empty str ''
-    if analyser == '':
-        analyser = 'TFIDF'  # default analyser
-    if analyser == 'WORDNET':
-        # print('USING WORDNET...')
-        # 1. WORDNET
-        relevant = wordnet_sim(expand_with_wordnet(user_query), docs_db)
-        # relevant = wordnet_sim(user_query, docs_db)
-        # print('RELEVANT:', relevant)
-    elif analyser == 'TFIDF':
-        # print('USING TFIDF...')
-        # 2. TF-IDF
-        # creating document dicts and vectors
-        doc_dic, inv_dic, idf_dic = init_db_vectors(tf_fpath, idf_fpath)
-        # calculating the most relevant document
-        relevant = calculate_similarity(doc_dic, inv_dic, idf_dic, user_query)
-        # print('RELEVANT:', relevant)
-    if verbosity == 1:
-        desc = docs_db[relevant[-1]]['description']
-        ing = docs_db[relevant[-1]]['ingredients']
-        mix = docs_db[relevant[-1]]['mixing']
-        hist = docs_db[relevant[-1]]['history']
-        triv = docs_db[relevant[-1]]['trivia']
-    else:
-        desc = docs_db[relevant[-1]]['description']
-        ing = docs_db[relevant[-1]]['ingredients']
-        mix = docs_db[relevant[-1]]['mixing']
-        hist = ''
-        triv = ''
-    cocktail = relevant[-1]
-    return cocktail, desc, ing, mix, hist, triv
+        cocktail, desc, ing, mix, hist, triv    --  advice tuple
+    """
+    return get_index().query(user_query, analyser, verbosity)
+
+
+def _self_test():
+    """
+    This function checks that the binary index file reads back the matrix
+    it was saved from, and that a CocktailIndex only loads the index file
+    while its manifest matches the database, and rebuilds it otherwise.
+    It works on a copy of cocktails.xml in a temporary directory.
+    """
+    import shutil
+    tmpdir = tempfile.mkdtemp()
+    try:
+        dbfile = os.path.join(tmpdir, 'cocktails.xml')
+        index_file = os.path.join(tmpdir, 'cocktails.idx')
+        shutil.copy(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'cocktails.xml'), dbfile)
+        queries = ['something sweet with rum', 'bitter and strong', 'mint']
+
+        def same_matrix(one, other):
+            arrays = ('idf', 'norms', 'indptr', 'indices', 'data')
+            return (one.docs == other.docs and one.vocab == other.vocab and
+                    all(np.array_equal(getattr(one, name),
+                                       getattr(other, name))
+                        for name in arrays) and
+                    all(np.array_equal(one.cosine(query_tf(q)),
+                                       other.cosine(query_tf(q)))
+                        for q in queries))
+
+        # round trip of the binary index file
+        built = CocktailIndex(dbfile, index_file)
+        assert built.counts is not None, 'first start did not build'
+        loaded = TfidfMatrix.load(index_file)
+        assert same_matrix(built.matrix, loaded), 'index file differs'
+        print('Test #1 PASSED: binary index round trip')
+
+        # a matching manifest loads the index file
+        warm = CocktailIndex(dbfile, index_file)
+        assert warm.counts is None, 'matching manifest rebuilt'
+        assert same_matrix(built.matrix, warm.matrix), 'loaded index differs'
+        print('Test #2 PASSED: matching manifest loads the index')
+
+        # a manifest of another database rebuilds the index
+        manifest = read_manifest(index_file + '.manifest')
+        manifest['source'].update(mtime=0, sha1='0' * 40)
+        write_manifest(index_file + '.manifest', manifest)
+        stale = CocktailIndex(dbfile, index_file)
+        assert stale.counts is not None, 'stale manifest did not rebuild'
+        assert same_matrix(built.matrix, stale.matrix), 'rebuild differs'
+        manifest = read_manifest(index_file + '.manifest')
+        assert manifest['source'] == source_info(dbfile), 'manifest not new'
+        print('Test #3 PASSED: stale manifest rebuilds the index')
+
+        # a manifest of an older index version rebuilds the index
+        manifest['version'] = INDEX_VERSION - 1
+        write_manifest(index_file + '.manifest', manifest)
+        assert CocktailIndex(dbfile, index_file).counts is not None, \
+            'old manifest version did not rebuild'
+        print('Test #4 PASSED: old manifest version rebuilds the index')
+
+        # an unreadable index file rebuilds it, even with a good manifest
+        with open(index_file, 'r+b') as wfile:
+            wfile.truncate(10)
+        broken = CocktailIndex(dbfile, index_file)
+        assert broken.counts is not None, 'truncated index did not rebuild'
+        assert same_matrix(built.matrix, TfidfMatrix.load(index_file)), \
+            'rebuilt index file differs'
+        print('Test #5 PASSED: truncated index file is rebuilt')
+
+        # an edited database rebuilds the index like a first start does
+        with open(dbfile, 'r', encoding='utf-8') as rfile:
+            text = rfile.read()
+        with open(dbfile, 'w', encoding='utf-8') as wfile:
+            wfile.write(text.replace('<description>',
+                                     '<description>Mint julep! ', 1))
+        edited = CocktailIndex(dbfile, index_file)
+        assert edited.counts is not None, 'edited database did not rebuild'
+        assert same_matrix(edited.matrix, CocktailIndex(dbfile).matrix), \
+            'incremental rebuild differs from a full one'
+        assert not same_matrix(built.matrix, edited.matrix), 'edit ignored'
+        print('Test #6 PASSED: edited database rebuilds the index')
+    finally:
+        shutil.rmtree(tmpdir)
 
 
 EXCLUDED = ['I', 'want', 'something', 'this', 'it', 'like', 'love', 'drink',
             'color']
 
+EMPTY_QUERY_REPLY = "Nothing, since you're drunk already :D"
+
+# words people often describe their drinks with, the wordnet definitions of
+# these are stored along with the vocabulary of the database
+QUERY_WORDS = ['bitter', 'cold', 'creamy', 'dry', 'fresh', 'fruity', 'hot',
+               'light', 'party', 'refreshing', 'salty', 'smooth', 'sour',
+               'spicy', 'strong', 'summer', 'sweet', 'tropical', 'warm',
+               'weak', 'winter']
+
+# binary index file format, see TfidfMatrix
+INDEX_MAGIC = b'CIDX'
+INDEX_VERSION = 1
+INDEX_HEADER = '<4sI5Q'
+
+# memoized stems of the shared Normalizer, see get_normalizer()
+STEM_CACHE_SIZE = 65536
+_NORMALIZER = None
+
+# the fields of a cocktail the queries return, see CocktailIndex.validate()
+DOC_FIELDS = ('description', 'ingredients', 'mixing', 'history', 'trivia')
+
+# process-wide CocktailIndex instances, see get_index()
+_INDEXES = {}
+_INDEXES_LOCK = threading.Lock()
+# text blocks wordnet_sim compares the query with and their score weights,
+# some blocks are more important than the others
+WORDNET_BLOCKS = (('description', 2.0), ('history', 0.5), ('trivia', 0.5),
+                  ('comments', 1.0))
+
 if __name__ == '__main__':
-    # define database file path below, db file should be in xml format
-    process_query(sys.argv[1], sys.argv[2], sys.argv[-1])
+    if sys.argv[1:] == ['--self-test']:
+        _self_test()
+    else:
+        # define database file path below, db file should be in xml format
+        process_query(sys.argv[1], sys.argv[2], sys.argv[-1])
@@ -4,12 +4,16 @@ This script reads cocktail database and retrieves various information from it
 """
 import argparse
 import ast
-import random
+import asyncio
+import contextlib
+import io
 import re
 import os
 import sys
+import traceback
 sys.path.append(os.path.join(os.getcwd(), r'brains'))
-from cocktail_ir import init_cocktails_database, process_query
+from cocktail_ir import (get_index, reload_index, vocabulary, EmptyQueryError,
+                         QUERY_WORDS)
 
 
 def prettify_lines(message):
@@ -25,16 +29,12 @@ def prettify_lines(message):
     return [line.lstrip(' ') for line in message.split('\n') if line]
 
 
-def tell_trivia(db):
+def tell_trivia(index):
     """
     This function returns a random trivia block for one of the cocktails.
     """
-    # retrieve all trivia blocks
-    trivias = dict((key, val['trivia']) for key, val in db.items() if val)
-    choice = random.choice(list(trivias.keys()))
-    print('"{0}".'.format(choice))
-    print(prettify(trivias[choice]))
-    print('\n')
+    choice, trivia = index.trivia()
+    return '"{0}".\n{1}\n\n\n'.format(choice, prettify(trivia))
 
 
 def prettify(description):
@@ -52,63 +52,200 @@ def prettify(description):
     return single_spaces.sub(' ', description)
 
 
-def make_query(db, argz):
+def make_query(index, query, analyser):
     """
-    This function retrieves the required info from the db
+    This function retrieves the cocktail that matches the query best and
+    formats the advice.
 
     INPUT:
-        db  --  database full path
-        que --  string that represents a tuple or a list
-    """
-    if argz.query:
-        results_tuple = process_query(argz.query, argz.analyser)
-        cocktail, desc, ing, mix, hist, triv = results_tuple
-        # pretty print the advise
-        print('"{0}"'.format(cocktail))
-        print(prettify(desc))
-        print(ing)
-        print(mix)
-        if hist:
-            print('HISTORY:')
-            print(prettify(hist))
-        if triv:
-            print('TRIVIA:')
-            print(prettify(triv))
-        print('\n')
+        index   --  cocktail_ir.CocktailIndex to query
+        query   --  user query string
+        analyser    --  similarity model to use: TFIDF or WORDNET
+    OUTPUT:
+        advice  --  pretty advice string
+    """
+    try:
+        results_tuple = index.query(query, analyser)
+    except EmptyQueryError as err:
+        return '{0}\n'.format(err)
+    cocktail, desc, ing, mix, hist, triv = results_tuple
+    # pretty print the advise, the fields missing from the database are
+    # None, which is printed as such
+    lines = ['"{0}"'.format(cocktail), prettify(desc), str(ing), str(mix)]
+    if hist:
+        lines += ['HISTORY:', prettify(hist)]
+    if triv:
+        lines += ['TRIVIA:', prettify(triv)]
+    lines.append('\n')
+    return '\n'.join(lines) + '\n'
+
+
+class CocktailEngine:
+    """
+    This class is a long-lived, in-process counterpart of the command line
+    interface below. It works on the process-wide cocktail_ir index and every
+    method returns exactly what the corresponding command line flag prints.
+    """
+    def __init__(self, dbfile=None):
+        self.index = get_index(dbfile)
+
+    def reload(self):
+        """
+        This function rebuilds the index from the current database file and
+        swaps it in. Queries under way finish on the old index. It returns
+        True if the new index is in use, or False if the database could not
+        be read or is invalid, in which case the old index is kept.
+        """
+        try:
+            self.index = reload_index(self.index.dbfile)
+        except Exception:
+            # a broken database must not take the whole bot down
+            traceback.print_exc()
+            return False
+        return True
+
+    def query(self, query, analyser='TFIDF'):
+        """-q, --query"""
+        return make_query(self.index, query, analyser)
+
+    def suggest(self, query, analyser='TFIDF', k=3):
+        """-q, --query with -k, --top"""
+        try:
+            found = self.index.search(query, k, analyser=analyser)
+        except EmptyQueryError as err:
+            return '{0}\n'.format(err)
+        if not found:
+            return "Nothing comes to mind, sorry.\n"
+        names = ['"{0}"'.format(cocktail) for cocktail, _ in found]
+        return 'You might like one of these: {0}\n'.format(', '.join(names))
+
+    def trivia(self):
+        """-t, --trivia"""
+        return tell_trivia(self.index)
+
+    def describe(self, cocktail):
+        """-c, --cocktail"""
+        try:
+            desc, ing = self.index.describe(cocktail)
+            return '{0}\n{1}\n'.format(prettify(desc), prettify(ing))
+        except KeyError:
+            return "Well, I don't know anything about it. Sorry.\n"
+
+    def field(self, cocktail, field):
+        """-d, --direct"""
+        try:
+            return '{0}\n'.format(prettify(self.index.field(cocktail, field)))
+        except KeyError:
+            return "Are you sure I know anything about this?\n"
+
+    def cocktails(self):
+        """-cocktails, --cocktails"""
+        return ', '.join(self.index.docs.keys()) + '\n'
+
+    def howmany(self):
+        """-howmany, --howmany"""
+        return str(len(self.index.docs))
+
+    def warm_wordnet(self):
+        """-w, --warm-wordnet"""
+        words = vocabulary(self.index.docs) | set(QUERY_WORDS)
+        added = self.index.expansions.warm(words)
+        return 'Stored {0} new wordnet definitions.\n'.format(added)
+
+    def process_element(self, kernel, contents, attr, session):
+        """
+        This function answers a <cocktail op="..."> AIML element. The element
+        contents are the query for op="query" and op="search" and the
+        cocktail name for op="describe" and op="field". If no analyser
+        attribute is given, the "analyser" predicate of the session is used.
+        """
+        op = attr.get('op')
+        analyser = attr.get('analyser') or kernel.getPredicate('analyser',
+                                                               session)
+        try:
+            if op == 'query':
+                return self.query(contents, analyser)
+            elif op == 'search':
+                return self.suggest(contents, analyser, int(attr.get('k', 3)))
+            elif op == 'trivia':
+                return self.trivia()
+            elif op == 'describe':
+                return self.describe(contents)
+            elif op == 'field':
+                return self.field(contents, attr['field'])
+            elif op == 'list':
+                return self.cocktails()
+            elif op == 'count':
+                return self.howmany()
+            sys.stderr.write('Unknown cocktail op: {0}\n'.format(op))
+        except Exception:
+            # a failing query must not take the whole bot down, just like a
+            # failing cocktail_query.py process did not
+            traceback.print_exc()
+        return ''
+
+    async def process_element_async(self, kernel, contents, attr, session):
+        """
+        This function answers a <cocktail> AIML element like process_element,
+        in a worker thread, so that the event loop running
+        Kernel.respondAsync keeps serving other sessions meanwhile.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.process_element, kernel,
+                                          contents, attr, session)
+
+    def register(self, kernel, name='cocktail', asynchronous=False):
+        """
+        This function registers the <cocktail> element with an aiml Kernel.
+        It has to be called before the AIML files are learned. Register it
+        asynchronous when the Kernel is driven by respondAsync.
+        """
+        if asynchronous:
+            kernel.addAsyncElementProcessor(
+                name,
+                lambda contents, attr, session:
+                    self.process_element_async(kernel, contents, attr,
+                                               session),
+                required=['op'], optional=['analyser', 'field', 'k'])
+            return
+        kernel.addElementProcessor(
+            name,
+            lambda contents, attr, session:
+                self.process_element(kernel, contents, attr, session),
+            required=['op'], optional=['analyser', 'field', 'k'])
 
 
 def connect_db(argz):
     """
     This function uses cocktail_ir xml parser to get the db dict object
     """
-    data = init_cocktails_database(DB_FILE)
+    engine = CocktailEngine(DB_FILE)
     if argz.cocktails:
-        print(', '.join(data.keys()))
+        print(engine.cocktails(), end="")
     elif argz.howmany:
-        print(len(data), end="")
+        print(engine.howmany(), end="")
     elif argz.direct:
         dlist = ast.literal_eval(argz.direct)
-        try:
-            print(prettify(data[dlist[0]][dlist[1]]))
-        except KeyError:
-            print("Are you sure I know anything about this?")
+        print(engine.field(dlist[0], dlist[1]), end="")
     elif argz.cocktail:
-        try:
-            print(prettify(data[argz.cocktail]['description']))
-            print(prettify(data[argz.cocktail]['ingredients']))
-        except KeyError:
-            print("Well, I don't know anything about it. Sorry.")
+        print(engine.describe(argz.cocktail), end="")
     elif argz.trivia:
-        tell_trivia(data)
-    else:
-        make_query(data, argz)
+        print(engine.trivia(), end="")
+    elif argz.warm_wordnet:
+        print(engine.warm_wordnet(), end="")
+    elif argz.query and argz.top:
+        print(engine.suggest(argz.query, argz.analyser, argz.top), end="")
+    elif argz.query:
+        print(engine.query(argz.query, argz.analyser), end="")
 
 
 DB_FILE = os.path.join(os.getcwd(), 'cocktails.xml')
 
 
-if __name__ == '__main__':
-    # DB_FILE = os.path.join(os.getcwd(), 'cocktails.xml')
+def make_parser():
+    """
+    This function returns the command line parser of this script.
+    """
     prs = argparse.ArgumentParser()
     prs.add_argument('-q', '--query',
                      help='Specify you query which shall be analysed for\
@@ -131,9 +268,86 @@ if __name__ == '__main__':
     prs.add_argument('-howmany', '--howmany', action='store_true',
                      help='Return number of cocktails currently available.',
                      required=False)
+    prs.add_argument('-k', '--top', type=int,
+                     help='Return the names of the k cocktails that match the\
+                     query best instead of a single recipe.',
+                     required=False)
+    prs.add_argument('-w', '--warm-wordnet', action='store_true',
+                     help='Store the wordnet definitions of all words of the\
+                     database, so WORDNET queries do not have to look them up.',
+                     required=False)
     prs.add_argument('-a', '--analyser', default='TFIDF',
                      help='Specify which similarity analyzer to use: TFIDF or\
                      WORDNET',
                      required=False)
-    arguments = prs.parse_args()
-    connect_db(arguments)
+    return prs
+
+
+def run_command(args):
+    """
+    This function runs this script with the command line arguments args in
+    the current process and returns what it prints. It is the entry point of
+    the aiml PythonWorkerPool workers that answer <system> commands running
+    this script.
+    """
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        connect_db(make_parser().parse_args(args))
+    return out.getvalue()
+
+
+def warm_worker():
+    """
+    This function loads the index of the database, so that the first command
+    a worker runs does not have to.
+    """
+    get_index(DB_FILE)
+
+
+def worker_pool(workers=2, timeout=10.0, max_output=1 << 20):
+    """
+    This function returns an aiml PythonWorkerPool whose workers answer the
+    "python3 cocktail_query.py ..." commands of <system> elements with the
+    database already loaded. Pass it to Kernel.setSystemExecutor.
+    """
+    from aiml.SystemExecutor import PythonWorkerPool
+    return PythonWorkerPool('cocktail_query.py', 'cocktail_query',
+                            'run_command', 'warm_worker', workers=workers,
+                            timeout=timeout, maxOutput=max_output)
+
+
+def _self_test():
+    """
+    This function checks that make_query returns the advice the command line
+    used to print, also for the cocktails whose ingredients or mixing are
+    missing from the database.
+    """
+    index = get_index(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   'cocktails.xml'))
+    tested = 0
+    for name, doc in sorted(index.docs.items()):
+        if not doc or (doc['ingredients'] and doc['mixing']):
+            continue
+        if index.query(name.lower(), 'TFIDF')[0] != name:
+            continue
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print('"{0}"'.format(name))
+            print(prettify(doc['description']))
+            print(doc['ingredients'])
+            print(doc['mixing'])
+            print('\n')
+        advice = make_query(index, name.lower(), 'TFIDF')
+        assert advice == out.getvalue(), 'advice on {0}: {1!r}'.format(
+            name, advice)
+        tested += 1
+    assert tested, 'no cocktail with missing fields was found'
+    print('Test #1 PASSED: advice on {0} cocktails with missing '
+          'fields'.format(tested))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--self-test']:
+        _self_test()
+    else:
+        connect_db(make_parser().parse_args())
@@ -7,8 +7,12 @@ Cocktail advisor chatbot.
 import sys
 import os
 sys.path.append(os.path.join(os.getcwd(), r'pyaiml/pyaiml3-master'))
+sys.path.append(os.path.join(os.getcwd(), r'brains'))
 import aiml
+import argparse
 import json
+from aiml.FileWatcher import FileWatcher
+from cocktail_query import CocktailEngine
 
 
 class Chatbotty_helper:
@@ -28,8 +32,29 @@ class Chatbotty_helper:
 class Chatbotty:
     def __init__(self):
         self.chatbot = aiml.Kernel()
+        # <cocktail> elements are answered in-process by a single engine
+        self.cocktails = CocktailEngine()
+        self.cocktails.register(self.chatbot)
+        self.watchers = []
     def include(self, aiml_file):
         self.chatbot.learn(aiml_file)
+    def reload(self):
+        """
+        Reload the AIML files and the cocktail database without losing the
+        sessions. Whatever fails to load keeps its old version.
+        """
+        brain = self.chatbot.reload()
+        cocktails = self.cocktails.reload()
+        return brain and cocktails
+    def watch(self, interval=1.0):
+        """
+        Reload the AIML files and the cocktail database whenever they change.
+        """
+        self.watchers.append(self.chatbot.watch(interval))
+        watcher = FileWatcher([self.cocktails.index.dbfile],
+                              self.cocktails.reload, interval)
+        watcher.start()
+        self.watchers.append(watcher)
     def entertain(self, user_input):
         reply = ''.join(['\033[34m', self.chatbot.respond(user_input), '\033[00m'])
         if reply == '\x1b[34mbye\x1b[00m':
@@ -38,13 +63,16 @@ class Chatbotty:
             print(reply)
 
 
-def wake_the_bot():
+def wake_the_bot(watch=False):
     """
-    This function is a bot chat session initializer.
+    This function is a bot chat session initializer. If watch is True, the
+    bot reloads its AIML files and cocktail database whenever they change.
     """
     os.chdir('brains')
     bot = Chatbotty()
     bot.include('cocktail_brains.aiml')
+    if watch:
+        bot.watch()
     helpy = Chatbotty_helper('small_brains.json')
     helpy.sayhi()
     while True:
@@ -52,4 +80,8 @@ def wake_the_bot():
         bot.entertain(master)
 
 if __name__ == '__main__':
-    wake_the_bot()
+    prs = argparse.ArgumentParser(description='Cocktail advisor chatbot.')
+    prs.add_argument('-w', '--watch', action='store_true',
+                     help='Reload the AIML files and the cocktail database\
+                     whenever they change.')
+    wake_the_bot(prs.parse_args().watch)
@@ -0,0 +1,379 @@
+# This module implements a compiled form of the PatternMgr node tree.
+# It finds exactly the same templates as PatternMgr._match(), but without
+# recursion, list slicing or retrying the same sub-match over and over.
+#
+# A compiled matcher can be saved as a brain snapshot, whose arrays are
+# memory-mapped when it is loaded again, and whose templates are only
+# unmarshalled once they are matched.
+
+from array import array
+from bisect import bisect_left
+import marshal
+import mmap
+import struct
+import sys
+
+# the first bytes of a snapshot, and the version of its format
+SNAPSHOT_MAGIC = b"PYAIMLSN"
+SNAPSHOT_VERSION = 1
+
+class CompiledMatcher:
+	"""A read-only, flattened copy of a PatternMgr node tree.
+
+	Every node of the tree gets an integer id.  The _UNDERSCORE, _STAR,
+	_BOT_NAME, _THAT and _TOPIC edges of all nodes are stored in one
+	array each, indexed by node id (-1 means no edge), and the templates
+	in a list.  Pattern words are interned to integers, so the ordinary
+	edges are a single dict keyed by node id * vocabulary size + word id.
+	A matcher loaded from a snapshot keeps the keys in a sorted array
+	instead.
+
+	Searching is an iterative depth-first search which tries the edges of
+	a node in the order of the AIML precedence rules (_ > word > BOT_NAME
+	> *), exactly like PatternMgr._match() does.  A (node, position) state
+	that failed once is remembered and never searched again, which keeps
+	star-heavy patterns from taking exponential time.
+
+	"""
+	def __init__(self, root, keys):
+		"""Compile the node tree starting at root.  The keys argument
+		is the PatternMgr class, whose special dictionary keys are used to
+		tell edges apart.
+
+		"""
+		self._keys = keys
+		# intern the words of all patterns
+		self._vocab = {}
+		stack = [root]
+		while stack:
+			node = stack.pop()
+			for key, child in node.items():
+				if key == keys._TEMPLATE:
+					continue
+				if isinstance(key, str) and key not in self._vocab:
+					self._vocab[key] = len(self._vocab)
+				stack.append(child)
+		self._vocabSize = max(len(self._vocab), 1)
+
+		# number the nodes, breadth first.  A node knows which part of
+		# the input it is matched against: 0 = pattern, 1 = that, 2 = topic.
+		self._underscore = array('l')
+		self._star = array('l')
+		self._botName = array('l')
+		self._that = array('l')
+		self._topic = array('l')
+		self._phase = array('b')
+		self._templates = []
+		self._edges = {}
+		nodes = [(root, 0)]
+		for (node, phase) in nodes:
+			nodeId = len(self._templates)
+			self._phase.append(phase)
+			self._templates.append(node.get(keys._TEMPLATE))
+			for (key, arr, childPhase) in ((keys._UNDERSCORE, self._underscore, phase),
+										   (keys._STAR, self._star, phase),
+										   (keys._BOT_NAME, self._botName, phase),
+										   (keys._THAT, self._that, 1),
+										   (keys._TOPIC, self._topic, 2)):
+				if key in node:
+					arr.append(len(nodes))
+					nodes.append((node[key], childPhase))
+				else:
+					arr.append(-1)
+			for key, child in node.items():
+				if isinstance(key, str):
+					self._edges[nodeId * self._vocabSize + self._vocab[key]] = len(nodes)
+					nodes.append((child, phase))
+		# nodes with a wildcard edge can go on with any word
+		self._wild = array('b', [self._underscore[i] >= 0 or self._star[i] >= 0
+								 for i in range(len(self._templates))])
+
+	def numNodes(self):
+		"""Return the number of nodes of the compiled tree."""
+		return len(self._templates)
+
+	def templates(self):
+		"""Return a list of all templates."""
+		templates = (self._templates[i] for i in range(len(self._templates)))
+		return [t for t in templates if t is not None]
+
+	def tree(self):
+		"""Return a PatternMgr node tree equivalent to this matcher."""
+		keys = self._keys
+		words = sorted(self._vocab, key = self._vocab.get)
+		nodes = [{} for i in range(len(self._templates))]
+		for (key, arr) in ((keys._UNDERSCORE, self._underscore),
+						   (keys._STAR, self._star),
+						   (keys._BOT_NAME, self._botName),
+						   (keys._THAT, self._that),
+						   (keys._TOPIC, self._topic)):
+			for i in range(len(nodes)):
+				if arr[i] >= 0:
+					nodes[i][key] = nodes[arr[i]]
+		for (key, child) in self._edges.items():
+			nodeId, wordId = divmod(key, self._vocabSize)
+			nodes[nodeId][words[wordId]] = nodes[child]
+		for i in range(len(nodes)):
+			template = self._templates[i]
+			if template is not None:
+				nodes[i][keys._TEMPLATE] = template
+		return nodes[0]
+
+	def save(self, outFile, info):
+		"""Write this matcher to the binary file outFile as a brain
+		snapshot.  info is a dictionary of marshallable values stored
+		along with it, which load() returns.
+
+		The snapshot starts with SNAPSHOT_MAGIC, the format version and
+		the size of a marshalled header, followed by the header and the
+		sections it lists: the words of the patterns, an array for every
+		kind of special edge, the ordinary edges as sorted keys and the
+		children they lead to, and the marshalled templates with their
+		offsets.  Every section starts at a multiple of 8 bytes.
+
+		"""
+		edgeKeys = sorted(self._edges.keys())
+		blobs = []
+		offsets = array('q')
+		pos = 0
+		for i in range(len(self._templates)):
+			template = self._templates[i]
+			if template is None:
+				offsets.append(-1)
+			else:
+				blob = marshal.dumps(template)
+				blobs.append(blob)
+				offsets.append(pos)
+				pos += len(blob)
+		sections = [
+			("words", marshal.dumps(sorted(self._vocab, key = self._vocab.get))),
+			("underscore", array('i', self._underscore).tobytes()),
+			("star", array('i', self._star).tobytes()),
+			("botName", array('i', self._botName).tobytes()),
+			("that", array('i', self._that).tobytes()),
+			("topic", array('i', self._topic).tobytes()),
+			("phase", array('b', self._phase).tobytes()),
+			("wild", array('b', self._wild).tobytes()),
+			("edgeKeys", array('q', edgeKeys).tobytes()),
+			("edgeChildren", array('i', [self._edges.get(k) for k in edgeKeys]).tobytes()),
+			("templateOffsets", offsets.tobytes()),
+			("templates", b"".join(blobs)),
+		]
+		layout = {}
+		pos = 0
+		for (name, data) in sections:
+			layout[name] = (pos, len(data))
+			pos += len(data) + (-len(data) % 8)
+		header = marshal.dumps({
+			"info": info,
+			"byteorder": sys.byteorder,
+			"vocabSize": self._vocabSize,
+			"sections": layout,
+		})
+		header += b"\0" * (-len(header) % 8)
+		outFile.write(SNAPSHOT_MAGIC + struct.pack("<II", SNAPSHOT_VERSION, len(header)) + header)
+		for (name, data) in sections:
+			outFile.write(data + b"\0" * (-len(data) % 8))
+
+	@staticmethod
+	def isSnapshot(inFile):
+		"""Return True if the binary file inFile, positioned at its
+		start, is a brain snapshot.  The position is left unchanged.
+
+		"""
+		pos = inFile.tell()
+		magic = inFile.read(len(SNAPSHOT_MAGIC))
+		inFile.seek(pos)
+		return magic == SNAPSHOT_MAGIC
+
+	@staticmethod
+	def load(inFile, keys):
+		"""Memory-map the brain snapshot in the binary file inFile, and
+		return a tuple (matcher, info) of the CompiledMatcher in it and
+		the info dictionary it was saved with.  The keys argument is
+		the PatternMgr class, like for the constructor.
+
+		The arrays of the matcher are read straight from the mapped
+		file, so processes loading the same snapshot share them.
+
+		"""
+		data = mmap.mmap(inFile.fileno(), 0, access = mmap.ACCESS_READ)
+		start = len(SNAPSHOT_MAGIC) + 8
+		if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+			raise ValueError("not a brain snapshot")
+		version, headerSize = struct.unpack("<II", data[len(SNAPSHOT_MAGIC):start])
+		if version != SNAPSHOT_VERSION:
+			raise ValueError("unsupported brain snapshot version %d" % version)
+		header = marshal.loads(data[start:start + headerSize])
+		if header["byteorder"] != sys.byteorder:
+			raise ValueError("brain snapshot was saved with a different byte order")
+		view = memoryview(data)
+		base = start + headerSize
+		def section(name, typecode = None):
+			offset, length = header["sections"][name]
+			part = view[base + offset:base + offset + length]
+			if typecode is None:
+				return part
+			return part.cast(typecode)
+
+		matcher = CompiledMatcher.__new__(CompiledMatcher)
+		matcher._keys = keys
+		words = marshal.loads(section("words"))
+		matcher._vocab = dict(zip(words, range(len(words))))
+		matcher._vocabSize = header["vocabSize"]
+		matcher._underscore = section("underscore", 'i')
+		matcher._star = section("star", 'i')
+		matcher._botName = section("botName", 'i')
+		matcher._that = section("that", 'i')
+		matcher._topic = section("topic", 'i')
+		matcher._phase = section("phase", 'b')
+		matcher._wild = section("wild", 'b')
+		matcher._edges = _SortedEdges(section("edgeKeys", 'q'), section("edgeChildren", 'i'))
+		matcher._templates = _LazyTemplates(section("templateOffsets", 'q'), section("templates"))
+		return matcher, header["info"]
+
+	def match(self, words, thatWords, topicWords, botName):
+		"""Return a tuple (pat, tem), exactly like PatternMgr._match()
+		called on the root of the compiled tree.
+
+		"""
+		tokens = list(words) + list(thatWords) + list(topicWords)
+		vocab = self._vocab
+		ids = [vocab.get(w, -1) for w in tokens]
+		# end position of the input of every phase
+		ends = (len(words), len(words) + len(thatWords), len(tokens))
+		numPos = len(tokens) + 1
+		failed = set()
+		underscore = self._underscore
+		star = self._star
+		botNames = self._botName
+		edges = self._edges
+		vocabSize = self._vocabSize
+		phases = self._phase
+		templates = self._templates
+		wild = self._wild
+		keys = self._keys
+		UNDERSCORE, WORD, BOT_NAME, STAR, DONE = 0, 1, 2, 3, 4
+
+		# a frame is [node, position, next edge kind to try, words eaten
+		# by the current wildcard, path key].  Every turn of the loop
+		# either pushes the next viable child of the top frame or pops it.
+		stack = [[0, 0, UNDERSCORE, 0, None]]
+		while stack:
+			frame = stack[-1]
+			node, pos, kind = frame[0], frame[1], frame[2]
+			end = ends[phases[node]]
+			if pos == end:
+				# out of words: try the that or topic part of the input,
+				# then the template of this node.
+				if kind == UNDERSCORE:
+					frame[2] = DONE
+					phase = phases[node]
+					child = -1
+					if phase == 0 and ends[0] < ends[1]:
+						child, key = self._that[node], keys._THAT
+					elif phase < 2 and ends[1] < ends[2]:
+						child, key = self._topic[node], keys._TOPIC
+					if child >= 0 and child * numPos + pos not in failed:
+						stack.append([child, pos, UNDERSCORE, 0, key])
+						continue
+				if templates[node] is not None:
+					return ([(stack[i][4], stack[i][1] - stack[i-1][1]) for i in range(1, len(stack))],
+							templates[node])
+				failed.add(node * numPos + pos)
+				stack.pop()
+				continue
+			while kind != DONE:
+				if kind == UNDERSCORE or kind == STAR:
+					child = underscore[node] if kind == UNDERSCORE else star[node]
+					split = frame[3]
+					# the wildcard eats words pos .. nextPos-1.  Skip the
+					# splits whose next word can't be matched by the child.
+					while child >= 0 and split < end - pos:
+						split += 1
+						nextPos = pos + split
+						if nextPos < end and not wild[child] and \
+						   (ids[nextPos] < 0 or child * vocabSize + ids[nextPos] not in edges) and \
+						   not (botNames[child] >= 0 and tokens[nextPos] == botName):
+							continue
+						if child * numPos + nextPos not in failed:
+							break
+					else:
+						child = -1
+					if child >= 0:
+						frame[2], frame[3] = kind, split
+						key = keys._UNDERSCORE if kind == UNDERSCORE else keys._STAR
+						break
+					frame[3] = 0
+				elif kind == WORD:
+					child = edges.get(node * vocabSize + ids[pos], -1) if ids[pos] >= 0 else -1
+					if child >= 0 and child * numPos + pos + 1 not in failed:
+						frame[2] = BOT_NAME
+						key, nextPos = tokens[pos], pos + 1
+						break
+				else:
+					child = botNames[node]
+					if child >= 0 and tokens[pos] == botName and \
+					   child * numPos + pos + 1 not in failed:
+						frame[2] = STAR
+						key, nextPos = tokens[pos], pos + 1
+						break
+				kind += 1
+			if kind == DONE:
+				failed.add(node * numPos + pos)
+				stack.pop()
+			else:
+				stack.append([child, nextPos, UNDERSCORE, 0, key])
+		return (None, None)
+
+
+class _SortedEdges:
+	"""The ordinary edges of a loaded snapshot: a read-only mapping
+	from the sorted keys to the children beside them, looked up by
+	binary search.
+
+	"""
+	def __init__(self, keys, children):
+		self._keys = keys
+		self._children = children
+
+	def get(self, key, default = None):
+		i = bisect_left(self._keys, key)
+		if i < len(self._keys) and self._keys[i] == key:
+			return self._children[i]
+		return default
+
+	def __contains__(self, key):
+		return self.get(key) is not None
+
+	def keys(self):
+		return self._keys
+
+	def items(self):
+		return zip(self._keys, self._children)
+
+
+class _LazyTemplates:
+	"""The templates of a loaded snapshot, indexed by node id like the
+	template list of a CompiledMatcher.  A template is unmarshalled the
+	first time it is asked for, and the same object is returned from
+	then on.
+
+	"""
+	def __init__(self, offsets, data):
+		self._offsets = offsets
+		self._data = data
+		self._loaded = {}
+
+	def __len__(self):
+		return len(self._offsets)
+
+	def __getitem__(self, nodeId):
+		try:
+			return self._loaded[nodeId]
+		except KeyError:
+			offset = self._offsets[nodeId]
+			if offset < 0:
+				return None
+			# threads racing to load a template all get the same object
+			return self._loaded.setdefault(nodeId, marshal.loads(self._data[offset:]))
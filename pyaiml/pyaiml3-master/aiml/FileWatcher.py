@@ -0,0 +1,98 @@
+"""This file contains the FileWatcher, which calls a function whenever
+one of a set of files changes.  See Kernel.watch().
+
+The watcher polls the size and modification time of the files from a
+daemon thread, which needs nothing beyond the standard library and works
+the same on every platform.  The files are given as names or glob
+patterns, so that files added later are noticed as well.
+
+"""
+
+import glob
+import os
+import sys
+import threading
+import traceback
+
+class FileWatcher:
+    """Call a function whenever one of a set of files changes, is added
+    or is removed.
+
+    A change is only reported once the files have stayed the same for a
+    whole interval, so that a file which is still being written, or an
+    editor saving several files, triggers a single call.
+
+    """
+    def __init__(self, patterns, callback, interval = 1.0):
+        """patterns is a list of file names or glob patterns, or a
+        function returning one, which is called on every poll.  callback
+        is called without arguments, from the thread of the watcher.
+
+        """
+        self._patterns = patterns
+        self._callback = callback
+        self._interval = interval
+        self._state = self._poll()
+        # the state of a change that hasn't settled yet
+        self._pending = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start watching in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target = self._run, name = "FileWatcher")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stop watching, and wait for a call of the callback which is
+        under way.
+
+        """
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def check(self):
+        """Poll the files once, and call the callback if a change has
+        settled since the last poll.  Return True if it was called.
+
+        """
+        state = self._poll()
+        if state == self._state:
+            self._pending = None
+            return False
+        if state != self._pending:
+            # changed since the last poll, wait for it to settle
+            self._pending = state
+            return False
+        self._state = state
+        self._pending = None
+        try:
+            self._callback()
+        except Exception:
+            sys.stderr.write("WARNING: FileWatcher callback failed:\n")
+            traceback.print_exc()
+        return True
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self.check()
+
+    def _poll(self):
+        """Return a dictionary mapping the names of the watched files to
+        their (size, modification time) pairs.
+
+        """
+        patterns = self._patterns
+        if callable(patterns):
+            patterns = patterns()
+        state = {}
+        for pattern in patterns:
+            for filename in glob.glob(pattern):
+                try: stat = os.stat(filename)
+                except OSError: continue
+                state[filename] = (stat.st_size, stat.st_mtime_ns)
+        return state
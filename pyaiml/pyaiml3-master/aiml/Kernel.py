@@ -3,12 +3,21 @@
 from . import AimlParser
 from . import DefaultSubs
 from . import Utils
+from .FileWatcher import FileWatcher
 from .PatternMgr import PatternMgr
+from .ResponseCache import ResponseCache
+from .SessionStore import SessionStore
+from .SystemExecutor import SubprocessExecutor
+from .TemplateCompiler import TemplateCompiler
 from .WordSub import WordSub
 
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
+import asyncio
+import contextlib
 import copy
 import glob
+import marshal
 import os
 import random
 import re
@@ -28,21 +37,45 @@ class Kernel:
     _inputHistory = "_inputHistory"     # keys to a queue (list) of recent user input
     _outputHistory = "_outputHistory"   # keys to a queue (list) of recent responses.
     _inputStack = "_inputStack"         # Should always be empty in between calls to respond()
+    _matchStack = "_matchStack"         # MatchResults of the inputs on the input stack that matched
 
     def __init__(self):
         self._verboseMode = True
         self._version = "PyAIML 0.8.6"
         self._brain = PatternMgr()
-        self._respondLock = threading.RLock()
+        self._compileBrain = False
+        # the brain is never changed once it's in use: learn() and
+        # loadBrain() build a new one and swap it in, so matching needs no
+        # lock.  _brainLock only keeps them from racing each other.
+        self._brainLock = threading.Lock()
+        # the ("brain", filename) and ("aiml", pattern) pairs the brain was
+        # loaded and learned from, in order, which reload() reads again.
+        self._brainSources = []
+        # the number of errors of every AIML file, as it was learned or
+        # last reloaded, or None if it couldn't be parsed.  reload() only
+        # fails on files that got worse.
+        self._fileErrors = {}
+        # the [brain, templateFuncs, uncacheable] lists of the sessions
+        # responding, which they use until the response is complete.  See
+        # _pinBrain().
+        self._pinnedBrains = {}
         self._textEncoding = "utf-8"
-
-        # set up the sessions
-        self._sessions = {}
-        self._addSession(self._globalSessionID)
-
-        # Set up the bot predicates
-        self._botPredicates = {}
-        self.setBotPredicate("name", "Nameless")
+        # the parser learn() uses, and how strictly it validates
+        self._aimlParser = ("sax", "strict")
+
+        # set up the sessions.  Every session has its own lock, so that
+        # different sessions can respond at the same time.
+        self._sessionLocks = {}
+        self._sessionAsyncLocks = {}
+        self._sessionsLock = threading.RLock()
+        # the tokens of the that and topic of every session, see _tokenize()
+        self._sessionTokens = {}
+        self._sessions = None
+        self.setSessionStore(SessionStore())
+
+        # the responses of the templates that always respond the same to
+        # the same input, that and topic.  See setResponseCache().
+        self._responseCache = ResponseCache()
 
         # set up the word substitutors (subbers):
         self._subbers = {}
@@ -86,6 +119,39 @@ class Kernel:
             "version":      self._processVersion,
         }
 
+        # validation info and processors of the elements added with
+        # addElementProcessor()
+        self._customElements = {}
+        self._customProcessors = {}
+
+        # the templates of the brain compiled into callables and marked
+        # cacheable or not, keyed by the id() of the template.  See
+        # _compiledTemplatesOf().
+        self._compileTemplates = True
+        self._templateCompiler = TemplateCompiler(self)
+        self._templateFuncs = {}
+
+        # Set up the bot predicates
+        self._botPredicates = {}
+        self.setBotPredicate("name", "Nameless")
+
+        # respondAsync() has processors of its own for the elements it
+        # has to wait for, and for the ones that pick which of their
+        # contents get processed.  See _processElementAsync().
+        self._asyncElementProcessors = {
+            "condition":    self._processConditionAsync,
+            "random":       self._processRandomAsync,
+            "sr":           self._processSrAsync,
+            "srai":         self._processSraiAsync,
+            "system":       self._processSystemAsync,
+        }
+        # the elements respondAsync() may have to wait for
+        self._waitingElements = set(["sr", "srai", "system"])
+        self._asyncTimeout = 10.0
+
+        # runs the commands of <system> elements
+        self._systemExecutor = SubprocessExecutor()
+
     def bootstrap(self, brainFile = None, learnFiles = [], commands = []):
         """Prepare a Kernel object for use.
 
@@ -99,7 +165,7 @@ class Kernel:
         passed to respond().
 
         """
-        start = time.clock()
+        start = time.perf_counter()
         if brainFile:
             self.loadBrain(brainFile)
 
@@ -119,12 +185,64 @@ class Kernel:
             print(self._respond(cmd, self._globalSessionID))
 
         if self._verboseMode:
-            print("Kernel bootstrap completed in %.2f seconds" % (time.clock() - start))
+            print("Kernel bootstrap completed in %.2f seconds" % (time.perf_counter() - start))
 
     def verbose(self, isVerbose = True):
         """Enable/disable verbose output mode."""
         self._verboseMode = isVerbose
 
+    def compileBrain(self, compiled = True):
+        """Enable/disable the compiled pattern matcher.
+
+        When enabled, the brain is compiled right away and again after
+        every learn() and loadBrain(), which makes matching faster at
+        the price of some memory.
+
+        """
+        with self._brainLock:
+            self._compileBrain = compiled
+            self._brain.compile(compiled)
+
+    def compileTemplates(self, compiled = True):
+        """Enable/disable the template compiler.
+
+        When enabled, which is the default, learn() and loadBrain()
+        compile the templates of the new categories into Python
+        callables, instead of interpreting the template trees on every
+        response.  The templates of a brain snapshot are compiled when
+        they are first matched.
+
+        """
+        with self._brainLock:
+            self._compileTemplates = compiled
+            self._templateFuncs = self._compiledTemplatesOf(self._brain, {})
+            self._clearResponseCache()
+
+    def setResponseCache(self, maxEntries = 10000):
+        """Set the number of responses kept by the response cache, or
+        disable the cache if maxEntries is 0 or None.
+
+        The responses of the categories whose templates only depend on
+        the input, that and topic they're matched by are cached, so that
+        matching the same input again, on its own or through an <srai>,
+        is a dictionary lookup.  The cache is on by default, and emptied
+        whenever the brain, the bot predicates or the substitutions
+        change.
+
+        """
+        with self._brainLock:
+            if maxEntries:
+                self._responseCache = ResponseCache(maxEntries)
+            else:
+                self._responseCache = None
+
+    def responseCache(self):
+        """Return the ResponseCache of the Kernel, e.g. to read its
+        stats(), or None if it is disabled.
+
+        """
+        return self._responseCache
+
     def version(self):
         """Return the Kernel's version string."""
         return self._version
@@ -149,23 +267,38 @@ class Kernel:
         """Attempt to load a previously-saved 'brain' from the
         specified filename.
 
+        A brain saved by saveBrain() is a snapshot which is
+        memory-mapped rather than read: the patterns are matched
+        straight from the file, and a template is only loaded when it
+        is first matched.  Processes loading the same snapshot share its
+        pages.
+
         NOTE: the current contents of the 'brain' will be discarded!
 
         """
         if self._verboseMode: print("Loading brain from %s..." % filename, end=' ')
-        start = time.clock()
-        self._brain.restore(filename)
+        start = time.perf_counter()
+        brain = PatternMgr()
+        brain.restore(filename)
+        if self._compileBrain:
+            brain.compile()
+        with self._brainLock:
+            self._brain = brain
+            self._templateFuncs = self._compiledTemplatesOf(brain, {})
+            self._brainSources = [("brain", os.path.abspath(filename))]
+            self._fileErrors = {}
+            self._clearResponseCache()
         if self._verboseMode:
-            end = time.clock() - start
-            print("done (%d categories in %.2f seconds)" % (self._brain.numTemplates(), end))
+            end = time.perf_counter() - start
+            print("done (%d categories in %.2f seconds)" % (brain.numTemplates(), end))
 
     def saveBrain(self, filename):
         """Dump the contents of the bot's brain to a file on disk."""
         if self._verboseMode: print("Saving brain to %s..." % filename, end=' ')
-        start = time.clock()
+        start = time.perf_counter()
         self._brain.save(filename)
         if self._verboseMode:
-            print("done (%.2f seconds)" % (time.clock() - start))
+            print("done (%.2f seconds)" % (time.perf_counter() - start))
 
     def getPredicate(self, name, sessionID = _globalSessionID):
         """Retrieve the current value of the predicate 'name' from the
@@ -175,7 +308,12 @@ class Kernel:
         string is returned.
 
         """
-        try: return self._sessions[sessionID][name]
+        session = self._sessions.get(sessionID)
+        if session is None:
+            with self._sessionsLock:
+                session = self._sessions.load(sessionID)
+            if session is None: return ""
+        try: return session[name]
         except KeyError: return ""
 
     def setPredicate(self, name, value, sessionID = _globalSessionID):
@@ -187,8 +325,9 @@ class Kernel:
         created.
 
         """
-        self._addSession(sessionID) # add the session, if it doesn't already exist.
-        self._sessions[sessionID][name] = value
+        session = self._addSession(sessionID) # add the session, if it doesn't already exist.
+        session[name] = value
+        self._sessions.changed(sessionID, session)
 
     def getBotPredicate(self, name):
         """Retrieve the value of the specified bot predicate.
@@ -207,14 +346,93 @@ class Kernel:
         """
         self._botPredicates[name] = value
         # Clumsy hack: if updating the bot name, we must update the
-        # name in the brain as well
+        # name in the brain as well.  Sessions responding keep the brain
+        # they started with, so the name is set on a copy.
         if name == "name":
-            self._brain.setBotName(self.getBotPredicate("name"))
+            with self._brainLock:
+                brain = self._brain.copy()
+                brain.setBotName(self.getBotPredicate("name"))
+                self._useBrain(brain, [])
+        # cached responses may contain the old value
+        self._clearResponseCache()
 
     def setTextEncoding(self, encoding):
         """Set the text encoding used when loading AIML files (Latin-1, UTF-8, etc.)."""
         self._textEncoding = encoding
 
+    def setAimlParser(self, parser = "expat", validation = "strict"):
+        """Choose the parser learn() reads AIML files with.
+
+        parser is either "sax", the xml.sax based parser, which is the
+        default, or "expat", which is quicker and lets the validation
+        be relaxed to "fast" or "off" (see AimlParser.AimlExpatHandler).
+        Both learn the same categories from valid AIML.
+
+        """
+        if parser not in ("sax", "expat"):
+            raise ValueError("Unknown AIML parser %r" % parser)
+        if validation not in AimlParser.AimlExpatHandler._validationModes:
+            raise ValueError("Unknown validation mode %r" % validation)
+        if parser == "sax" and validation != "strict":
+            raise ValueError("The SAX parser always validates strictly")
+        self._aimlParser = (parser, validation)
+
+    def setAsyncTimeout(self, seconds):
+        """Set how many seconds respondAsync() waits for an element
+        added with addAsyncElementProcessor() before giving up on it.
+        None waits forever.  The timeout of <system> commands is the one
+        of the system executor.
+
+        """
+        self._asyncTimeout = seconds
+
+    def setSystemExecutor(self, executor):
+        """Set the executor that runs the commands of <system> elements,
+        an instance of a SystemExecutor subclass.  The default is a
+        SubprocessExecutor.
+
+        """
+        self._systemExecutor = executor
+
+    def systemExecutor(self):
+        """Return the executor that runs the commands of <system>
+        elements, e.g. to read its stats().
+
+        """
+        return self._systemExecutor
+
+    def setSessionStore(self, store):
+        """Set the store that keeps the sessions, a SessionStore
+        instance.  The sessions of the current store are copied to the
+        new one.  The default store keeps every session in memory for
+        good; a SessionStore can also limit the number of sessions and
+        their idle time, and a SqliteSessionStore shares the sessions
+        with other Kernels through a database.
+
+        The store should be set before the Kernel starts responding.
+
+        """
+        with self._sessionsLock:
+            old = self._sessions
+            store.setEvictionHandler(self._forgetSession)
+            # the global session is never evicted
+            store.keep(self._globalSessionID)
+            self._sessions = store
+            if old is not None:
+                for sessionID in old.ids():
+                    session = store.create(sessionID)
+                    for name, value in old.load(sessionID).items():
+                        session[name] = value
+                    store.changed(sessionID, session)
+            self._addSession(self._globalSessionID)
+
+    def sessionStore(self):
+        """Return the store that keeps the sessions, e.g. to read its
+        stats().
+
+        """
+        return self._sessions
+
     def loadSubs(self, filename):
         """Load a substitutions file.
 
@@ -237,23 +455,171 @@ class Kernel:
             # iterate over the key,value pairs and add them to the subber
             for k,v in parser.items(s):
                 self._subbers[s][k] = v
+        # the cached tokens and responses went through the old subbers
+        self._sessionTokens = {}
+        self._clearResponseCache()
+
+    def addElementProcessor(self, name, processor, required = [], optional = [], canBeParent = True):
+        """Register a handler for a custom <name> template element.
+
+        The contents of the element are processed recursively, and
+        the resulting string is passed to processor(contents, attr,
+        sessionID), where attr is the element's attribute dictionary.
+        The string returned by processor becomes the element's
+        response.
+
+        The required and optional attribute lists and the canBeParent
+        flag are used by the AIML parser to validate the element, so
+        the processor must be registered before any AIML file that
+        uses it is learned.
+
+        """
+        def processCustom(elem, sessionID):
+            contents = ""
+            for e in elem[2:]:
+                contents += self._processElement(e, sessionID)
+            return processor(contents, elem[1], sessionID)
+        self._elementProcessors[name] = processCustom
+        self._customProcessors[name] = processor
+        self._asyncElementProcessors.pop(name, None)
+        self._waitingElements.discard(name)
+        self._customElements[name] = (required, optional, canBeParent)
+        self.compileTemplates(self._compileTemplates)
+
+    def addAsyncElementProcessor(self, name, processor, required = [], optional = [], canBeParent = True):
+        """Register a coroutine function as the handler of a custom
+        <name> template element.
+
+        This works like addElementProcessor(), except that respondAsync()
+        awaits processor(contents, attr, sessionID) instead of blocking
+        the event loop, for no longer than the setAsyncTimeout() timeout.
+        If it times out, the element's response is the empty string.
+        respond() runs the coroutine on an event loop of its own, so it
+        must not be called from a running event loop.
+
+        """
+        def processCustom(elem, sessionID):
+            contents = ""
+            for e in elem[2:]:
+                contents += self._processElement(e, sessionID)
+            loop = asyncio.new_event_loop()
+            try: return loop.run_until_complete(processor(contents, elem[1], sessionID))
+            finally: loop.close()
+        async def processCustomAsync(elem, sessionID):
+            contents = ""
+            for e in elem[2:]:
+                contents += await self._processElementAsync(e, sessionID)
+            try:
+                return await asyncio.wait_for(processor(contents, elem[1], sessionID),
+                                              self._asyncTimeout)
+            except asyncio.TimeoutError:
+                if self._verboseMode:
+                    err = "WARNING: <%s> element timed out\n" % name
+                    sys.stderr.write(err)
+                return ""
+        self._elementProcessors[name] = processCustom
+        self._customProcessors.pop(name, None)
+        self._asyncElementProcessors[name] = processCustomAsync
+        self._waitingElements.add(name)
+        self._customElements[name] = (required, optional, canBeParent)
+        self.compileTemplates(self._compileTemplates)
 
     def _addSession(self, sessionID):
-        """Create a new session with the specified ID string."""
-        if sessionID in self._sessions:
-            return
-        # Create the session.
-        self._sessions[sessionID] = {
-            # Initialize the special reserved predicates
-            self._inputHistory: [],
-            self._outputHistory: [],
-            self._inputStack: []
-        }
+        """Create a new session with the specified ID string, unless it
+        exists already, and return it.
+
+        """
+        session = self._sessions.get(sessionID)
+        if session is not None:
+            return session
+        with self._sessionsLock:
+            session = self._sessions.load(sessionID)
+            if session is not None:
+                return session
+            # Create the session.
+            return self._sessions.create(sessionID)
 
     def _deleteSession(self, sessionID):
         """Delete the specified session."""
-        if sessionID in self._sessions:
-            _sessions.pop(sessionID)
+        with self._sessionsLock:
+            self._sessions.delete(sessionID)
+            self._forgetSession(sessionID)
+
+    def _forgetSession(self, sessionID):
+        """Drop the locks and cached tokens of a session that has been
+        deleted or evicted from the session store.
+
+        """
+        with self._sessionsLock:
+            self._sessionLocks.pop(sessionID, None)
+            self._sessionAsyncLocks.pop(sessionID, None)
+            self._sessionTokens.pop(sessionID, None)
+
+    @contextlib.contextmanager
+    def _usingSession(self, sessionID):
+        """Keep the specified session from being evicted from the session
+        store while in the with block, creating the session if it
+        doesn't exist yet.
+
+        """
+        with self._sessionsLock:
+            self._addSession(sessionID)
+            self._sessions.acquire(sessionID)
+        try:
+            yield
+        finally:
+            with self._sessionsLock:
+                self._sessions.release(sessionID)
+            self._sessions.commit()
+
+    def _sessionLock(self, sessionID):
+        """Return the lock of the specified session, creating the
+        session if it doesn't exist yet.
+
+        """
+        with self._sessionsLock:
+            self._addSession(sessionID)
+            if sessionID not in self._sessionLocks:
+                self._sessionLocks[sessionID] = threading.RLock()
+            return self._sessionLocks[sessionID]
+
+    def _sessionAsyncLock(self, sessionID):
+        """Return the asyncio lock respondAsync() holds while it
+        responds in the specified session, creating the session if it
+        doesn't exist yet.
+
+        """
+        with self._sessionsLock:
+            self._addSession(sessionID)
+            if sessionID not in self._sessionAsyncLocks:
+                self._sessionAsyncLocks[sessionID] = asyncio.Lock()
+            return self._sessionAsyncLocks[sessionID]
+
+    @contextlib.contextmanager
+    def _pinBrain(self, sessionID):
+        """Keep the specified session on the current brain while in the
+        with block, even if learn() or reload() swap in a new one
+        meanwhile, so that every <srai> of a response is matched against
+        the same brain.  Responses nested in a response of the session
+        use the brain of the outer one.
+
+        """
+        if sessionID in self._pinnedBrains:
+            yield
+            return
+        self._pinnedBrains[sessionID] = [self._brain, self._templateFuncs, 0]
+        try:
+            yield
+        finally:
+            del self._pinnedBrains[sessionID]
+
+    def _brainOf(self, sessionID):
+        """Return the brain and templateFuncs the specified session
+        responds with, as the first two items of a sequence.
+
+        """
+        try: return self._pinnedBrains[sessionID]
+        except KeyError: return (self._brain, self._templateFuncs)
 
     def getSessionData(self, sessionID = None):
         """Return a copy of the session data dictionary for the
@@ -264,38 +630,193 @@ class Kernel:
 
         """
         s = None
-        if sessionID is not None:
-            try: s = self._sessions[sessionID]
-            except KeyError: s = {}
-        else:
-            s = self._sessions
-        return copy.deepcopy(s)
-
-    def learn(self, filename):
+        with self._sessionsLock:
+            if sessionID is not None:
+                session = self._sessions.load(sessionID)
+                s = dict(session.items()) if session is not None else {}
+            else:
+                s = {}
+                for sid in self._sessions.ids():
+                    session = self._sessions.load(sid)
+                    if session is not None:
+                        s[sid] = dict(session.items())
+            return copy.deepcopy(s)
+
+    def learn(self, filename, workers = 1):
         """Load and learn the contents of the specified AIML file.
 
         If filename includes wildcard characters, all matching files
         will be loaded and learned.
 
+        If workers is more than 1, the files are parsed by that many
+        processes at once.  The categories are still added in the order
+        of the files, so a category defined in several files ends up
+        with the template of the last one, as it does when the files
+        are learned one by one.
+
+        The categories are added to a copy of the brain, which replaces
+        the brain once all files are learned, so that sessions responding
+        meanwhile never see a half-learned brain.  filename is remembered
+        for reload().
+
         """
-        for f in glob.glob(filename):
-            if self._verboseMode: print("Loading %s..." % f, end=' ')
-            start = time.clock()
-            # Load and parse the AIML file.
-            parser = AimlParser.create_parser()
-            handler = parser.getContentHandler()
-            handler.setEncoding(self._textEncoding)
-            try: parser.parse(f)
-            except xml.sax.SAXParseException as msg:
-                err = "\nFATAL PARSE ERROR in file %s:\n%s\n" % (f,msg)
-                sys.stderr.write(err)
-                continue
-            # store the pattern/template pairs in the PatternMgr.
-            for key,tem in list(handler.categories.items()):
-                self._brain.add(key,tem)
-            # Parsing was successful.
+        files = glob.glob(filename)
+        with self._brainLock:
+            brain = None
+            added = []
+            for f, (categories, numErrors) in zip(files, self._parseFiles(files, workers)):
+                self._fileErrors[os.path.abspath(f)] = numErrors if categories is not None else None
+                if categories is None:
+                    continue
+                # store the pattern/template pairs in the PatternMgr.
+                if brain is None:
+                    brain = self._brain.copy()
+                for key,tem in list(categories.items()):
+                    brain.add(key,tem)
+                added.extend(categories.values())
+            if brain is not None:
+                self._useBrain(brain, added)
+            # a file learned again moves to the end, as its categories
+            # replace the ones learned since.
+            source = ("aiml", os.path.abspath(filename))
+            if source in self._brainSources:
+                self._brainSources.remove(source)
+            self._brainSources.append(source)
+
+    def reload(self, workers = 1):
+        """Rebuild the brain from the brain file and the AIML files it
+        was loaded and learned from, and swap it in if they all still
+        load without more errors than they had when they were learned.
+
+        The new brain is built while the old one keeps responding, and
+        replaces it at once.  Responses under way finish on the old
+        brain; sessions, predicates and settings are kept.  Return True
+        if the new brain is in use, or False if a file is missing or has
+        more errors, in which case the old brain is kept.  A file that
+        couldn't be parsed when it was learned is still left out, and a
+        new file must have no errors.
+
+        """
+        with self._brainLock:
+            if self._verboseMode: print("Reloading the brain...")
+            start = time.perf_counter()
+            brain = PatternMgr()
+            brain.setBotName(self.getBotPredicate("name"))
+            fileErrors = {}
+            for kind, filename in self._brainSources:
+                if kind == "brain":
+                    try: brain.restore(filename)
+                    except Exception as e:
+                        sys.stderr.write("RELOAD FAILED: %s\n" % e)
+                        return False
+                    continue
+                files = glob.glob(filename)
+                if len(files) == 0:
+                    sys.stderr.write("RELOAD FAILED: no file matches %s\n" % filename)
+                    return False
+                for f, (categories, numErrors) in zip(files, self._parseFiles(files, workers)):
+                    known = self._fileErrors.get(f, 0)
+                    if known is not None and (categories is None or numErrors > known):
+                        sys.stderr.write("RELOAD FAILED: %s has errors\n" % f)
+                        return False
+                    fileErrors[f] = numErrors if categories is not None else None
+                    if categories is None:
+                        continue
+                    for key,tem in list(categories.items()):
+                        brain.add(key,tem)
+            self._useBrain(brain)
+            self._fileErrors = fileErrors
             if self._verboseMode:
-                print("done (%.2f seconds)" % (time.clock() - start))
+                print("Reloaded %d categories in %.2f seconds" % (brain.numTemplates(), time.perf_counter() - start))
+            return True
+
+    def brainFiles(self):
+        """Return the brain file and the AIML files (or patterns) the
+        brain was loaded and learned from, in the order reload() reads
+        them.
+
+        """
+        with self._brainLock:
+            return [filename for kind, filename in self._brainSources]
+
+    def watch(self, interval = 1.0):
+        """Reload the brain whenever one of the files it was loaded and
+        learned from changes, is added or is removed.  Return the
+        FileWatcher polling the files every interval seconds; call its
+        stop() method to stop watching.
+
+        """
+        watcher = FileWatcher(self.brainFiles, self.reload, interval)
+        watcher.start()
+        return watcher
+
+    def _useBrain(self, brain, added = None):
+        """Compile brain as configured and make it the brain of the
+        Kernel.  The caller holds _brainLock.
+
+        added is the list of templates brain has on top of the current
+        brain, if it's a copy of it that categories were added to, so
+        that only those are compiled.  The entries of the templates the
+        new categories replaced are left behind, until there are as many
+        of them as live ones.
+
+        """
+        if self._compileBrain:
+            brain.compile()
+        if added is not None and len(self._templateFuncs) + len(added) <= 2 * brain.numTemplates():
+            templateFuncs = dict(self._templateFuncs)
+            for template in added:
+                templateFuncs[id(template)] = self._newTemplateEntry(template)
+        else:
+            templateFuncs = self._compiledTemplatesOf(brain, self._templateFuncs)
+        self._brain = brain
+        self._templateFuncs = templateFuncs
+        self._clearResponseCache()
+
+    def _clearResponseCache(self):
+        """Empty the response cache, if there is one."""
+        cache = self._responseCache
+        if cache is not None:
+            cache.clear()
+
+    def _parseFiles(self, files, workers):
+        """Parse the AIML files with _parseAimlFile(), in workers
+        processes if workers is more than 1, and return an iterator over
+        their (categories, numErrors) pairs, in the order of the files.
+
+        """
+        customElements = list(self._customElements.items())
+        if workers <= 1 or len(files) <= 1:
+            return (self._parseVerbose(f, customElements) for f in files)
+        workers = min(workers, len(files))
+        if self._verboseMode: print("Loading %d files in %d processes..." % (len(files), workers), end=' ')
+        start = time.perf_counter()
+        pool = ProcessPoolExecutor(workers)
+        try:
+            marshalled = list(pool.map(_parseAimlFileMarshalled, files,
+                                    [self._textEncoding] * len(files),
+                                    [customElements] * len(files),
+                                    [self._aimlParser] * len(files),
+                                    chunksize = max(1, len(files) // (4 * workers))))
+        finally:
+            pool.shutdown()
+        if self._verboseMode:
+            print("done (%.2f seconds)" % (time.perf_counter() - start))
+        return ((marshal.loads(data) if data is not None else None, numErrors)
+                for data, numErrors in marshalled)
+
+    def _parseVerbose(self, filename, customElements):
+        """Parse an AIML file with _parseAimlFile(), telling about it in
+        verbose mode.
+
+        """
+        if self._verboseMode: print("Loading %s..." % filename, end=' ')
+        start = time.perf_counter()
+        categories, numErrors = _parseAimlFile(filename, self._textEncoding, customElements, self._aimlParser)
+        # Parsing was successful.
+        if categories is not None and self._verboseMode:
+            print("done (%.2f seconds)" % (time.perf_counter() - start))
+        return categories, numErrors
 
     def respond(self, input, sessionID = _globalSessionID):
         """Return the Kernel's response to the input string."""
@@ -307,52 +828,283 @@ class Kernel:
         except UnicodeError: pass
         except AttributeError: pass
 
-        # prevent other threads from stomping all over us.
-        self._respondLock.acquire()
-
-        # Add the session, if it doesn't already exist
-        self._addSession(sessionID)
+        # prevent other threads from stomping all over this session.  The
+        # lock is reentrant, so element processors may call respond() on
+        # the same session.
+        with self._usingSession(sessionID), self._sessionLock(sessionID), self._pinBrain(sessionID):
+            return self._respondSession(input, sessionID)
 
+    def _respondSession(self, input, sessionID):
+        """Respond to all sentences of input, with the session locked."""
         # split the input into discrete sentences
         sentences = Utils.sentences(input)
         finalResponse = ""
         for s in sentences:
             # Add the input to the history list before fetching the
             # response, so that <input/> tags work properly.
-            inputHistory = self.getPredicate(self._inputHistory, sessionID)
-            inputHistory.append(s)
-            while len(inputHistory) > self._maxHistorySize:
-                inputHistory.pop(0)
-            self.setPredicate(self._inputHistory, inputHistory, sessionID)
+            self._addToHistory(self._inputHistory, s, sessionID)
 
             # Fetch the response
             response = self._respond(s, sessionID)
 
             # add the data from this exchange to the history lists
-            outputHistory = self.getPredicate(self._outputHistory, sessionID)
-            outputHistory.append(response)
-            while len(outputHistory) > self._maxHistorySize:
-                outputHistory.pop(0)
-            self.setPredicate(self._outputHistory, outputHistory, sessionID)
+            self._addToHistory(self._outputHistory, response, sessionID)
 
             # append this response to the final response.
             finalResponse += (response + "  ")
         finalResponse = finalResponse.strip()
 
         assert(len(self.getPredicate(self._inputStack, sessionID)) == 0)
-
-        # release the lock and return
-        self._respondLock.release()
         return finalResponse
 
+    async def respondAsync(self, input, sessionID = _globalSessionID):
+        """Return the Kernel's response to the input string, like
+        respond() does, from a coroutine.
+
+        <system> commands run as subprocesses and the elements added
+        with addAsyncElementProcessor() are awaited, so that a single
+        event loop can serve many sessions at once.  A session should
+        be served either by respond() or by respondAsync(), not by both
+        at the same time.
+
+        """
+        if len(input) == 0:
+            return ""
+
+        #ensure that input is a unicode string
+        try: input = input.decode(self._textEncoding, 'replace')
+        except UnicodeError: pass
+        except AttributeError: pass
+
+        # coroutines responding in the same session take turns.
+        with self._usingSession(sessionID):
+            async with self._sessionAsyncLock(sessionID):
+                with self._pinBrain(sessionID):
+                    sentences = Utils.sentences(input)
+                    finalResponse = ""
+                    for s in sentences:
+                        self._addToHistory(self._inputHistory, s, sessionID)
+                        response = await self._respondAsync(s, sessionID)
+                        self._addToHistory(self._outputHistory, response, sessionID)
+                        finalResponse += (response + "  ")
+                    finalResponse = finalResponse.strip()
+
+                    assert(len(self.getPredicate(self._inputStack, sessionID)) == 0)
+                    return finalResponse
+
+    def _addToHistory(self, name, value, sessionID):
+        """Append value to the history list in the predicate 'name',
+        dropping the oldest entries beyond _maxHistorySize.
+
+        """
+        history = self.getPredicate(name, sessionID)
+        history.append(value)
+        while len(history) > self._maxHistorySize:
+            history.pop(0)
+        self.setPredicate(name, history, sessionID)
+
     # This version of _respond() just fetches the response for some input.
     # It does not mess with the input and output histories.  Recursive calls
     # to respond() spawned from tags like <srai> should call this function
     # instead of respond().
     def _respond(self, input, sessionID):
         """Private version of respond(), does the real work."""
-        if len(input) == 0:
+        if not self._pushInput(input, sessionID):
+            return ""
+        tokens = self._matchTokens(input, sessionID)
+        response = self._cachedResponse(tokens, sessionID)
+        if response is not None:
+            self._popInput(None, sessionID)
+            return response
+        pin = self._pinnedBrains.get(sessionID)
+        uncacheable = pin[2] if pin is not None else 0
+        match = self._matchInput(input, tokens, sessionID)
+        response = ""
+        if match is not None:
+            # Process the element into a response string.
+            template, func, cacheable = self._templateEntry(match.template, self._brainOf(sessionID)[1])
+            if not cacheable and pin is not None:
+                pin[2] += 1
+            if func is not None:
+                response = func(sessionID)
+            else:
+                response = self._processElement(match.template, sessionID)
+            response = response.strip()
+            self._cacheResponse(tokens, response, uncacheable, sessionID)
+        self._popInput(match, sessionID)
+        return response.strip()
+
+    # The counterpart of _respond() for respondAsync().
+    async def _respondAsync(self, input, sessionID):
+        """Private version of respondAsync(), does the real work."""
+        if not self._pushInput(input, sessionID):
             return ""
+        tokens = self._matchTokens(input, sessionID)
+        response = self._cachedResponse(tokens, sessionID)
+        if response is not None:
+            self._popInput(None, sessionID)
+            return response
+        pin = self._pinnedBrains.get(sessionID)
+        uncacheable = pin[2] if pin is not None else 0
+        match = self._matchInput(input, tokens, sessionID)
+        response = ""
+        if match is not None:
+            if not self._templateEntry(match.template, self._brainOf(sessionID)[1])[2] and pin is not None:
+                pin[2] += 1
+            response = await self._processElementAsync(match.template, sessionID)
+            response = response.strip()
+            self._cacheResponse(tokens, response, uncacheable, sessionID)
+        self._popInput(match, sessionID)
+        return response.strip()
+
+    def _cachedResponse(self, tokens, sessionID):
+        """Return the cached response to the input whose _matchTokens()
+        are tokens in the specified session, or None.
+
+        Responses are only cached within respond() and respondAsync(),
+        which pin the session to a brain and count the responses under
+        way that can't be cached.
+
+        """
+        cache = self._responseCache
+        pin = self._pinnedBrains.get(sessionID)
+        if cache is None or pin is None or tokens is None:
+            return None
+        return cache.get(tokens[0], pin[0])
+
+    def _cacheResponse(self, tokens, response, uncacheable, sessionID):
+        """Cache response, the response to the input whose _matchTokens()
+        are tokens in the specified session, unless something that can't
+        be cached was processed since the session's count of uncacheable
+        responses was uncacheable.
+
+        """
+        cache = self._responseCache
+        pin = self._pinnedBrains.get(sessionID)
+        if cache is None or pin is None:
+            return
+        # don't fill the cache with the responses of a brain that has
+        # been replaced meanwhile.
+        if pin[2] == uncacheable and pin[0] is self._brain:
+            cache.put(tokens[0], pin[0], response)
+        else:
+            cache.skip()
+
+    def _compiledTemplatesOf(self, brain, templateFuncs):
+        """Return the templates of brain compiled into callables, in a
+        dictionary mapping the id() of a template to a (template,
+        callable, cacheable) tuple; see _newTemplateEntry().  The
+        entries in templateFuncs, a dictionary of the same kind, are
+        reused.
+
+        The templates of a brain read from a snapshot are left out, so
+        that they don't all have to be loaded; _templateEntry() adds
+        them when they are first matched.
+
+        """
+        if brain.isSnapshot():
+            return {}
+        result = {}
+        for template in brain.templates():
+            entry = templateFuncs.get(id(template))
+            if entry is None or entry[0] is not template:
+                entry = self._newTemplateEntry(template)
+            result[id(template)] = entry
+        return result
+
+    def _newTemplateEntry(self, template):
+        """Return the (template, callable, cacheable) tuple of template.
+        callable is the compiled template, or None if the template is to
+        be interpreted, because the template compiler is disabled or
+        fails on it; _processElement() reports the error when the
+        template is processed.  cacheable tells whether the responses
+        of the template can be cached, see _isCacheable().
+
+        """
+        func = None
+        if self._compileTemplates:
+            try: func = self._templateCompiler.compile(template)
+            except Exception: pass
+        return (template, func, self._isCacheable(template))
+
+    def _templateEntry(self, template, templateFuncs = None):
+        """Return the (template, callable, cacheable) tuple of template
+        in templateFuncs (_templateFuncs by default), adding it now if it
+        isn't there yet.
+
+        """
+        if templateFuncs is None:
+            templateFuncs = self._templateFuncs
+        entry = templateFuncs.get(id(template))
+        if entry is None or entry[0] is not template:
+            entry = self._newTemplateEntry(template)
+            templateFuncs[id(template)] = entry
+        return entry
+
+    def _templateFunc(self, template, templateFuncs = None):
+        """Return the compiled callable of template, or None if the
+        template is to be interpreted.
+
+        """
+        return self._templateEntry(template, templateFuncs)[1]
+
+    # The elements whose result only depends on their contents, the
+    # match and the brain, by the name of the Kernel method processing
+    # them.  <bot>, <gender>, <person> and <person2> depend on the bot
+    # predicates and the substitutions as well, which empty the response
+    # cache when they change.
+    _cacheableElements = {
+        "bot":          "_processBot",
+        "formal":       "_processFormal",
+        "gender":       "_processGender",
+        "lowercase":    "_processLowercase",
+        "person":       "_processPerson",
+        "person2":      "_processPerson2",
+        "sentence":     "_processSentence",
+        "size":         "_processSize",
+        "sr":           "_processSr",
+        "srai":         "_processSrai",
+        "star":         "_processStar",
+        "template":     "_processTemplate",
+        "text":         "_processText",
+        "thatstar":     "_processThatstar",
+        "think":        "_processThink",
+        "topicstar":    "_processTopicstar",
+        "uppercase":    "_processUppercase",
+        "version":      "_processVersion",
+    }
+
+    def _isCacheable(self, template):
+        """Return True if the response of template is the same whenever
+        the same input, that and topic match it, because it's only made
+        of _cacheableElements: it doesn't read or change the session,
+        like <get>, <set>, <condition>, <input> or <that> do, nor has
+        side effects or results of its own, like <random>, <date>,
+        <system>, <learn> or custom elements.
+
+        The responses of <sr> and <srai> elements are only known when
+        they're processed; _respond() doesn't cache a response if one of
+        them couldn't be cached.
+
+        """
+        stack = [template]
+        while stack:
+            elem = stack.pop()
+            methodName = self._cacheableElements.get(elem[0])
+            if methodName is None or self._elementProcessors.get(elem[0]) != getattr(self, methodName):
+                return False
+            if elem[0] != "text":
+                stack.extend(elem[2:])
+        return True
+
+    def _pushInput(self, input, sessionID):
+        """Push input onto the input stack of the session.  Return False
+        if there is nothing to respond to, because input is empty or the
+        stack is too deep already.
+
+        """
+        if len(input) == 0:
+            return False
 
         # guard against infinite recursion
         inputStack = self.getPredicate(self._inputStack, sessionID)
@@ -360,47 +1112,105 @@ class Kernel:
             if self._verboseMode:
                 err = "WARNING: maximum recursion depth exceeded (input='%s')" % input
                 sys.stderr.write(err)
-            return ""
+            # a response cut short can't be cached
+            pin = self._pinnedBrains.get(sessionID)
+            if pin is not None:
+                pin[2] += 1
+            return False
 
         # push the input onto the input stack
-        inputStack = self.getPredicate(self._inputStack, sessionID)
         inputStack.append(input)
         self.setPredicate(self._inputStack, inputStack, sessionID)
+        return True
+
+    def _matchTokens(self, input, sessionID):
+        """Return the tokens input is matched with in the specified
+        session, as a (key, inputTokens, thatTokens, topicTokens) tuple,
+        or None if nothing is left of input after substitution.
+
+        The tokens are the PatternMgr.tokenize() tokens of the input,
+        that and topic run through the 'normal' subber, and key is the
+        triple of the normalized texts, which the response cache is
+        keyed by.
 
+        """
         # run the input through the 'normal' subber
         subbedInput = self._subbers['normal'].sub(input)
+        if len(subbedInput) == 0:
+            return None
 
         # fetch the bot's previous response, to pass to the match()
         # function as 'that'.
         outputHistory = self.getPredicate(self._outputHistory, sessionID)
         try: that = outputHistory[-1]
         except IndexError: that = ""
-        subbedThat = self._subbers['normal'].sub(that)
 
         # fetch the current topic
         topic = self.getPredicate("topic", sessionID)
-        subbedTopic = self._subbers['normal'].sub(topic)
 
-        # Determine the final response.
-        response = ""
-        elem = self._brain.match(subbedInput, subbedThat, subbedTopic)
-        if elem is None:
+        inputTokens = self._brainOf(sessionID)[0].tokenize(subbedInput)
+        thatKey, thatTokens = self._tokenize(that, "that", sessionID)
+        topicKey, topicTokens = self._tokenize(topic, "topic", sessionID)
+        return ((" ".join(inputTokens[0]), thatKey, topicKey), inputTokens, thatTokens, topicTokens)
+
+    def _matchInput(self, input, tokens, sessionID):
+        """Match input, whose _matchTokens() are tokens, against the
+        brain, and push the MatchResult onto the match stack of the
+        session, so that <star> elements don't have to match the input
+        all over again.  Return the MatchResult, or None if nothing
+        matched.
+
+        """
+        match = None
+        if tokens is not None:
+            match = self._brainOf(sessionID)[0].matchTokens(*tokens[1:])
+        if match is None:
             if self._verboseMode:
                 err = "WARNING: No match found for input: %s\n" % input
                 sys.stderr.write(err)
         else:
-            # Process the element into a response string.
-            response += self._processElement(elem, sessionID).strip()
-            response += " "
-        response = response.strip()
+            matchStack = self.getPredicate(self._matchStack, sessionID)
+            matchStack.append(match)
+            self.setPredicate(self._matchStack, matchStack, sessionID)
+        return match
+
+    def _tokenize(self, text, name, sessionID):
+        """Return the (normalized, tokens) pair of text: normalized is
+        text run through the 'normal' subber with its words separated by
+        single spaces, and tokens are its PatternMgr.tokenize() tokens.
+
+        The that or topic (name) of a session usually stays the same for
+        many calls, e.g. for all <srai> of a response, so its tokens are
+        cached per session until the text changes.
+
+        """
+        cache = self._sessionTokens.setdefault(sessionID, {})
+        try:
+            cachedText, normalized, tokens = cache[name]
+            if cachedText == text:
+                return normalized, tokens
+        except KeyError:
+            pass
+        tokens = self._brainOf(sessionID)[0].tokenize(self._subbers['normal'].sub(text))
+        normalized = " ".join(tokens[0])
+        cache[name] = (text, normalized, tokens)
+        return normalized, tokens
+
+    def _popInput(self, match, sessionID):
+        """Undo _pushInput() and _matchInput() once the response to the
+        input is complete.
+
+        """
+        if match is not None:
+            matchStack = self.getPredicate(self._matchStack, sessionID)
+            matchStack.pop()
+            self.setPredicate(self._matchStack, matchStack, sessionID)
 
         # pop the top entry off the input stack.
         inputStack = self.getPredicate(self._inputStack, sessionID)
         inputStack.pop()
         self.setPredicate(self._inputStack, inputStack, sessionID)
 
-        return response
-
     def _processElement(self,elem, sessionID):
         """Process an AIML element.
 
@@ -423,6 +1233,41 @@ class Kernel:
             return ""
         return handlerFunc(elem, sessionID)
 
+    async def _processElementAsync(self, elem, sessionID):
+        """Process an AIML element for respondAsync().
+
+        Elements that contain nothing respondAsync() may have to wait
+        for are handed to _processElement().  Of the others, those with
+        a processor in _asyncElementProcessors are processed by it.  The
+        rest get their contents processed first, which are then passed
+        as text to the element's ordinary processor.
+
+        """
+        if not self._mustWait(elem):
+            return self._processElement(elem, sessionID)
+        handlerFunc = self._asyncElementProcessors.get(elem[0])
+        if handlerFunc is not None:
+            return await handlerFunc(elem, sessionID)
+        contents = []
+        for e in elem[2:]:
+            text = await self._processElementAsync(e, sessionID)
+            contents.append(["text", {"xml:space": "preserve"}, text])
+        return self._processElement(elem[:2] + contents, sessionID)
+
+    def _mustWait(self, elem):
+        """Return True if elem is or contains an element that
+        respondAsync() may have to wait for.
+
+        """
+        if elem[0] in self._waitingElements:
+            return True
+        if elem[0] == "text":
+            return False
+        for e in elem[2:]:
+            if self._mustWait(e):
+                return True
+        return False
+
 
     ######################################################
     ### Individual element-processing functions follow ###
@@ -473,8 +1318,23 @@ class Kernel:
         attributes.
 
         """
-        attr = None
         response = ""
+        for e in self._conditionContents(elem, sessionID):
+            response += self._processElement(e, sessionID)
+        return response
+
+    async def _processConditionAsync(self, elem, sessionID):
+        """Process a <condition> AIML element for respondAsync()."""
+        response = ""
+        for e in self._conditionContents(elem, sessionID):
+            response += await self._processElementAsync(e, sessionID)
+        return response
+
+    def _conditionContents(self, elem, sessionID):
+        """Return the list of elements of a <condition> element to
+        process, see _processCondition().
+
+        """
         attr = elem[1]
 
         # Case #1: test the value of a specific predicate for a
@@ -482,9 +1342,7 @@ class Kernel:
         if 'name' in attr and 'value' in attr:
             val = self.getPredicate(attr['name'], sessionID)
             if val == attr['value']:
-                for e in elem[2:]:
-                    response += self._processElement(e,sessionID)
-                return response
+                return elem[2:]
         else:
             # Case #2 and #3: Cycle through <li> contents, testing a
             # name and value pair for each one.
@@ -497,12 +1355,11 @@ class Kernel:
                 for e in elem[2:]:
                     if e[0] == 'li':
                         listitems.append(e)
-                # if listitems is empty, return the empty string
+                # if listitems is empty, there's nothing to process
                 if len(listitems) == 0:
-                    return ""
+                    return []
                 # iterate through the list looking for a condition that
                 # matches.
-                foundMatch = False
                 for li in listitems:
                     try:
                         liAttr = li[1]
@@ -518,32 +1375,29 @@ class Kernel:
                         liValue = liAttr['value']
                         # do the test
                         if self.getPredicate(liName, sessionID) == liValue:
-                            foundMatch = True
-                            response += self._processElement(li,sessionID)
-                            break
+                            return [li]
                     except:
                         # No attributes, no name/value attributes, no
                         # such predicate/session, or processing error.
                         if self._verboseMode: print("Something amiss -- skipping listitem", li)
                         raise
-                if not foundMatch:
-                    # Check the last element of listitems.  If it has
-                    # no 'name' or 'value' attribute, process it.
-                    try:
-                        li = listitems[-1]
-                        liAttr = li[1]
-                        if not ('name' in liAttr or 'value' in liAttr):
-                            response += self._processElement(li, sessionID)
-                    except:
-                        # listitems was empty, no attributes, missing
-                        # name/value attributes, or processing error.
-                        if self._verboseMode: print("error in default listitem")
-                        raise
+                # Check the last element of listitems.  If it has
+                # no 'name' or 'value' attribute, process it.
+                try:
+                    li = listitems[-1]
+                    liAttr = li[1]
+                    if not ('name' in liAttr or 'value' in liAttr):
+                        return [li]
+                except:
+                    # listitems was empty, no attributes, missing
+                    # name/value attributes, or processing error.
+                    if self._verboseMode: print("error in default listitem")
+                    raise
             except:
                 # Some other catastrophic cataclysm
                 if self._verboseMode: print("catastrophic condition failure")
                 raise
-        return response
+        return []
 
     # <date>
     def _processDate(self, elem, sessionID):
@@ -671,6 +1525,10 @@ class Kernel:
         for e in elem[2:]:
             filename += self._processElement(e, sessionID)
         self.learn(filename)
+        # the rest of the response sees the new categories
+        pin = self._pinnedBrains.get(sessionID)
+        if pin is not None:
+            pin[0:2] = [self._brain, self._templateFuncs]
         return ""
 
     # <li>
@@ -768,6 +1626,17 @@ class Kernel:
         random.shuffle(listitems)
         return self._processElement(listitems[0], sessionID)
 
+    async def _processRandomAsync(self, elem, sessionID):
+        """Process a <random> AIML element for respondAsync()."""
+        listitems = []
+        for e in elem[2:]:
+            if e[0] == 'li':
+                listitems.append(e)
+        if len(listitems) == 0:
+            return ""
+        random.shuffle(listitems)
+        return await self._processElementAsync(listitems[0], sessionID)
+
     # <sentence>
     def _processSentence(self,elem, sessionID):
         """Process a <sentence> AIML element.
@@ -783,7 +1652,7 @@ class Kernel:
             response = response.strip()
             words = response.split(" ", 1)
             words[0] = words[0].capitalize()
-            response = words.join()
+            response = " ".join(words)
             return response
         except IndexError: # response was empty
             return ""
@@ -827,6 +1696,11 @@ class Kernel:
         response = self._respond(star, sessionID)
         return response
 
+    async def _processSrAsync(self, elem, sessionID):
+        """Process an <sr> AIML element for respondAsync()."""
+        star = self._processElement(['star',{}], sessionID)
+        return await self._respondAsync(star, sessionID)
+
     # <srai>
     def _processSrai(self,elem, sessionID):
         """Process a <srai> AIML element.
@@ -842,6 +1716,13 @@ class Kernel:
             newInput += self._processElement(e, sessionID)
         return self._respond(newInput, sessionID)
 
+    async def _processSraiAsync(self, elem, sessionID):
+        """Process a <srai> AIML element for respondAsync()."""
+        newInput = ""
+        for e in elem[2:]:
+            newInput += await self._processElementAsync(e, sessionID)
+        return await self._respondAsync(newInput, sessionID)
+
     # <star>
     def _processStar(self, elem, sessionID):
         """Process a <star> AIML element.
@@ -859,16 +1740,10 @@ class Kernel:
         """
         try: index = int(elem[1]['index'])
         except KeyError: index = 1
-        # fetch the user's last input
-        inputStack = self.getPredicate(self._inputStack, sessionID)
-        input = self._subbers['normal'].sub(inputStack[-1])
-        # fetch the Kernel's last response (for 'that' context)
-        outputHistory = self.getPredicate(self._outputHistory, sessionID)
-        try: that = self._subbers['normal'].sub(outputHistory[-1])
-        except: that = "" # there might not be any output yet
-        topic = self.getPredicate("topic", sessionID)
-        response = self._brain.star("star", input, that, topic, index)
-        return response
+        # the wildcard spans were recorded when the input was matched
+        matchStack = self.getPredicate(self._matchStack, sessionID)
+        try: return matchStack[-1].star("star", index)
+        except IndexError: return ""
 
     # <system>
     def _processSystem(self,elem, sessionID):
@@ -877,7 +1752,9 @@ class Kernel:
         <system> elements process their contents recursively, and then
         attempt to execute the results as a shell command on the
         server.  The AIML interpreter blocks until the command is
-        complete, and then returns the command's output.
+        complete, and then returns the command's output.  The command
+        is run by the executor set with setSystemExecutor(), which
+        enforces a timeout and an output limit.
 
         For cross-platform compatibility, any file paths inside
         <system> tags should use Unix-style forward slashes ("/") as a
@@ -899,18 +1776,36 @@ class Kernel:
         command = os.path.normpath(command)
 
         # execute the command.
-        response = ""
         try:
-            out = os.popen(command)
+            return self._systemExecutor.run(command)
         except RuntimeError as msg:
-            if self._verboseMode:
-                err = "WARNING: RuntimeError while processing \"system\" element:\n%s\n" % msg
-                sys.stderr.write(err)
-            return "There was an error while computing my response.  Please inform my botmaster."
-        time.sleep(0.01) # I'm told this works around a potential IOError exception.
-        response = ''.join([line for line in out])
-        # response = ' '.join([line.strip() for line in out])
-        return response
+            return self._systemError(msg)
+
+    async def _processSystemAsync(self, elem, sessionID):
+        """Process a <system> AIML element for respondAsync().
+
+        The command is awaited, so that the event loop goes on serving
+        other sessions until it is complete.
+
+        """
+        command = ""
+        for e in elem[2:]:
+            command += await self._processElementAsync(e, sessionID)
+        command = os.path.normpath(command)
+        try:
+            return await self._systemExecutor.runAsync(command)
+        except RuntimeError as msg:
+            return self._systemError(msg)
+
+    def _systemError(self, msg):
+        """Return the response of a <system> element whose command
+        failed with the error msg.
+
+        """
+        if self._verboseMode:
+            err = "WARNING: RuntimeError while processing \"system\" element:\n%s\n" % msg
+            sys.stderr.write(err)
+        return "There was an error while computing my response.  Please inform my botmaster."
 
     # <template>
     def _processTemplate(self,elem, sessionID):
@@ -996,16 +1891,10 @@ class Kernel:
         """
         try: index = int(elem[1]['index'])
         except KeyError: index = 1
-        # fetch the user's last input
-        inputStack = self.getPredicate(self._inputStack, sessionID)
-        input = self._subbers['normal'].sub(inputStack[-1])
-        # fetch the Kernel's last response (for 'that' context)
-        outputHistory = self.getPredicate(self._outputHistory, sessionID)
-        try: that = self._subbers['normal'].sub(outputHistory[-1])
-        except: that = "" # there might not be any output yet
-        topic = self.getPredicate("topic", sessionID)
-        response = self._brain.star("thatstar", input, that, topic, index)
-        return response
+        # the wildcard spans were recorded when the input was matched
+        matchStack = self.getPredicate(self._matchStack, sessionID)
+        try: return matchStack[-1].star("thatstar", index)
+        except IndexError: return ""
 
     # <think>
     def _processThink(self,elem, sessionID):
@@ -1037,16 +1926,10 @@ class Kernel:
         """
         try: index = int(elem[1]['index'])
         except KeyError: index = 1
-        # fetch the user's last input
-        inputStack = self.getPredicate(self._inputStack, sessionID)
-        input = self._subbers['normal'].sub(inputStack[-1])
-        # fetch the Kernel's last response (for 'that' context)
-        outputHistory = self.getPredicate(self._outputHistory, sessionID)
-        try: that = self._subbers['normal'].sub(outputHistory[-1])
-        except: that = "" # there might not be any output yet
-        topic = self.getPredicate("topic", sessionID)
-        response = self._brain.star("topicstar", input, that, topic, index)
-        return response
+        # the wildcard spans were recorded when the input was matched
+        matchStack = self.getPredicate(self._matchStack, sessionID)
+        try: return matchStack[-1].star("topicstar", index)
+        except IndexError: return ""
 
     # <uppercase>
     def _processUppercase(self,elem, sessionID):
@@ -1073,6 +1956,50 @@ class Kernel:
         return self.version()
 
 
+# learn() parses AIML files in worker processes with this function, so
+# it's a module function rather than a method.
+def _parseAimlFile(filename, encoding, customElements, parser = ("sax", "strict")):
+    """Parse the AIML file filename and return a (categories,
+    numErrors) pair.  categories is a dictionary mapping (pattern, that,
+    topic) tuples to templates, or None if the file couldn't be parsed,
+    and numErrors is the number of AIML errors found in the file.
+    customElements is a list of (name, (required, optional,
+    canBeParent)) tuples of the elements added with
+    Kernel.addElementProcessor().  parser is the (parser, validation)
+    pair set with Kernel.setAimlParser().
+
+    """
+    # Load and parse the AIML file.
+    parser, validation = parser
+    if parser == "expat":
+        handler = AimlParser.AimlExpatHandler(encoding, validation)
+        parse = handler.parse
+    else:
+        saxParser = AimlParser.create_parser()
+        handler = saxParser.getContentHandler()
+        handler.setEncoding(encoding)
+        parse = saxParser.parse
+    for name,info in customElements:
+        handler.addElement(name, *info)
+    try: parse(filename)
+    except xml.sax.SAXParseException as msg:
+        err = "\nFATAL PARSE ERROR in file %s:\n%s\n" % (filename,msg)
+        sys.stderr.write(err)
+        return None, handler.getNumErrors()
+    return handler.categories, handler.getNumErrors()
+
+def _parseAimlFileMarshalled(filename, encoding, customElements, parser):
+    """Return the result of _parseAimlFile() with the categories
+    marshalled, which is quicker to pass back from a worker process
+    than the pickle of the dictionary.
+
+    """
+    categories, numErrors = _parseAimlFile(filename, encoding, customElements, parser)
+    if categories is None:
+        return None, numErrors
+    return marshal.dumps(categories), numErrors
+
+
 ##################################################
 ### Self-test functions follow                 ###
 ##################################################
@@ -1084,7 +2011,7 @@ def _testTag(kern, tag, input, outputList):
     global _numTests, _numPassed
     _numTests += 1
     print("Testing <" + tag + ">:", end=' ')
-    response = kern.respond(input).decode(kern._textEncoding)
+    response = kern.respond(input)
     if response in outputList:
         print("PASSED")
         _numPassed += 1
@@ -1093,6 +2020,164 @@ def _testTag(kern, tag, input, outputList):
         print("FAILED (response: '%s')" % response)
         return False
 
+def _testCase(name, failure):
+    """Report the outcome of a test that has been run already: it
+    passed if failure is None, otherwise failure tells what went wrong.
+
+    """
+    global _numTests, _numPassed
+    _numTests += 1
+    print("Testing " + name + ":", end=' ')
+    if failure is None:
+        print("PASSED")
+        _numPassed += 1
+        return True
+    else:
+        print("FAILED (%s)" % failure)
+        return False
+
+def _testInputs(brain, count, seed = 0):
+    """Return count random (input, that, topic) triples.  Most of them
+    follow a random path through the patterns of brain, with some words
+    filled in for every wildcard, so that they match all kinds of
+    categories; the others are made of random words.
+
+    """
+    rnd = random.Random(seed)
+    root = brain._tree()
+    words = set(["unknown", "words"])
+    nodes = [root]
+    while nodes:
+        node = nodes.pop()
+        for key, child in node.items():
+            if isinstance(key, str):
+                words.add(key.lower())
+            if key != brain._TEMPLATE:
+                nodes.append(child)
+    words = sorted(words)
+    def filler(minLength, maxLength):
+        return [rnd.choice(words) for i in range(rnd.randint(minLength, maxLength))]
+    inputs = []
+    for i in range(count):
+        if rnd.random() < 0.2:
+            inputs.append((" ".join(filler(1, 8)), " ".join(filler(0, 4)), " ".join(filler(0, 2))))
+            continue
+        parts = [[], [], []]
+        part = 0
+        node = root
+        while True:
+            keys = [key for key in node if key != brain._TEMPLATE]
+            if not keys:
+                break
+            key = rnd.choice(keys)
+            if key == brain._THAT:
+                part = 1
+            elif key == brain._TOPIC:
+                part = 2
+            elif key in (brain._STAR, brain._UNDERSCORE):
+                parts[part].extend(filler(1, 3))
+            elif key == brain._BOT_NAME:
+                parts[part].append(brain._botName)
+            else:
+                parts[part].append(key.lower())
+            node = node[key]
+        inputs.append(tuple(" ".join(words) for words in parts))
+    return inputs
+
+def _matchSummary(brain, input, that, topic):
+    """Return the template matched by input, that and topic in brain,
+    and the words matched by its first three wildcards of every kind.
+
+    """
+    match = brain.match(input, that, topic)
+    if match is None:
+        return None
+    return (match.template, [match.star(starType, index)
+                             for starType in match.starTypes for index in range(1, 4)])
+
+def _testStars(name, compiled):
+    """Test the words recorded for the wildcards of a match against
+    known answers, with a node tree brain, or a compiled one if
+    compiled is True.
+
+    """
+    brain = PatternMgr()
+    brain.setBotName("ROBO")
+    brain.add(("_ LIKES * AND *", "I SAID *", "* FOOD"), ["template", {}, ["text", {}, "1"]])
+    brain.add(("HELLO BOT_NAME *", "*", "_"), ["template", {}, ["text", {}, "2"]])
+    brain.add(("* IS * *", "_ _", "*"), ["template", {}, ["text", {}, "3"]])
+    brain.add(("*", "*", "*"), ["template", {}, ["text", {}, "4"]])
+    if compiled:
+        brain.compile()
+    cases = [
+        (("My dog likes big bones and cats!", "I said hello there", "junk food"),
+         ["My dog", "big bones", "cats!", "hello there", "", "", "junk", "", ""]),
+        (("Hello robo, how are you?", "Hi there", "Soylent Green"),
+         ["how are you?", "", "", "Hi there", "", "", "Soylent Green", "", ""]),
+        (("The sky is very blue", "You know", "weather"),
+         ["The sky", "very", "blue", "You", "know", "", "weather", "", ""]),
+        (("Nothing special", "Well.", "smalltalk"),
+         ["Nothing special", "", "", "Well.", "", "", "smalltalk", "", ""]),
+    ]
+    failure = None
+    for (input, that, topic), stars in cases:
+        if _matchSummary(brain, input, that, topic)[1] != stars:
+            failure = "stars of '%s': %s" % (input, _matchSummary(brain, input, that, topic)[1])
+            break
+    return _testCase(name, failure)
+
+def _testMatchers(name, brain, reference, inputs):
+    """Test that brain matches the inputs like the reference brain
+    does, with the same templates and the same stars.
+
+    """
+    failure = None
+    for input, that, topic in inputs:
+        expected = _matchSummary(reference, input, that, topic)
+        if _matchSummary(brain, input, that, topic) != expected:
+            failure = "input '%s', that '%s', topic '%s'" % (input, that, topic)
+            break
+    return _testCase(name, failure)
+
+def _responses(kern, sessionID, inputs):
+    """Return the responses of kern to the inputs, in a conversation
+    of the specified session, whose topic is set to the topic of every
+    input first.  The random generator is seeded before every input, so
+    that <random> elements pick the same items on every run.
+
+    """
+    responses = []
+    for i, (input, that, topic) in enumerate(inputs):
+        kern.setPredicate("topic", topic, sessionID)
+        random.seed(i)
+        responses.append(kern.respond(input, sessionID))
+    return responses
+
+def _stepResponses(kern, steps):
+    """Return the responses of kern to the inputs among steps, in the
+    global session.  The other steps are functions, which are called
+    with kern, e.g. to change its settings.  The random generator is
+    seeded before every step.
+
+    """
+    responses = []
+    for i, step in enumerate(steps):
+        random.seed(i)
+        if isinstance(step, str):
+            responses.append(kern.respond(step))
+        else:
+            step(kern)
+    return responses
+
+def _testResponses(name, responses, reference, inputs):
+    """Test that the responses to the inputs are the reference ones."""
+    failure = None
+    for input, response, expected in zip(inputs, responses, reference):
+        if response != expected:
+            failure = "input '%s': '%s' instead of '%s'" % (input[0], response, expected)
+            break
+    return _testCase(name, failure)
+
 if __name__ == "__main__":
     # Run some self-tests
     k = Kernel()
@@ -1170,6 +2255,157 @@ if __name__ == "__main__":
     _testTag(k, 'version', 'test version', ["PyAIML is version %s" % k.version()])
     _testTag(k, 'whitespace preservation', 'test whitespace', ["Extra   Spaces\n   Rule!   (but not in here!)    But   Here   They   Do!"])
 
+    # The sessions move to a new store, where the global session is
+    # never evicted.
+    k.setPredicate("food", "beans", "visitor")
+    k.setSessionStore(SessionStore(maxSessions = 2))
+    failure = None
+    if k.getPredicate("food", "visitor") != "beans":
+        failure = "predicate not moved"
+    k.respond("test think", "newcomer")
+    if failure is None and ("visitor" in k.sessionStore() or k.getPredicate("topic") != "Soylent Ham and Cheese"):
+        failure = "sessions %s after eviction" % sorted(k.sessionStore().ids())
+    _testCase('session store migration', failure)
+
+    # Kernels sharing a session database must each see the responses
+    # of the other in the sessions they've loaded already.
+    import shutil
+    import tempfile
+    from .SessionStore import SqliteSessionStore
+    tempDir = tempfile.mkdtemp()
+    try:
+        sessionsFile = os.path.join(tempDir, "sessions.db")
+        other = Kernel()
+        other.verbose(False)
+        other.learn("self-test.aiml")
+        other.setSessionStore(SqliteSessionStore(sessionsFile))
+        k.setSessionStore(SqliteSessionStore(sessionsFile))
+        responses = [kern.respond("test thatstar", "shared") for kern in (k, other, k)]
+        expected = ["I say beans", "I just said \"beans\"", "I say beans"]
+        failure = None
+        if responses != expected:
+            failure = "responses %s" % responses
+        elif "newcomer" not in other.sessionStore():
+            failure = "sessions not moved to the database"
+        _testCase('shared session store', failure)
+        k.sessionStore().close()
+        other.sessionStore().close()
+    finally:
+        shutil.rmtree(tempDir)
+
+    # reload() must take the files back as learn() took them, although
+    # some of the standard AIML set has errors.
+    everything = Kernel()
+    everything.verbose(False)
+    everything.learn(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "standard", "*.aiml"))
+    numCategories = everything.numCategories()
+    failure = None
+    if not everything.reload():
+        failure = "reload failed"
+    elif everything.numCategories() != numCategories:
+        failure = "%d categories instead of %d" % (everything.numCategories(), numCategories)
+    _testCase('reload', failure)
+    del everything
+
+    # The response cache must never answer with a response the Kernel
+    # wouldn't give without it: not after the bot predicates or the
+    # brain change, nor for templates that read or change the session or
+    # pick at random, even through an <srai>, nor for another that or
+    # topic.
+    tempDir = tempfile.mkdtemp()
+    try:
+        first = os.path.join(tempDir, "first.aiml")
+        second = os.path.join(tempDir, "second.aiml")
+        def write(filename, categories):
+            with open(filename, "w") as f:
+                f.write('<aiml version="1.0.1">%s</aiml>' % categories)
+        write(first,
+              '<category><pattern>HELLO</pattern><template>I am <bot name="name"/>.</template></category>'
+              '<category><pattern>FLIP</pattern><template><random><li>heads</li><li>tails</li>'
+              '<li>edge</li></random></template></category>'
+              '<category><pattern>REMEMBER *</pattern><template>Sure.<think><set name="thing"><star/></set>'
+              '</think></template></category>'
+              '<category><pattern>RECALL</pattern><template>You said <get name="thing"/>.</template></category>'
+              '<category><pattern>WHAT DID I SAY</pattern><template><srai>RECALL</srai></template></category>'
+              '<category><pattern>ASK</pattern><template>Do you like cheese?</template></category>'
+              '<category><pattern>YES</pattern><template>Yes what?</template></category>'
+              '<category><pattern>YES</pattern><that>DO YOU LIKE CHEESE</that><template>Me too.</template></category>'
+              '<category><pattern>TOPIC</pattern><template>Nothing much.</template></category>'
+              '<topic name="FRUIT"><category><pattern>TOPIC</pattern><template>Fruit.</template></category></topic>'
+              '<category><pattern>CHANGE</pattern><template>Old answer.</template></category>')
+        def rewrite(kern):
+            write(second, '<category><pattern>CHANGE</pattern><template>Newer answer.</template></category>')
+            kern.reload()
+        # the responses are cached by input, that and topic, so the
+        # inputs are repeated after the same responses.
+        steps = ["hello", "hello", "hello", lambda kern: kern.setBotPredicate("name", "Robo"), "hello",
+                 "flip", "flip", "flip", "flip", "flip", "flip", "flip", "flip",
+                 "remember apples", "what did i say", "remember pears", "what did i say", "recall",
+                 "yes", "ask", "yes", "ask", "yes",
+                 lambda kern: kern.setPredicate("topic", "fruit"), "topic", "topic",
+                 lambda kern: kern.setPredicate("topic", ""), "topic",
+                 "change", "change", "change", lambda kern: kern.learn(second), "change", "change",
+                 rewrite, "change"]
+        responses = {}
+        for maxEntries in (0, 100):
+            write(second, '<category><pattern>CHANGE</pattern><template>New answer.</template></category>')
+            kern = Kernel()
+            kern.verbose(False)
+            kern.learn(first)
+            kern.setResponseCache(maxEntries)
+            responses[maxEntries] = _stepResponses(kern, steps)
+        failure = None
+        for cached, uncached in zip(responses[100], responses[0]):
+            if cached != uncached:
+                failure = "'%s' instead of '%s'" % (cached, uncached)
+                break
+        if failure is None and kern.responseCache().stats()["hits"] == 0:
+            failure = "no response was cached"
+        _testCase('response cache', failure)
+    finally:
+        shutil.rmtree(tempDir)
+
+    # The faster ways of matching and responding must give the same
+    # results as the node tree and the template interpreter, on the
+    # standard AIML set.
+    _testStars('star spans, node tree', False)
+    _testStars('star spans, compiled matcher', True)
+
+    standard = Kernel()
+    standard.verbose(False)
+    standard.learn(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "standard", "std-*.aiml"))
+    for name, kern in (("self-test", k), ("standard", standard)):
+        inputs = _testInputs(kern._brain, 2000)
+        compiledBrain = kern._brain.copy()
+        compiledBrain.compile()
+        _testMatchers('compiled matcher, %s AIML' % name, compiledBrain, kern._brain, inputs)
+
+    # the compiled templates must render like the interpreter; the
+    # response cache would answer repeated inputs without rendering them
+    standard.setResponseCache(0)
+    standard.compileTemplates(False)
+    interpreted = _responses(standard, "interpreted", inputs)
+    standard.compileTemplates(True)
+    _testResponses('compiled templates', _responses(standard, "compiled", inputs), interpreted, inputs)
+
+    # a brain snapshot must match and respond like the brain it was
+    # saved from, although it's memory-mapped and loads the templates
+    # as they're matched
+    fd, snapshotFile = tempfile.mkstemp(".brn")
+    os.close(fd)
+    try:
+        standard.saveBrain(snapshotFile)
+        snapshot = Kernel()
+        snapshot.verbose(False)
+        snapshot.loadBrain(snapshotFile)
+        snapshot.setResponseCache(0)
+        _testMatchers('brain snapshot matcher', snapshot._brain, standard._brain, inputs)
+        _testResponses('brain snapshot responses', _responses(snapshot, "snapshot", inputs), interpreted, inputs)
+        # unmap the snapshot before it's removed
+        del snapshot
+    finally:
+        os.remove(snapshotFile)
+
     # Report test results
     print("--------------------")
     if _numTests == _numPassed:
@@ -2,6 +2,8 @@
 # by Dr. Richard Wallace at the following site:
 # http://www.alicebot.org/documentation/matching.html
 
+from .CompiledMatcher import CompiledMatcher
+
 import marshal
 import pprint
 import re
@@ -16,14 +18,21 @@ class PatternMgr:
 	_THAT       = 3
 	_TOPIC		= 4
 	_BOT_NAME   = 5
+
+	# the tokens matched instead of an empty that or topic
+	_DUMMY_THAT  = (["ULTRABOGUSDUMMYTHAT"], ["ULTRABOGUSDUMMYTHAT"])
+	_DUMMY_TOPIC = (["ULTRABOGUSDUMMYTOPIC"], ["ULTRABOGUSDUMMYTOPIC"])
 	
 	def __init__(self):
 		self._root = {}
+		# the ids of the nodes add() may change, if some nodes are shared
+		# with a copy(); None if all of them may be changed
+		self._owned = None
+		self._compiled = None
 		self._templateCount = 0
 		self._botName = "Nameless"
 		punctuation = "\"`~!@#$%^&*()-_=+[{]}\|;:',<.>/?"
 		self._puncStripRE = re.compile("[" + re.escape(punctuation) + "]")
-		self._whitespaceRE = re.compile("\s+", re.LOCALE | re.UNICODE)
 
 	def numTemplates(self):
 		"""Return the number of templates currently stored."""
@@ -37,43 +46,130 @@ class PatternMgr:
 		# Collapse a multi-word name into a single word
 		self._botName = str(' '.join(name.split()))
 
+	def compile(self, enabled = True):
+		"""Build a CompiledMatcher from the current patterns, unless
+		there is one already.  Until the next call to add() or restore(),
+		match() and star() use it instead of walking the node tree.  If
+		enabled is False, the compiled matcher is dropped instead.
+
+		"""
+		if enabled:
+			if self._compiled is None:
+				self._compiled = CompiledMatcher(self._root, PatternMgr)
+		else:
+			self._root = self._tree()
+			self._compiled = None
+
+	def isCompiled(self):
+		"""Return True if match() and star() use a compiled matcher."""
+		return self._compiled is not None
+
+	def isSnapshot(self):
+		"""Return True if the patterns are read straight from a snapshot
+		restore()d from a file, whose templates are only loaded once
+		they are matched.
+
+		"""
+		return self._root is None
+
+	def templates(self):
+		"""Return a list of all templates in the node tree."""
+		if self._root is None:
+			return self._compiled.templates()
+		templates = []
+		nodes = [self._root]
+		while nodes:
+			node = nodes.pop()
+			for key, child in node.items():
+				if key == self._TEMPLATE:
+					templates.append(child)
+				else:
+					nodes.append(child)
+		return templates
+
 	def dump(self):
 		"""Print all learned patterns, for debugging purposes."""
-		pprint.pprint(self._root)
+		pprint.pprint(self._tree())
 
 	def save(self, filename):
-		"""Dump the current patterns to the file specified by filename.  To
-		restore later, use restore().
+		"""Dump the current patterns to the file specified by filename,
+		as a brain snapshot (see CompiledMatcher.save()).  To restore
+		later, use restore().
 
 		"""
 		try:
+			matcher = self._compiled
+			if matcher is None:
+				matcher = CompiledMatcher(self._root, PatternMgr)
 			outFile = open(filename, "wb")
-			marshal.dump(self._templateCount, outFile)
-			marshal.dump(self._botName, outFile)
-			marshal.dump(self._root, outFile)
+			matcher.save(outFile, {"templateCount": self._templateCount, "botName": self._botName})
 			outFile.close()
 		except Exception as e:
 			print("Error saving PatternMgr to file %s:" % filename)
 			raise Exception(e)
 
 	def restore(self, filename):
-		"""Restore a previously save()d collection of patterns."""
+		"""Restore a previously save()d collection of patterns.
+
+		A brain snapshot is memory-mapped, and used as the compiled
+		matcher; the node tree is only rebuilt from it when add() needs
+		it.  Files saved by older versions, which marshalled the node
+		tree, are read into a node tree.
+
+		"""
 		try:
 			inFile = open(filename, "rb")
-			self._templateCount = marshal.load(inFile)
-			self._botName = marshal.load(inFile)
-			self._root = marshal.load(inFile)
+			if CompiledMatcher.isSnapshot(inFile):
+				self._compiled, info = CompiledMatcher.load(inFile, PatternMgr)
+				self._templateCount = info["templateCount"]
+				self._botName = info["botName"]
+				self._root = None
+				self._owned = None
+			else:
+				self._templateCount = marshal.load(inFile)
+				self._botName = marshal.load(inFile)
+				self._root = marshal.load(inFile)
+				self._owned = None
+				self._compiled = None
 			inFile.close()
 		except Exception as e:
 			print("Error restoring PatternMgr from file %s:" % filename)
 			raise Exception(e)
 
+	def copy(self):
+		"""Return a copy of this PatternMgr whose node tree can be changed
+		with add() without touching this one.  The templates themselves
+		are shared, they are never changed after they've been added.
+
+		The copy takes no time: the two share their nodes, and add()
+		copies the ones it changes on the way (see _child()), so that
+		learning a few categories into a copy of a big brain only copies
+		the nodes along their patterns.  The compiled matcher is shared
+		too, until add() drops it.
+
+		"""
+		other = PatternMgr()
+		other._templateCount = self._templateCount
+		other._botName = self._botName
+		other._compiled = self._compiled
+		other._root = self._root
+		if self._root is not None:
+			# a tree rebuilt from a snapshot is a copy already, but the
+			# nodes of a node tree are shared from now on
+			other._root = dict(self._root)
+			other._owned = set([id(other._root)])
+			self._owned = set([id(self._root)])
+		return other
+
 	def add(self, xxx_todo_changeme, template):
 		"""Add a [pattern/that/topic] tuple and its corresponding template
 		to the node tree.
 
 		"""
 		(pattern,that,topic) = xxx_todo_changeme
+		# the compiled matcher doesn't know about the new pattern
+		self._root = self._tree()
+		self._compiled = None
 		node = self._root
 		for word in pattern.split():
 			key = word
@@ -83,39 +179,29 @@ class PatternMgr:
 				key = self._STAR
 			elif key == "BOT_NAME":
 				key = self._BOT_NAME
-			if key not in node:
-				node[key] = {}
-			node = node[key]
+			node = self._child(node, key)
 
 		# navigate further down, if a non-empty "that" pattern was included
 		if len(that) > 0:
-			if self._THAT not in node:
-				node[self._THAT] = {}
-			node = node[self._THAT]
+			node = self._child(node, self._THAT)
 			for word in that.split():
 				key = word
 				if key == "_":
 					key = self._UNDERSCORE
 				elif key == "*":
 					key = self._STAR
-				if key not in node:
-					node[key] = {}
-				node = node[key]
+				node = self._child(node, key)
 
 		# navigate yet further down, if a non-empty "topic" string was included
 		if len(topic) > 0:
-			if self._TOPIC not in node:
-				node[self._TOPIC] = {}
-			node = node[self._TOPIC]
+			node = self._child(node, self._TOPIC)
 			for word in topic.split():
 				key = word
 				if key == "_":
 					key = self._UNDERSCORE
 				elif key == "*":
 					key = self._STAR
-				if key not in node:
-					node[key] = {}
-				node = node[key]
+				node = self._child(node, key)
 
 
 		# add the template.
@@ -123,31 +209,61 @@ class PatternMgr:
 			self._templateCount += 1	
 		node[self._TEMPLATE] = template
 
+	def _child(self, node, key):
+		"""Return the child of node under key for add() to change: a new
+		node if there is none, or a copy of it if it's shared with
+		another PatternMgr.  node must be one that add() may change.
+
+		"""
+		child = node.get(key)
+		if child is None:
+			child = node[key] = {}
+		elif self._owned is None or id(child) in self._owned:
+			return child
+		else:
+			child = node[key] = dict(child)
+		if self._owned is not None:
+			self._owned.add(id(child))
+		return child
+
 	def match(self, pattern, that, topic):
-		"""Return the template which is the closest match to pattern. The
-		'that' parameter contains the bot's previous response. The 'topic'
-		parameter contains the current topic of conversation.
+		"""Return a MatchResult for the template which is the closest
+		match to pattern. The 'that' parameter contains the bot's previous
+		response. The 'topic' parameter contains the current topic of
+		conversation.
 
 		Returns None if no template is found.
 		
 		"""
 		if len(pattern) == 0:
 			return None
+		return self.matchTokens(self.tokenize(pattern), self.tokenize(that), self.tokenize(topic))
+
+	def tokenize(self, text):
+		"""Return a tuple (words, keys) for the text: words is the list of
+		its words, which <star> elements return, and keys is the list of
+		words matched against the patterns, which are all caps and have
+		all punctuation removed.  The tokens of a that or topic which
+		doesn't change can be reused by matchTokens().
+
+		"""
 		# Mutilate the input.  Remove all punctuation and convert the
 		# text to all caps.
-		input = pattern.upper()
-		input = re.sub(self._puncStripRE, " ", input)
-		if that.strip() == "": that = "ULTRABOGUSDUMMYTHAT" # 'that' must never be empty
-		thatInput = that.upper()
-		thatInput = re.sub(self._puncStripRE, " ", thatInput)
-		thatInput = re.sub(self._whitespaceRE, " ", thatInput)
-		if topic.strip() == "": topic = "ULTRABOGUSDUMMYTOPIC" # 'topic' must never be empty
-		topicInput = topic.upper()
-		topicInput = re.sub(self._puncStripRE, " ", topicInput)
-		
+		keys = re.sub(self._puncStripRE, " ", text.upper()).split()
+		return (text.split(), keys)
+
+	def matchTokens(self, input, that, topic):
+		"""Return a MatchResult like match(), for the tokenize()d input,
+		that and topic.
+
+		"""
+		if len(that[0]) == 0: that = self._DUMMY_THAT # 'that' must never be empty
+		if len(topic[0]) == 0: topic = self._DUMMY_TOPIC # 'topic' must never be empty
 		# Pass the input off to the recursive call
-		patMatch, template = self._match(input.split(), thatInput.split(), topicInput.split(), self._root)
-		return template
+		patMatch, template = self._find(input[1], that[1], topic[1])
+		if template is None:
+			return None
+		return MatchResult(template, patMatch, input[0], that[0], topic[0])
 
 	def star(self, starType, pattern, that, topic, index):
 		"""Returns a string, the portion of pattern that was matched by a *.
@@ -158,95 +274,42 @@ class PatternMgr:
 		 - 'thatstar': matches a star in the that pattern.
 		 - 'topicstar': matches a star in the topic pattern.
 
+		This matches the input all over again; if you already have the
+		MatchResult of the input, use its star() method instead.
+
 		"""
-		# Mutilate the input.  Remove all punctuation and convert the
-		# text to all caps.
-		input = pattern.upper()
-		input = re.sub(self._puncStripRE, " ", input)
-		input = re.sub(self._whitespaceRE, " ", input)
-		if that.strip() == "": that = "ULTRABOGUSDUMMYTHAT" # 'that' must never be empty
-		thatInput = that.upper()
-		thatInput = re.sub(self._puncStripRE, " ", thatInput)
-		thatInput = re.sub(self._whitespaceRE, " ", thatInput)
-		if topic.strip() == "": topic = "ULTRABOGUSDUMMYTOPIC" # 'topic' must never be empty
-		topicInput = topic.upper()
-		topicInput = re.sub(self._puncStripRE, " ", topicInput)
-		topicInput = re.sub(self._whitespaceRE, " ", topicInput)
-
-		# Pass the input off to the recursive pattern-matcher
-		patMatch, template = self._match(input.split(), thatInput.split(), topicInput.split(), self._root)
-		if template == None:
+		if starType not in MatchResult.starTypes:
+			raise ValueError("starType must be in ['star', 'thatstar', 'topicstar']")
+		result = self.match(pattern, that, topic)
+		if result is None:
 			return ""
+		return result.star(starType, index)
 
-		# Extract the appropriate portion of the pattern, based on the
-		# starType argument.
-		words = None
-		if starType == 'star':
-			patMatch = patMatch[:patMatch.index(self._THAT)]
-			words = input.split()
-		elif starType == 'thatstar':
-			patMatch = patMatch[patMatch.index(self._THAT)+1 : patMatch.index(self._TOPIC)]
-			words = thatInput.split()
-		elif starType == 'topicstar':
-			patMatch = patMatch[patMatch.index(self._TOPIC)+1 :]
-			words = topicInput.split()
-		else:
-			# unknown value
-			raise ValueError("starType must be in ['star', 'thatstar', 'topicstar']")
-		
-		# compare the input string to the matched pattern, word by word.
-		# At the end of this loop, if foundTheRightStar is true, start and
-		# end will contain the start and end indices (in "words") of
-		# the substring that the desired star matched.
-		foundTheRightStar = False
-		start = end = j = numStars = k = 0
-		for i in range(len(words)):
-			# This condition is true after processing a star
-			# that ISN'T the one we're looking for.
-			if i < k:
-				continue
-			# If we're reached the end of the pattern, we're done.
-			if j == len(patMatch):
-				break
-			if not foundTheRightStar:
-				if patMatch[j] in [self._STAR, self._UNDERSCORE]: #we got a star
-					numStars += 1
-					if numStars == index:
-						# This is the star we care about.
-						foundTheRightStar = True
-					start = i
-					# Iterate through the rest of the string.
-					for k in range (i, len(words)):
-						# If the star is at the end of the pattern,
-						# we know exactly where it ends.
-						if j+1  == len (patMatch):
-							end = len (words)
-							break
-						# If the words have started matching the
-						# pattern again, the star has ended.
-						if patMatch[j+1] == words[k]:
-							end = k - 1
-							i = k
-							break
-				# If we just finished processing the star we cared
-				# about, we exit the loop early.
-				if foundTheRightStar:
-					break
-			# Move to the next element of the pattern.
-			j += 1
-			
-		# extract the star words from the original, unmutilated input.
-		if foundTheRightStar:
-			#print string.join(pattern.split()[start:end+1])
-			if starType == 'star': return ' '.join(pattern.split()[start:end+1])
-			elif starType == 'thatstar': return ' '.join(that.split()[start:end+1])
-			elif starType == 'topicstar': return ' '.join(topic.split()[start:end+1])
-		else: return ""
+	def _tree(self):
+		"""Return the node tree, rebuilt from the compiled matcher if
+		the patterns were restore()d from a snapshot.
+
+		"""
+		if self._root is None:
+			return self._compiled.tree()
+		return self._root
+
+	def _find(self, words, thatWords, topicWords):
+		"""Return the (pat, tem) tuple of _match() for the root node,
+		using the compiled matcher if there is an up-to-date one.
+
+		"""
+		compiled = self._compiled
+		if compiled is not None:
+			return compiled.match(words, thatWords, topicWords, self._botName)
+		return self._match(words, thatWords, topicWords, self._root)
 
 	def _match(self, words, thatWords, topicWords, root):
-		"""Return a tuple (pat, tem) where pat is a list of nodes, starting
-		at the root and leading to the matching pattern, and tem is the
-		matched template.
+		"""Return a tuple (pat, tem) where pat is a list of (key, number
+		of words) pairs, one for each node starting at the root and
+		leading to the matching pattern, and tem is the matched template.
+		The number of words is the number of input words matched by the
+		node's key, 0 for the _THAT and _TOPIC nodes.
 
 		""" 
 		# base-case: if the word list is empty, return the current node's
@@ -261,7 +324,7 @@ class PatternMgr:
 				try:
 					pattern, template = self._match(thatWords, [], topicWords, root[self._THAT])
 					if pattern != None:
-						pattern = [self._THAT] + pattern
+						pattern = [(self._THAT, 0)] + pattern
 				except KeyError:
 					pattern = []
 					template = None
@@ -271,7 +334,7 @@ class PatternMgr:
 				try:
 					pattern, template = self._match(topicWords, [], [], root[self._TOPIC])
 					if pattern != None:
-						pattern = [self._TOPIC] + pattern
+						pattern = [(self._TOPIC, 0)] + pattern
 				except KeyError:
 					pattern = []
 					template = None
@@ -295,21 +358,21 @@ class PatternMgr:
 				suf = suffix[j:]
 				pattern, template = self._match(suf, thatWords, topicWords, root[self._UNDERSCORE])
 				if template is not None:
-					newPattern = [self._UNDERSCORE] + pattern
+					newPattern = [(self._UNDERSCORE, j+1)] + pattern
 					return (newPattern, template)
 
 		# Check first
 		if first in root:
 			pattern, template = self._match(suffix, thatWords, topicWords, root[first])
 			if template is not None:
-				newPattern = [first] + pattern
+				newPattern = [(first, 1)] + pattern
 				return (newPattern, template)
 
 		# check bot name
 		if self._BOT_NAME in root and first == self._botName:
 			pattern, template = self._match(suffix, thatWords, topicWords, root[self._BOT_NAME])
 			if template is not None:
-				newPattern = [first] + pattern
+				newPattern = [(first, 1)] + pattern
 				return (newPattern, template)
 		
 		# check star
@@ -320,8 +383,53 @@ class PatternMgr:
 				suf = suffix[j:]
 				pattern, template = self._match(suf, thatWords, topicWords, root[self._STAR])
 				if template is not None:
-					newPattern = [self._STAR] + pattern
+					newPattern = [(self._STAR, j+1)] + pattern
 					return (newPattern, template)
 
 		# No matches were found.
 		return (None, None)			
+
+
+class MatchResult:
+	"""The outcome of PatternMgr.match(): the matched template, and the
+	words of the input, that and topic matched by each wildcard of its
+	category, recorded while matching.
+
+	"""
+	starTypes = ['star', 'thatstar', 'topicstar']
+
+	def __init__(self, template, path, words, thatWords, topicWords):
+		"""Record the wildcard spans of a match.  The path argument is
+		the (key, number of words) list returned by PatternMgr._match(),
+		the other arguments are the template and the original words that
+		the stars are taken from.
+
+		"""
+		self.template = template
+		self._words = dict(zip(self.starTypes, (words, thatWords, topicWords)))
+		self._spans = dict((starType, []) for starType in self.starTypes)
+		starType = 'star'
+		pos = 0
+		for (key, count) in path:
+			if key == PatternMgr._THAT:
+				starType, pos = 'thatstar', 0
+			elif key == PatternMgr._TOPIC:
+				starType, pos = 'topicstar', 0
+			else:
+				if key in [PatternMgr._STAR, PatternMgr._UNDERSCORE]:
+					self._spans[starType].append((pos, pos + count))
+				pos += count
+
+	def star(self, starType, index):
+		"""Return the words matched by the index'th (starting at 1)
+		wildcard of the pattern ('star'), the that pattern ('thatstar')
+		or the topic pattern ('topicstar'), or "" if there's no such
+		wildcard.
+
+		"""
+		if starType not in self._spans:
+			raise ValueError("starType must be in ['star', 'thatstar', 'topicstar']")
+		if not 1 <= index <= len(self._spans[starType]):
+			return ""
+		start, end = self._spans[starType][index-1]
+		return ' '.join(self._words[starType][start:end])
@@ -0,0 +1,112 @@
+"""This file contains the ResponseCache of the Kernel.  See
+Kernel.setResponseCache().
+
+Many categories respond with the same text whenever the same input,
+that and topic match them: their templates use no element that reads or
+changes a session, like <get>, <set> or <condition>, nor one whose
+result changes by itself, like <random> or <date>.  The Kernel finds
+these templates when it learns them, and keeps their responses in a
+ResponseCache, keyed by the normalized input, that and topic.  Matching
+such an input again, by itself or through an <srai>, is then a single
+dictionary lookup.
+
+"""
+
+import collections
+import sys
+import threading
+
+class ResponseCache:
+    """A bounded cache of responses, keyed by the (input, that, topic)
+    triples they respond to.  The least recently used responses are
+    dropped to make room for new ones.
+
+    Every response is stored along with the brain it was found in, and
+    only returned for the same brain, so that a response being stored
+    while a new brain is swapped in is never used with it.
+
+    """
+    def __init__(self, maxEntries = 10000):
+        self._maxEntries = maxEntries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stored = 0
+        self._evicted = 0
+        self._uncacheable = 0
+
+    def get(self, key, brain):
+        """Return the response to key found in brain, or None if it
+        isn't cached.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not brain:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key, brain, response):
+        """Store the response to key found in brain, dropping the least
+        recently used responses beyond the size of the cache.
+
+        """
+        with self._lock:
+            self._entries[key] = (brain, response)
+            self._entries.move_to_end(key)
+            self._stored += 1
+            while len(self._entries) > self._maxEntries:
+                self._entries.popitem(last = False)
+                self._evicted += 1
+
+    def skip(self):
+        """Count a response that couldn't be cached."""
+        with self._lock:
+            self._uncacheable += 1
+
+    def clear(self):
+        """Drop all responses, e.g. because the brain or the bot
+        predicates changed.  The statistics are kept.
+
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return a dictionary with the number of responses stored, the
+        numbers of hits and misses and the hit rate of the lookups so
+        far, the numbers of responses stored, evicted and not stored
+        because they weren't cacheable, and an estimate of the memory
+        used by the cache, in bytes.
+
+        The memory estimate walks through all responses, so it takes
+        time in proportion to their number.
+
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRate": float(self._hits) / lookups if lookups else 0.0,
+                "stored": self._stored,
+                "evicted": self._evicted,
+                "uncacheable": self._uncacheable,
+                "bytes": sys.getsizeof(self._entries) + sum(self._sizeOf(key, entry) for key, entry in self._entries.items()),
+            }
+
+    def _sizeOf(self, key, entry):
+        """Estimate the number of bytes used by an entry of the cache,
+        apart from the brain it refers to.
+
+        """
+        return (sys.getsizeof(key) + sum(sys.getsizeof(text) for text in key)
+                + sys.getsizeof(entry) + sys.getsizeof(entry[1]))
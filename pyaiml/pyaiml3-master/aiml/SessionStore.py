@@ -0,0 +1,685 @@
+"""This file contains the stores that keep the sessions of the Kernel.
+See Kernel.setSessionStore().
+
+A SessionStore maps session IDs to the predicates of the sessions.  It
+can be limited to a number of sessions, the least recently used of which
+are evicted to make room for new ones, and it can expire the sessions
+that have been idle for too long.  Sessions that are responding are
+never evicted.
+
+SqliteSessionStore keeps the sessions in an SQLite database as well, so
+that several Kernels, in one process or in many, can serve the same
+sessions.
+
+A session is a dictionary by default.  Compact stores keep the reserved
+predicates of the Kernel in the slots of a Session object instead, which
+saves the hash table of the dictionary.  Only the other predicates go in
+a dictionary, which isn't created until the first one is set.
+
+"""
+
+import collections
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+class Session:
+    """The predicates of a session, with the reserved predicates of the
+    Kernel in slots.
+
+    A Session behaves like the dictionary it replaces, as far as the
+    Kernel is concerned: predicates are read and written with [], and
+    items() lists them all.
+
+    """
+    __slots__ = ("_inputHistory", "_outputHistory", "_inputStack", "_matchStack", "_predicates")
+
+    # the reserved predicates, which are kept in the slots of the same names
+    _reserved = ("_inputHistory", "_outputHistory", "_inputStack", "_matchStack")
+
+    def __init__(self):
+        self._inputHistory = []
+        self._outputHistory = []
+        self._inputStack = []
+        self._matchStack = []
+        self._predicates = None
+
+    def __getitem__(self, name):
+        if name in self._reserved:
+            return getattr(self, name)
+        if self._predicates is None:
+            raise KeyError(name)
+        return self._predicates[name]
+
+    def __setitem__(self, name, value):
+        if name in self._reserved:
+            setattr(self, name, value)
+        else:
+            if self._predicates is None:
+                self._predicates = {}
+            self._predicates[name] = value
+
+    def __contains__(self, name):
+        return name in self._reserved or (self._predicates is not None and name in self._predicates)
+
+    def items(self):
+        """Return a list of (name, value) tuples of all predicates."""
+        items = [(name, getattr(self, name)) for name in self._reserved]
+        if self._predicates is not None:
+            items.extend(self._predicates.items())
+        return items
+
+
+class SessionStore:
+    """Keep the sessions of a Kernel in memory.
+
+    The Kernel calls the methods which may evict sessions (create(),
+    load(), acquire(), release() and expire()) with its own session lock
+    held.  Evicted sessions are reported to the handler set with
+    setEvictionHandler(), which is called with the ID of the session.
+
+    Subclasses that keep the sessions somewhere else as well are told
+    about changed sessions by changed() and release(), and get to write
+    them out in commit(), which the Kernel calls after every response.
+
+    """
+    def __init__(self, maxSessions = None, ttl = None, compact = False):
+        """maxSessions is the number of sessions kept, None for no
+        limit.  ttl is the number of seconds a session may be idle
+        before it expires, None for no limit.  If compact is True, the
+        sessions are Session objects instead of dictionaries.
+
+        """
+        self._maxSessions = maxSessions
+        self._ttl = ttl
+        self._compact = compact
+        self._lock = threading.RLock()
+        # least recently used first
+        self._sessions = collections.OrderedDict()
+        self._lastUsed = {}
+        self._users = {}
+        self._kept = set()
+        self._evictionHandler = None
+        self._created = 0
+        self._evicted = 0
+        self._expired = 0
+
+    def setEvictionHandler(self, handler):
+        """Call handler(sessionID) for every session that is evicted or
+        expires.
+
+        """
+        self._evictionHandler = handler
+
+    def newSession(self):
+        """Return a new, empty session, without storing it."""
+        if self._compact:
+            return Session()
+        return {
+            # Initialize the special reserved predicates
+            "_inputHistory": [],
+            "_outputHistory": [],
+            "_inputStack": [],
+            "_matchStack": []
+        }
+
+    def create(self, sessionID):
+        """Create and return the session sessionID, replacing any session
+        of that ID.
+
+        """
+        with self._lock:
+            session = self.newSession()
+            self._store(sessionID, session)
+            self._created += 1
+            return session
+
+    def get(self, sessionID):
+        """Return the session sessionID, or None if there is no such
+        session in memory.
+
+        """
+        return self._sessions.get(sessionID)
+
+    def load(self, sessionID):
+        """Return the session sessionID, or None if there is no such
+        session.  Unlike get(), this looks for sessions that aren't in
+        memory, too.
+
+        """
+        return self._sessions.get(sessionID)
+
+    def changed(self, sessionID, session):
+        """Note that a predicate of session has been set."""
+        pass
+
+    def commit(self):
+        """Write the changed sessions that are due to be written.  The
+        Kernel calls this after every response, without holding any
+        locks.
+
+        """
+        pass
+
+    def delete(self, sessionID):
+        """Remove the session sessionID, if there is one."""
+        with self._lock:
+            self._drop(sessionID)
+
+    def acquire(self, sessionID):
+        """Mark the session sessionID as used until the matching call
+        to release().  A session in use is never evicted.
+
+        """
+        with self._lock:
+            self._users[sessionID] = self._users.get(sessionID, 0) + 1
+            if sessionID in self._sessions:
+                self._touch(sessionID)
+
+    def keep(self, sessionID):
+        """Never evict the session sessionID."""
+        with self._lock:
+            self._kept.add(sessionID)
+
+    def release(self, sessionID):
+        """Undo acquire()."""
+        with self._lock:
+            users = self._users.get(sessionID, 0) - 1
+            if users > 0:
+                self._users[sessionID] = users
+            else:
+                self._users.pop(sessionID, None)
+            if sessionID in self._sessions:
+                self._touch(sessionID)
+
+    def expire(self):
+        """Evict the sessions that have been idle for longer than the
+        ttl, and return how many there were.
+
+        """
+        with self._lock:
+            expired = self._expired
+            self._expire(time.time())
+            return self._expired - expired
+
+    def ids(self):
+        """Return a list of the IDs of all sessions."""
+        return list(self._sessions.keys())
+
+    def __contains__(self, sessionID):
+        return sessionID in self._sessions
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def stats(self):
+        """Return a dictionary with the number of sessions stored and in
+        use, the numbers of sessions created, evicted and expired so
+        far, and an estimate of the memory used by the sessions, in
+        bytes.
+
+        The memory estimate walks through all sessions, so it takes time
+        in proportion to their number.
+
+        """
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "inUse": len(self._users),
+                "created": self._created,
+                "evicted": self._evicted,
+                "expired": self._expired,
+                "bytes": sum(self._sizeOf(session) for session in self._sessions.values()),
+            }
+
+    def _store(self, sessionID, session):
+        """Add session to the store as the most recently used one, and
+        make room for it.
+
+        """
+        self._sessions[sessionID] = session
+        self._touch(sessionID)
+        self._expire(self._lastUsed[sessionID])
+        if self._maxSessions is not None:
+            # try each session once: the ones in use can't go.
+            for i in range(len(self._sessions)):
+                if len(self._sessions) <= self._maxSessions:
+                    break
+                oldest = next(iter(self._sessions))
+                if oldest in self._users or oldest in self._kept:
+                    self._touch(oldest)
+                else:
+                    self._evict(oldest)
+                    self._evicted += 1
+
+    def _drop(self, sessionID):
+        """Remove the session sessionID from memory."""
+        self._sessions.pop(sessionID, None)
+        self._lastUsed.pop(sessionID, None)
+        self._users.pop(sessionID, None)
+
+    def _touch(self, sessionID):
+        """Mark the session sessionID as used just now."""
+        self._sessions.move_to_end(sessionID)
+        self._lastUsed[sessionID] = time.time()
+
+    def _expire(self, now):
+        """Evict the sessions that have been idle since before now - ttl."""
+        if self._ttl is None:
+            return
+        while self._sessions:
+            oldest = next(iter(self._sessions))
+            if now - self._lastUsed[oldest] <= self._ttl:
+                break
+            if oldest in self._users or oldest in self._kept:
+                # in use or kept, so not idle
+                self._touch(oldest)
+            else:
+                self._evict(oldest)
+                self._expired += 1
+
+    def _evict(self, sessionID):
+        """Remove the session sessionID and tell the eviction handler."""
+        self._drop(sessionID)
+        if self._evictionHandler is not None:
+            self._evictionHandler(sessionID)
+
+    def _sizeOf(self, obj):
+        """Estimate the number of bytes used by obj and the containers
+        and strings in it.
+
+        """
+        size = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            size += sum(self._sizeOf(k) + self._sizeOf(v) for k, v in obj.items())
+        elif isinstance(obj, Session):
+            size += sum(self._sizeOf(getattr(obj, name)) for name in obj._reserved)
+            if obj._predicates is not None:
+                size += self._sizeOf(obj._predicates)
+        elif isinstance(obj, (list, tuple)):
+            size += sum(self._sizeOf(item) for item in obj)
+        return size
+
+
+class SqliteSessionStore(SessionStore):
+    """Keep the sessions in an SQLite database, with the most recently
+    used ones in memory.
+
+    A session is loaded from the database when it is first used, and
+    stored as a pickled blob of its predicates.  Changed sessions are
+    written in batches: as soon as batchSize sessions are waiting, and
+    at least every flushInterval seconds by a background thread.  When
+    respond() starts on a session that another Kernel has written since
+    it was loaded, the session is loaded again.
+
+    Several worker processes can share the database.  If the sessions
+    aren't routed to the same worker every time, use a batchSize of 1,
+    so that every response is written before the next one can be
+    served by another worker.
+
+    Like any pickle, the database must come from a trusted source.
+
+    """
+    def __init__(self, filename, maxSessions = 1000, ttl = None, compact = False,
+                 batchSize = 1, flushInterval = 1.0):
+        """filename is the SQLite database, which is created if it
+        doesn't exist.  maxSessions, ttl and compact apply to the sessions
+        in memory, see SessionStore.
+
+        """
+        SessionStore.__init__(self, maxSessions, ttl, compact)
+        self._batchSize = batchSize
+        self._flushInterval = flushInterval
+        self._db = sqlite3.connect(filename, timeout = 30.0, check_same_thread = False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, "
+                         "stamp BLOB NOT NULL, updated REAL NOT NULL, data BLOB NOT NULL)")
+        self._db.commit()
+        self._dbLock = threading.Lock()
+        # the stamp of every session in memory, as last read or written;
+        # a new stamp is written along with every change.
+        self._stamps = {}
+        # the changed sessions waiting to be written, and the ones
+        # being written
+        self._pending = {}
+        self._pendingSince = None
+        self._writing = set()
+        self._loads = 0
+        self._reloads = 0
+        self._writes = 0
+        self._flushes = 0
+        self._closed = threading.Event()
+        self._flusher = None
+        if batchSize > 1 and flushInterval is not None:
+            self._flusher = threading.Thread(target = self._flushPeriodically)
+            self._flusher.daemon = True
+            self._flusher.start()
+
+    def load(self, sessionID):
+        """Return the session sessionID, from memory, from the sessions
+        waiting to be written or from the database, or None if there is
+        no such session.
+
+        """
+        with self._lock:
+            session = self._sessions.get(sessionID)
+            if session is not None:
+                return session
+            session = self._pending.get(sessionID)
+            if session is None:
+                stamp, session = self._read(sessionID)
+                if session is None:
+                    return None
+                self._stamps[sessionID] = stamp
+            self._store(sessionID, session)
+            return session
+
+    def changed(self, sessionID, session):
+        """Queue session to be written."""
+        with self._lock:
+            if not self._pending:
+                self._pendingSince = time.time()
+            self._pending[sessionID] = session
+
+    def delete(self, sessionID):
+        """Remove the session sessionID from memory and the database."""
+        with self._lock:
+            self._drop(sessionID)
+            self._pending.pop(sessionID, None)
+            with self._dbLock:
+                self._db.execute("DELETE FROM sessions WHERE id = ?", (sessionID,))
+                self._db.commit()
+
+    def acquire(self, sessionID):
+        """Mark the session sessionID as used, and load it again if
+        another Kernel has written it since it was loaded.
+
+        """
+        with self._lock:
+            if sessionID in self._sessions and sessionID not in self._users and \
+               sessionID not in self._pending and sessionID not in self._writing:
+                with self._dbLock:
+                    row = self._db.execute("SELECT stamp FROM sessions WHERE id = ?", (sessionID,)).fetchone()
+                if row is not None and row[0] != self._stamps.get(sessionID):
+                    stamp, session = self._read(sessionID)
+                    if session is not None:
+                        self._sessions[sessionID] = session
+                        self._stamps[sessionID] = stamp
+                        self._reloads += 1
+            SessionStore.acquire(self, sessionID)
+
+    def release(self, sessionID):
+        """Undo acquire(), and queue the session to be written."""
+        with self._lock:
+            SessionStore.release(self, sessionID)
+            session = self._sessions.get(sessionID)
+            if session is not None:
+                self.changed(sessionID, session)
+
+    def commit(self):
+        """Write the waiting sessions if there are batchSize of them, or
+        if the oldest has waited for flushInterval seconds.
+
+        """
+        if len(self._pending) >= self._batchSize or \
+           (self._pending and self._flushInterval is not None and
+            time.time() - self._pendingSince >= self._flushInterval):
+            self.flush()
+
+    def flush(self):
+        """Write all waiting sessions that aren't in use now, in one
+        transaction.  Return the number of sessions written.
+
+        """
+        with self._lock:
+            batch = []
+            for sessionID in list(self._pending.keys()):
+                if sessionID in self._users:
+                    continue # it's written when it's released
+                session = self._pending.pop(sessionID)
+                batch.append((sessionID, os.urandom(8), time.time(), self._serialize(session)))
+            self._pendingSince = time.time()
+            if not batch:
+                return 0
+            self._writing.update(row[0] for row in batch)
+        try:
+            with self._dbLock:
+                with self._db:
+                    self._db.executemany("INSERT OR REPLACE INTO sessions (id, stamp, updated, data) "
+                                         "VALUES (?, ?, ?, ?)", batch)
+        finally:
+            with self._lock:
+                for sessionID, stamp, updated, data in batch:
+                    self._writing.discard(sessionID)
+                    if sessionID in self._sessions:
+                        self._stamps[sessionID] = stamp
+                self._writes += len(batch)
+                self._flushes += 1
+        return len(batch)
+
+    def purge(self, seconds):
+        """Delete the sessions that haven't been written for seconds
+        from the database, and return how many there were.  Sessions in
+        memory are left alone.
+
+        """
+        with self._dbLock:
+            with self._db:
+                cursor = self._db.execute("DELETE FROM sessions WHERE updated < ?", (time.time() - seconds,))
+            return cursor.rowcount
+
+    def ids(self):
+        """Return a list of the IDs of all sessions, in memory or in the
+        database.
+
+        """
+        with self._lock:
+            ids = set(self._sessions.keys()) | set(self._pending.keys())
+            with self._dbLock:
+                ids.update(row[0] for row in self._db.execute("SELECT id FROM sessions"))
+            return list(ids)
+
+    def __contains__(self, sessionID):
+        with self._lock:
+            if sessionID in self._sessions or sessionID in self._pending:
+                return True
+            with self._dbLock:
+                return self._db.execute("SELECT 1 FROM sessions WHERE id = ?", (sessionID,)).fetchone() is not None
+
+    def __len__(self):
+        return len(self.ids())
+
+    def stats(self):
+        """Return the statistics of SessionStore.stats() for the sessions
+        in memory, plus the numbers of sessions waiting to be written,
+        loaded from the database, loaded again because another Kernel
+        changed them, and written, and the number of batches written.
+
+        """
+        stats = SessionStore.stats(self)
+        with self._lock:
+            stats["pending"] = len(self._pending)
+            stats["loads"] = self._loads
+            stats["reloads"] = self._reloads
+            stats["writes"] = self._writes
+            stats["flushes"] = self._flushes
+        return stats
+
+    def close(self):
+        """Write the waiting sessions and close the database."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        with self._dbLock:
+            self._db.close()
+
+    def _drop(self, sessionID):
+        SessionStore._drop(self, sessionID)
+        self._stamps.pop(sessionID, None)
+
+    def _read(self, sessionID):
+        """Return the (stamp, session) of sessionID in the database, or
+        (None, None) if it isn't there.
+
+        """
+        with self._dbLock:
+            row = self._db.execute("SELECT stamp, data FROM sessions WHERE id = ?", (sessionID,)).fetchone()
+        if row is None:
+            return None, None
+        self._loads += 1
+        session = self.newSession()
+        for name, value in pickle.loads(row[1]).items():
+            session[name] = value
+        return row[0], session
+
+    def _serialize(self, session):
+        """Pickle the predicates of session.  The input and match stacks
+        are left out, they are empty in between responses.
+
+        """
+        predicates = dict((name, value) for (name, value) in session.items()
+                          if name not in ("_inputStack", "_matchStack"))
+        return pickle.dumps(predicates, pickle.HIGHEST_PROTOCOL)
+
+    def _flushPeriodically(self):
+        """The main loop of the background thread writing the waiting
+        sessions.
+
+        """
+        while not self._closed.wait(self._flushInterval):
+            if self._pending:
+                self.flush()
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    def report(number, failure):
+        if failure is None: print("Test #%d PASSED" % number)
+        else: print("Test #%d FAILED: %s" % (number, failure))
+
+    # the least recently used session goes, unless it's in use or kept
+    evicted = []
+    store = SessionStore(maxSessions = 2)
+    store.setEvictionHandler(evicted.append)
+    store.create("a")
+    store.acquire("a")
+    store.create("b")
+    store.create("c")
+    failure = None
+    if sorted(store.ids()) != ["a", "c"] or evicted != ["b"]:
+        failure = "sessions %s, evicted %s" % (sorted(store.ids()), evicted)
+    report(1, failure)
+
+    store.release("a")
+    store.keep("c")
+    store.create("d")
+    failure = None
+    if sorted(store.ids()) != ["c", "d"] or evicted != ["b", "a"]:
+        failure = "sessions %s, evicted %s" % (sorted(store.ids()), evicted)
+    report(2, failure)
+
+    # idle sessions expire, the ones in use don't
+    evicted = []
+    store = SessionStore(ttl = 0.05)
+    store.setEvictionHandler(evicted.append)
+    store.create("a")
+    store.create("b")
+    store.acquire("b")
+    time.sleep(0.1)
+    expired = store.expire()
+    failure = None
+    if expired != 1 or store.ids() != ["b"] or evicted != ["a"] or store.stats()["expired"] != 1:
+        failure = "%d expired, sessions %s, evicted %s" % (expired, store.ids(), evicted)
+    report(3, failure)
+
+    # compact sessions keep the reserved predicates in slots
+    store = SessionStore(compact = True)
+    session = store.create("a")
+    session["name"] = "Alice"
+    session["_inputHistory"].append("hello")
+    failure = None
+    if not isinstance(session, Session) or sorted(session.items())[0] != ("_inputHistory", ["hello"]) or \
+       session["name"] != "Alice" or "age" in session:
+        failure = "items %s" % session.items()
+    report(4, failure)
+
+    tempDir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tempDir, "sessions.db")
+
+        # two stores on the same database see each other's sessions
+        first = SqliteSessionStore(filename)
+        second = SqliteSessionStore(filename)
+        session = first.create("a")
+        session["name"] = "Alice"
+        first.changed("a", session)
+        first.commit()
+        session = second.load("a")
+        failure = None
+        if session is None or session["name"] != "Alice":
+            failure = "session %s" % (session and session.items())
+        report(5, failure)
+
+        # a session written by the other store is loaded again when
+        # it's acquired, unless it's in use
+        session = first.load("a")
+        first.acquire("a")
+        session["name"] = "Alicia"
+        first.release("a")
+        first.commit()
+        second.acquire("a")
+        session = second.get("a")
+        second.release("a")
+        second.commit()
+        failure = None
+        if session["name"] != "Alicia" or second.stats()["reloads"] != 1:
+            failure = "name %s, %d reloads" % (session["name"], second.stats()["reloads"])
+        report(6, failure)
+        first.close()
+        second.close()
+
+        # write-behind: the changed sessions are written once batchSize
+        # of them are waiting, or by flush(), but the ones in use wait
+        # until they're released
+        first = SqliteSessionStore(filename, batchSize = 3, flushInterval = None)
+        second = SqliteSessionStore(filename)
+        for sessionID in ("b", "c"):
+            first.changed(sessionID, first.create(sessionID))
+        first.commit()
+        failure = None
+        if "b" in second or first.stats()["pending"] != 2:
+            failure = "written before the batch is full"
+        first.acquire("b")
+        written = first.flush()
+        if failure is None and (written != 1 or "b" in second or "c" not in second):
+            failure = "%d written by flush()" % written
+        first.release("b")
+        first.changed("d", first.create("d"))
+        first.commit()
+        if failure is None and (first.stats()["pending"] != 2 or "d" in second):
+            failure = "written before the batch is full"
+        first.close()
+        if failure is None and not ("b" in second and "d" in second):
+            failure = "not written by close()"
+        report(7, failure)
+        second.close()
+
+        # an evicted session is loaded again from the database
+        store = SqliteSessionStore(filename, maxSessions = 1)
+        store.load("a")
+        store.load("b")
+        session = store.load("a")
+        failure = None
+        if store.get("b") is not None or session["name"] != "Alicia" or store.stats()["evicted"] != 2:
+            failure = "sessions %s" % store.stats()
+        report(8, failure)
+        store.close()
+    finally:
+        shutil.rmtree(tempDir)
@@ -0,0 +1,341 @@
+"""This file contains the executors that run the commands of <system>
+elements for the Kernel.  See Kernel.setSystemExecutor().
+
+SubprocessExecutor runs every command in a shell, like os.popen() does.
+PythonWorkerPool keeps a few Python processes around which have imported
+a module once, and hands the commands running that module as a script
+over to them.  Both enforce a timeout and an output limit on every
+command, and keep statistics.
+
+"""
+
+import asyncio
+import importlib
+import locale
+import multiprocessing
+import os
+import queue
+import shlex
+import signal
+import subprocess
+import threading
+import time
+import traceback
+
+class SystemCommandError(RuntimeError):
+    """Raised when a <system> command fails or times out."""
+    pass
+
+class SystemExecutor:
+    """The base class of the <system> executors.
+
+    Subclasses implement run(), which returns the output of a command
+    as a string.  runAsync() is its counterpart for respondAsync(); by
+    default, it calls run() in a worker thread of the event loop.
+
+    """
+    def __init__(self, timeout = 10.0, maxOutput = 1 << 20):
+        """timeout is the number of seconds a command may run, None for
+        no limit.  maxOutput is the number of characters of output
+        kept, the rest is cut off.
+
+        """
+        self._timeout = timeout
+        self._maxOutput = maxOutput
+        self._statsLock = threading.Lock()
+        self._commands = 0
+        self._timeouts = 0
+        self._truncated = 0
+        self._queued = 0
+        self._maxQueued = 0
+        self._totalLatency = 0.0
+        self._maxLatency = 0.0
+
+    def run(self, command):
+        """Run command and return its output."""
+        raise NotImplementedError
+
+    async def runAsync(self, command):
+        """Run command without blocking the event loop and return its
+        output.
+
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.run, command)
+
+    def stats(self):
+        """Return a dictionary with the number of commands run, timed
+        out and cut off, the number of commands waiting to be run now
+        and at most, and the mean and maximum latency in seconds.
+
+        """
+        with self._statsLock:
+            return {
+                "commands": self._commands,
+                "timeouts": self._timeouts,
+                "truncated": self._truncated,
+                "queued": self._queued,
+                "maxQueued": self._maxQueued,
+                "meanLatency": self._totalLatency / self._commands if self._commands else 0.0,
+                "maxLatency": self._maxLatency,
+            }
+
+    def _enqueue(self):
+        """Count a command waiting to be run."""
+        with self._statsLock:
+            self._queued += 1
+            self._maxQueued = max(self._maxQueued, self._queued)
+
+    def _dequeue(self):
+        """Count a waiting command as started."""
+        with self._statsLock:
+            self._queued -= 1
+
+    def _record(self, start, timedOut = False, truncated = False):
+        """Count a finished command, which was submitted at time start."""
+        latency = time.time() - start
+        with self._statsLock:
+            self._commands += 1
+            self._timeouts += timedOut
+            self._truncated += truncated
+            self._totalLatency += latency
+            self._maxLatency = max(self._maxLatency, latency)
+
+    def _limit(self, output):
+        """Return output cut off at the output limit, and whether it
+        was cut off.
+
+        """
+        if self._maxOutput is not None and len(output) > self._maxOutput:
+            return output[:self._maxOutput], True
+        return output, False
+
+
+class SubprocessExecutor(SystemExecutor):
+    """Run every command in a shell of its own.
+
+    The shell starts a new process group, so that a command that times
+    out is killed together with everything it started.
+
+    """
+    def run(self, command):
+        """Run command and return its output."""
+        start = time.time()
+        try:
+            process = subprocess.Popen(command, shell = True, stdout = subprocess.PIPE,
+                                       start_new_session = (os.name == "posix"))
+        except OSError as msg:
+            raise SystemCommandError(str(msg))
+        timedOut = threading.Event()
+        def expire():
+            timedOut.set()
+            self._kill(process)
+        timer = None
+        if self._timeout is not None:
+            timer = threading.Timer(self._timeout, expire)
+            timer.start()
+        try:
+            # reading stops at the output limit, and at the latest when
+            # the timer kills the process.
+            limit = -1 if self._maxOutput is None else self._maxOutput + 1
+            out = process.stdout.read(limit)
+            truncated = self._maxOutput is not None and len(out) > self._maxOutput
+            if truncated:
+                self._kill(process)
+            process.stdout.close()
+            process.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+        self._record(start, timedOut.is_set(), truncated)
+        if timedOut.is_set():
+            raise SystemCommandError("command timed out after %s seconds: %s" % (self._timeout, command))
+        output, _ = self._limit(self._decode(out))
+        return output
+
+    async def runAsync(self, command):
+        """Run command as a subprocess of the event loop and return its
+        output.
+
+        """
+        start = time.time()
+        try:
+            process = await asyncio.create_subprocess_shell(command, stdout = asyncio.subprocess.PIPE,
+                                                            start_new_session = (os.name == "posix"))
+        except OSError as msg:
+            raise SystemCommandError(str(msg))
+        limit = -1 if self._maxOutput is None else self._maxOutput + 1
+        try:
+            out = await asyncio.wait_for(process.stdout.read(limit), self._timeout)
+        except asyncio.TimeoutError:
+            self._kill(process)
+            await process.wait()
+            self._record(start, timedOut = True)
+            raise SystemCommandError("command timed out after %s seconds: %s" % (self._timeout, command))
+        truncated = self._maxOutput is not None and len(out) > self._maxOutput
+        if truncated:
+            self._kill(process)
+        await process.wait()
+        self._record(start, truncated = truncated)
+        output, _ = self._limit(self._decode(out))
+        return output
+
+    def _kill(self, process):
+        """Kill process and its process group."""
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass # it has just exited
+
+    def _decode(self, out):
+        """Decode the output of a command like os.popen() does."""
+        return out.decode(locale.getpreferredencoding(False), 'replace')
+
+
+def _workerMain(conn, module, function, initializer, maxOutput):
+    """The main loop of a PythonWorkerPool worker process.
+
+    It receives the argument lists of commands over conn, and answers
+    each with a ("ok", output) or ("error", traceback) tuple.
+
+    """
+    module = importlib.import_module(module)
+    if initializer is not None:
+        getattr(module, initializer)()
+    function = getattr(module, function)
+    while True:
+        try:
+            args = conn.recv()
+        except EOFError:
+            return
+        try:
+            output = function(args)
+            if maxOutput is not None:
+                output = output[:maxOutput + 1]
+            conn.send(("ok", output))
+        except BaseException:
+            conn.send(("error", traceback.format_exc()))
+
+
+class PythonWorkerPool(SystemExecutor):
+    """Run the commands that start a Python script in warm worker
+    processes instead of a new interpreter each.
+
+    A command like 'python3 script.py -q "gin"' is recognized by the
+    name of the script.  The workers import module once, call its
+    initializer function (if any) to load what every command needs, and
+    then answer each command by calling function(args), where args is
+    the argument list of the command, ['-q', 'gin'] in the example.
+    The function returns what the script would have printed.
+
+    Commands that don't run the script go to a SubprocessExecutor.  A
+    worker whose command times out is killed and replaced by a new one.
+    A command that waits longer than the timeout for a free worker
+    fails as well.
+
+    """
+    def __init__(self, script, module, function, initializer = None, workers = 2,
+                 timeout = 10.0, maxOutput = 1 << 20):
+        SystemExecutor.__init__(self, timeout, maxOutput)
+        self._script = script
+        self._module = module
+        self._function = function
+        self._initializer = initializer
+        self._fallback = SubprocessExecutor(timeout, maxOutput)
+        self._context = multiprocessing.get_context()
+        self._idle = queue.Queue()
+        for i in range(workers):
+            self._idle.put(self._startWorker())
+
+    def _startWorker(self):
+        """Start a worker process and return its (process, connection)."""
+        conn, workerConn = self._context.Pipe()
+        process = self._context.Process(target = _workerMain,
+                                        args = (workerConn, self._module, self._function,
+                                                self._initializer, self._maxOutput))
+        process.daemon = True
+        process.start()
+        workerConn.close()
+        return (process, conn)
+
+    def _stopWorker(self, worker):
+        """Kill a worker process."""
+        process, conn = worker
+        conn.close()
+        process.terminate()
+        process.join()
+
+    def parse(self, command):
+        """Return the argument list of command if it runs the script of
+        this pool with a Python interpreter, otherwise None.
+
+        """
+        try: argv = shlex.split(command)
+        except ValueError: return None
+        if len(argv) < 2 or not os.path.basename(argv[0]).startswith("python"):
+            return None
+        if os.path.basename(argv[1]) != self._script:
+            return None
+        return argv[2:]
+
+    def run(self, command):
+        """Run command and return its output."""
+        args = self.parse(command)
+        if args is None:
+            return self._fallback.run(command)
+        start = time.time()
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            # all workers are busy: wait for one, but no longer than a
+            # command may run, so that stuck workers can't hang respond().
+            self._enqueue()
+            try:
+                worker = self._idle.get(timeout = self._timeout)
+            except queue.Empty:
+                self._record(start, timedOut = True)
+                raise SystemCommandError("no worker was free for %s seconds: %s" % (self._timeout, command))
+            finally:
+                self._dequeue()
+        process, conn = worker
+        try:
+            conn.send(args)
+            ready = conn.poll(self._timeout)
+            if ready:
+                status, output = conn.recv()
+        except (EOFError, OSError):
+            # the worker died; replace it.
+            self._stopWorker(worker)
+            self._idle.put(self._startWorker())
+            self._record(start)
+            raise SystemCommandError("worker process died running: %s" % command)
+        if not ready:
+            self._stopWorker(worker)
+            self._idle.put(self._startWorker())
+            self._record(start, timedOut = True)
+            raise SystemCommandError("command timed out after %s seconds: %s" % (self._timeout, command))
+        self._idle.put(worker)
+        output, truncated = self._limit(output)
+        self._record(start, truncated = truncated)
+        if status != "ok":
+            raise SystemCommandError("command failed: %s\n%s" % (command, output))
+        return output
+
+    def stats(self):
+        """Return the statistics of SystemExecutor.stats(), plus the
+        number of idle workers, and the statistics of the commands that
+        went to a subprocess under "fallback".
+
+        """
+        stats = SystemExecutor.stats(self)
+        stats["idleWorkers"] = self._idle.qsize()
+        stats["fallback"] = self._fallback.stats()
+        return stats
+
+    def close(self):
+        """Stop all worker processes."""
+        while not self._idle.empty():
+            self._stopWorker(self._idle.get())
@@ -0,0 +1,211 @@
+"""This file contains the template compiler of the Kernel.
+
+A template is learned as a tree of nested lists, which the Kernel's
+element processors interpret on every response.  TemplateCompiler turns
+such a tree into a single callable taking the session ID, which returns
+exactly what _processElement() would have returned.  Text is folded into
+constants, the <li> choices of <random> and <condition> are picked out
+once, and the contents of elements are joined instead of being built up
+with +=.  Elements the compiler has no special rule for call their
+element processor, bound when the template is compiled.
+
+"""
+
+import random
+import re
+import string
+
+class TemplateCompiler:
+    """Compile the templates of a Kernel into callables."""
+    def __init__(self, kernel):
+        self._kernel = kernel
+        # the compilers of the built-in elements, by the name of the
+        # Kernel method that processes them.  They are only used as long
+        # as that method is still the processor of the element.
+        self._compilers = {
+            "condition":    ("_processCondition", self._compileCondition),
+            "formal":       ("_processFormal", self._compileFormal),
+            "gender":       ("_processGender", self._compileGender),
+            "gossip":       ("_processGossip", self._compileThink),
+            "javascript":   ("_processJavascript", self._compileThink),
+            "li":           ("_processLi", self._compileContents),
+            "lowercase":    ("_processLowercase", self._compileLowercase),
+            "person":       ("_processPerson", self._compilePerson),
+            "person2":      ("_processPerson2", self._compilePerson),
+            "random":       ("_processRandom", self._compileRandom),
+            "set":          ("_processSet", self._compileSet),
+            "sr":           ("_processSr", self._compileSr),
+            "srai":         ("_processSrai", self._compileSrai),
+            "template":     ("_processTemplate", self._compileContents),
+            "text":         ("_processText", self._compileText),
+            "think":        ("_processThink", self._compileThink),
+            "uppercase":    ("_processUppercase", self._compileUppercase),
+        }
+
+    def compile(self, elem):
+        """Return a callable f(sessionID) which processes the element
+        tree elem.
+
+        """
+        return self._callable(self._compile(elem))
+
+    def _compile(self, elem):
+        """Compile elem into either a constant string or a callable."""
+        kernel = self._kernel
+        name = elem[0]
+        processor = kernel._elementProcessors.get(name)
+        if name in self._compilers:
+            methodName, compiler = self._compilers[name]
+            if processor == getattr(kernel, methodName):
+                return compiler(elem)
+        if name in kernel._customProcessors and processor is not None:
+            return self._compileCustom(elem, kernel._customProcessors[name])
+        if processor is None:
+            # _processElement() warns about the missing handler
+            return lambda sessionID: kernel._processElement(elem, sessionID)
+        return lambda sessionID: processor(elem, sessionID)
+
+    def _callable(self, part):
+        """Return part as a callable, if it is a constant string."""
+        if isinstance(part, str):
+            return lambda sessionID: part
+        return part
+
+    def _join(self, elems):
+        """Compile the list of elements elems, whose results are
+        concatenated, into a constant string or a callable.
+
+        """
+        parts = []
+        for e in elems:
+            part = self._compile(e)
+            if isinstance(part, str) and parts and isinstance(parts[-1], str):
+                parts[-1] += part
+            else:
+                parts.append(part)
+        if len(parts) == 0:
+            return ""
+        if len(parts) == 1:
+            return parts[0]
+        parts = tuple(parts)
+        return lambda sessionID: "".join([p if p.__class__ is str else p(sessionID) for p in parts])
+
+    def _transform(self, elem, func):
+        """Compile an element whose result is func(contents).  func must
+        not depend on anything but its argument, so that it can be
+        applied to constant contents right away.
+
+        """
+        contents = self._join(elem[2:])
+        if isinstance(contents, str):
+            return func(contents)
+        return lambda sessionID: func(contents(sessionID))
+
+    def _compileContents(self, elem):
+        """Compile an element that returns its contents, like <template>."""
+        return self._join(elem[2:])
+
+    def _compileCondition(self, elem):
+        """Compile a <condition> element.  Which of its children are
+        processed is up to Kernel._conditionContents().
+
+        """
+        kernel = self._kernel
+        children = dict((id(e), self._callable(self._compile(e))) for e in elem[2:])
+        def processCondition(sessionID):
+            return "".join([children[id(e)](sessionID) for e in kernel._conditionContents(elem, sessionID)])
+        return processCondition
+
+    def _compileCustom(self, elem, processor):
+        """Compile an element added with Kernel.addElementProcessor()."""
+        contents = self._callable(self._join(elem[2:]))
+        attr = elem[1]
+        return lambda sessionID: processor(contents(sessionID), attr, sessionID)
+
+    def _compileFormal(self, elem):
+        """Compile a <formal> element."""
+        return self._transform(elem, string.capwords)
+
+    def _compileGender(self, elem):
+        """Compile a <gender> element."""
+        return self._compileSubber(elem, 'gender')
+
+    def _compileLowercase(self, elem):
+        """Compile a <lowercase> element."""
+        return self._transform(elem, str.lower)
+
+    def _compilePerson(self, elem):
+        """Compile a <person> or <person2> element."""
+        if len(elem[2:]) == 0: # atomic <person/> = <person><star/></person>
+            elem = [elem[0], elem[1], ['star', {}]]
+        return self._compileSubber(elem, elem[0])
+
+    def _compileRandom(self, elem):
+        """Compile a <random> element."""
+        choices = tuple(self._callable(self._compile(e)) for e in elem[2:] if e[0] == 'li')
+        if len(choices) == 0:
+            return ""
+        if len(choices) == 1:
+            return choices[0]
+        def processRandom(sessionID):
+            # shuffle like _processRandom() does, so that a seeded random
+            # module picks the same item either way.
+            items = list(choices)
+            random.shuffle(items)
+            return items[0](sessionID)
+        return processRandom
+
+    def _compileSet(self, elem):
+        """Compile a <set> element."""
+        kernel = self._kernel
+        name = elem[1]['name']
+        value = self._callable(self._join(elem[2:]))
+        def processSet(sessionID):
+            result = value(sessionID)
+            kernel.setPredicate(name, result, sessionID)
+            return result
+        return processSet
+
+    def _compileSr(self, elem):
+        """Compile an <sr> element."""
+        kernel = self._kernel
+        star = self._callable(self._compile(['star', {}]))
+        return lambda sessionID: kernel._respond(star(sessionID), sessionID)
+
+    def _compileSrai(self, elem):
+        """Compile a <srai> element."""
+        kernel = self._kernel
+        newInput = self._callable(self._join(elem[2:]))
+        return lambda sessionID: kernel._respond(newInput(sessionID), sessionID)
+
+    def _compileSubber(self, elem, subber):
+        """Compile an element whose contents go through a word
+        substitutor.  Kernel.loadSubs() can replace the substitutors, so
+        the substitutor is looked up on every call.
+
+        """
+        kernel = self._kernel
+        contents = self._callable(self._join(elem[2:]))
+        return lambda sessionID: kernel._subbers[subber].sub(contents(sessionID))
+
+    def _compileText(self, elem):
+        """Compile a text element into a constant."""
+        try: elem[2] + ""
+        except TypeError: raise TypeError("Text element contents are not text")
+        if elem[1]["xml:space"] == "default":
+            return re.sub(r"\s+", " ", elem[2])
+        return elem[2]
+
+    def _compileThink(self, elem):
+        """Compile a <think> element."""
+        contents = self._join(elem[2:])
+        if isinstance(contents, str):
+            return ""
+        def processThink(sessionID):
+            contents(sessionID)
+            return ""
+        return processThink
+
+    def _compileUppercase(self, elem):
+        """Compile an <uppercase> element."""
+        return self._transform(elem, str.upper)
@@ -1,6 +1,7 @@
 """This module implements the WordSub class, modelled after a recipe
 in "Python Cookbook" (Recipe 3.14, "Replacing Multiple Patterns in a
-Single Pass" by Xavier Defrang).
+Single Pass" by Xavier Defrang), with a trie instead of the recipe's
+regex.
 
 Usage:
 Use this class like a dictionary to add before/after pairs:
@@ -33,49 +34,99 @@ import re
 import string
 
 class WordSub(dict):
-    """All-in-one multiple-string-substitution class."""
-
-    def _wordToRegex(self, word):
-        """Convert a word to a regex object which matches the word."""
-        if word != "" and word[0].isalpha() and word[-1].isalpha():
-            return "\\b%s\\b" % re.escape(word)
-        else: 
-            return r"\b%s\b" % re.escape(word)
-    
-    def _update_regex(self):
-        """Build re object based on the keys of the current
-        dictionary.
+    """All-in-one multiple-string-substitution class.
+
+    The text is split into runs of word and non-word characters, and the
+    'before' words into the same kind of runs, which go into a trie.  A
+    'before' word can only match a sequence of whole runs, so finding
+    the substitutions takes one walk down the trie per run of the text,
+    however many entries there are.  The result is the same as that of
+    the single regex (r"\bword1\b|\bword2\b|...") the recipe uses:
+    where several words match, the one added first wins.
+
+    """
+
+    # runs of word or non-word characters, as defined by \b
+    _runRE = re.compile(r"\w+|\W+")
+    _wordRE = re.compile(r"\w")
+
+    def _update_trie(self):
+        """Build the trie of the keys of the current dictionary.
+
+        The trie is made of dictionaries mapping a lower-cased run to
+        the next node; the empty string marks the end of a key.  Along
+        with it, the position of every key in the dictionary is kept, to
+        decide between several keys matching at the same place.
 
         """
-        self._regex = re.compile("|".join(map(self._wordToRegex, list(self.keys()))))
-        self._regexIsDirty = False
+        trie = {}
+        order = {}
+        for key in self.keys():
+            order[key] = len(order)
+            node = trie
+            for run in self._runRE.findall(key):
+                node = node.setdefault(run.lower(), {})
+            if node is not trie:
+                node[""] = True
+        self._trie = (trie, order)
+        self._trieIsDirty = False
 
     def __init__(self, defaults = {}):
         """Initialize the object, and populate it with the entries in
         the defaults dictionary.
 
         """
-        self._regex = None
-        self._regexIsDirty = True
+        self._trie = None
+        self._trieIsDirty = True
         for k,v in list(defaults.items()):
             self[k] = v
 
-    def __call__(self, match):
-        """Handler invoked for each regex match."""
-        return self[match.group(0)]
-
     def __setitem__(self, i, y):
-        self._regexIsDirty = True
+        self._trieIsDirty = True
         # for each entry the user adds, we actually add three entrys:
         super(type(self),self).__setitem__(i.lower(),y.lower()) # key = value
         super(type(self),self).__setitem__(string.capwords(i), string.capwords(y)) # Key = Value
         super(type(self),self).__setitem__(i.upper(), y.upper()) # KEY = VALUE
 
+    def __delitem__(self, i):
+        self._trieIsDirty = True
+        super(type(self),self).__delitem__(i)
+
     def sub(self, text):
         """Translate text, returns the modified text."""
-        if self._regexIsDirty:
-            self._update_regex()
-        return self._regex.sub(self, text)
+        if self._trieIsDirty:
+            self._update_trie()
+        trie, order = self._trie
+        runs = self._runRE.findall(text)
+        lowered = [run.lower() for run in runs]
+        numRuns = len(runs)
+        result = []
+        i = 0
+        while i < numRuns:
+            node = trie.get(lowered[i])
+            best = None
+            j = i
+            while node is not None:
+                j += 1
+                if "" in node:
+                    # the trie doesn't know the case of the key, the
+                    # dictionary does.  \b doesn't match at the ends of
+                    # the text next to a non-word character.
+                    key = "".join(runs[i:j])
+                    if key in order and (best is None or order[key] < order[best]) and \
+                       (i > 0 or self._wordRE.match(runs[0])) and \
+                       (j < numRuns or self._wordRE.match(runs[-1])):
+                        best, end = key, j
+                if j == numRuns:
+                    break
+                node = node.get(lowered[j])
+            if best is None:
+                result.append(runs[i])
+                i += 1
+            else:
+                result.append(self[best])
+                i = end
+        return "".join(result)
 
 # self-test
 if __name__ == "__main__":
@@ -0,0 +1,653 @@
+"""
+This file contains the PyAIML benchmarks.  Every benchmark is a subcommand;
+run "python benchmark.py -h" for the list.  The synthetic AIML sets are
+written to a temporary directory and generated from a fixed random seed, so
+runs are comparable with each other.
+"""
+
+import aiml
+from aiml.AimlParser import AimlExpatHandler, create_parser
+from aiml.DefaultSubs import defaultNormal
+from aiml.SessionStore import SessionStore, SqliteSessionStore
+from aiml.WordSub import WordSub
+
+import argparse
+import asyncio
+import marshal
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BRAINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "brains")
+COCKTAIL_BRAINS = os.path.join(BRAINS_DIR, "cocktail_brains.aiml")
+
+# what the sessions of the stress benchmark say, over and over again
+CONVERSATION = ["hi", "How are you?", "I want a cocktail", "I want something blue",
+                "awesome thanks", "tell me about Appletini", "history of Mojito",
+                "how many cocktails do you know?", "I want vodka with lemon", "bye"]
+
+def syntheticWords(count):
+    """Return a vocabulary of count made-up upper case words."""
+    return ["W%d" % i for i in range(count)]
+
+def writeSyntheticAiml(filename, numCategories, seed = 0):
+    """Write an AIML file with numCategories random categories.
+
+    Most patterns are plain words with a wildcard here and there, a few
+    are wildcard-heavy, and some have a <that> pattern or a topic, much
+    like a big hand-written AIML set.
+
+    """
+    rnd = random.Random(seed)
+    words = syntheticWords(max(numCategories // 10, 10))
+    def pattern(length, wildcards):
+        return " ".join(rnd.choice(["*", "_"]) if rnd.random() < wildcards
+                        else rnd.choice(words) for _ in range(length))
+    out = open(filename, "w")
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n<aiml version="1.0.1">\n')
+    for i in range(numCategories):
+        wildcards = 0.5 if rnd.random() < 0.05 else 0.1
+        out.write("<category><pattern>%s</pattern>" % pattern(rnd.randint(1, 6), wildcards))
+        if rnd.random() < 0.1:
+            out.write("<that>%s</that>" % pattern(rnd.randint(1, 3), 0.3))
+        out.write("<template>answer %d</template></category>\n" % i)
+    out.write("</aiml>\n")
+    out.close()
+
+def writeStarHeavyAiml(filename, numCategories, seed = 0):
+    """Write an AIML file of numCategories patterns like "* A * B * A * B
+    * END", plus a catch-all "*" category.  Long inputs made of A and B
+    match such patterns in a huge number of ways before they fail on END,
+    which is the worst case of the backtracking matcher.
+
+    """
+    rnd = random.Random(seed)
+    out = open(filename, "w")
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n<aiml version="1.0.1">\n')
+    for i in range(numCategories):
+        pattern = " ".join("* %s" % rnd.choice(["A", "B"]) for _ in range(4))
+        out.write("<category><pattern>%s * END</pattern>" % pattern)
+        out.write("<template>answer %d</template></category>\n" % i)
+    out.write("<category><pattern>*</pattern><template>catch-all</template></category>\n")
+    out.write("</aiml>\n")
+    out.close()
+
+def writeTemplateHeavyAiml(filename, numCategories, seed = 0):
+    """Write an AIML file of numCategories categories whose templates
+    use the common AIML elements: <srai>, <random>, <condition>, <set>,
+    <get>, <star>, <person> and so on, nested a few levels deep.
+
+    """
+    rnd = random.Random(seed)
+    words = syntheticWords(max(numCategories // 10, 10))
+    def text(length):
+        return " ".join(rnd.choice(words).lower() for _ in range(length))
+    def template(depth):
+        parts = []
+        for _ in range(rnd.randint(1, 4)):
+            kind = rnd.randrange(9) if depth > 0 else 0
+            if kind == 0:
+                parts.append(text(rnd.randint(1, 8)))
+            elif kind == 1:
+                parts.append("<srai>%s <star/></srai>" % text(2).upper())
+            elif kind == 2:
+                parts.append("<random>%s</random>" % "".join(
+                    "\n  <li>%s</li>" % template(depth - 1) for _ in range(rnd.randint(2, 4))))
+            elif kind == 3:
+                parts.append('<condition name="mood"><li value="happy">%s</li><li>%s</li></condition>' % (
+                    template(depth - 1), template(depth - 1)))
+            elif kind == 4:
+                parts.append('<think><set name="topic">%s</set></think>' % text(2))
+            elif kind == 5:
+                parts.append('<get name="name"/> &amp; <bot name="name"/>')
+            elif kind == 6:
+                parts.append("<person><star/></person>")
+            elif kind == 7:
+                parts.append("<uppercase>%s</uppercase>" % template(depth - 1))
+            else:
+                parts.append('<star index="%d"/>' % rnd.randint(1, 2))
+        return " ".join(parts)
+    out = open(filename, "w")
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n<aiml version="1.0.1">\n')
+    for i in range(numCategories):
+        out.write("<category>\n<pattern>%s * %s</pattern>\n" % (text(2).upper(), text(1).upper()))
+        out.write("<template>%s</template>\n</category>\n" % template(2))
+    out.write("</aiml>\n")
+    out.close()
+
+def syntheticInputs(brain, numInputs, seed = 0, long = 0.1, lengths = (12, 30)):
+    """Return numInputs random (input, that, topic) triples made of the
+    words of the patterns in brain.  A share of long of them are long,
+    their number of words is in the lengths range.
+
+    """
+    rnd = random.Random(seed)
+    words = set()
+    nodes = [brain._root]
+    while nodes:
+        node = nodes.pop()
+        for key, child in node.items():
+            if key == brain._TEMPLATE:
+                continue
+            if isinstance(key, str):
+                words.add(key)
+            nodes.append(child)
+    words = sorted(words) + ["UNKNOWN"]
+    inputs = []
+    for i in range(numInputs):
+        length = rnd.randint(*lengths) if rnd.random() < long else rnd.randint(1, 8)
+        inputs.append((" ".join(rnd.choice(words) for _ in range(length)),
+                       rnd.choice(["", " ".join(rnd.choice(words) for _ in range(3))]),
+                       ""))
+    return inputs
+
+def timeMatches(brain, inputs):
+    """Match all inputs and return the templates and the seconds spent."""
+    start = time.time()
+    templates = [brain.match(*triple) for triple in inputs]
+    return templates, time.time() - start
+
+def benchMatch(args):
+    """Compare the node tree matcher with the compiled one."""
+    tmpdir = tempfile.mkdtemp()
+    try:
+        synthetic = os.path.join(tmpdir, "synthetic.aiml")
+        writeSyntheticAiml(synthetic, args.categories)
+        starHeavy = os.path.join(tmpdir, "starheavy.aiml")
+        writeStarHeavyAiml(starHeavy, 200)
+        sets = [("cocktail_brains.aiml", args.aiml, args.inputs, {}),
+                ("synthetic (%d categories)" % args.categories, synthetic, args.inputs, {}),
+                ("star-heavy (200 categories)", starHeavy, args.inputs // 100,
+                 {"long": 1.0, "lengths": (20, 30)})]
+        for name, filename, numInputs, inputArgs in sets:
+            kern = aiml.Kernel()
+            kern.verbose(False)
+            kern.learn(filename)
+            brain = kern._brain
+            inputs = syntheticInputs(brain, numInputs, **inputArgs)
+            brain.compile(False)
+            expected, treeTime = timeMatches(brain, inputs)
+            start = time.time()
+            brain.compile()
+            compileTime = time.time() - start
+            found, compiledTime = timeMatches(brain, inputs)
+            if [id(m and m.template) for m in found] != [id(m and m.template) for m in expected]:
+                sys.exit("%s: the matchers disagree!" % name)
+            print("%s, %d inputs:" % (name, len(inputs)))
+            print("  node tree   %8.3f s" % treeTime)
+            print("  compiled    %8.3f s (+%.3f s to compile)" % (compiledTime, compileTime))
+    finally:
+        shutil.rmtree(tmpdir)
+
+def writeMarshalledBrain(brain, filename):
+    """Save brain in the format of older PyAIML versions, which
+    marshalled the whole node tree.
+
+    """
+    with open(filename, "wb") as outFile:
+        marshal.dump(brain.numTemplates(), outFile)
+        marshal.dump(brain._botName, outFile)
+        marshal.dump(brain._root, outFile)
+
+def startKernel(brainFile, input):
+    """Return the seconds it takes a new Kernel to load brainFile and
+    respond to input.
+
+    """
+    start = time.time()
+    kern = aiml.Kernel()
+    kern.verbose(False)
+    kern.loadBrain(brainFile)
+    kern.respond(input)
+    return time.time() - start
+
+def benchSnapshot(args):
+    """Compare the ways to start a Kernel with a large brain: learning
+    the AIML, loading a marshalled node tree like older versions saved,
+    and loading a snapshot.  Then compare matching with the compiled
+    matcher in memory and straight from the snapshot, and time forking
+    workers which each load the snapshot.
+
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        synthetic = os.path.join(tmpdir, "synthetic.aiml")
+        writeSyntheticAiml(synthetic, args.categories)
+        kern = aiml.Kernel()
+        kern.verbose(False)
+        start = time.time()
+        kern.learn(synthetic)
+        kern.compileBrain()
+        print("learn the AIML       %8.3f s" % (time.time() - start))
+        inputs = syntheticInputs(kern._brain, args.inputs)
+        marshalled = os.path.join(tmpdir, "marshalled.brn")
+        writeMarshalledBrain(kern._brain, marshalled)
+        snapshot = os.path.join(tmpdir, "snapshot.brn")
+        kern.saveBrain(snapshot)
+        for name, filename in (("marshalled tree", marshalled), ("snapshot", snapshot)):
+            print("load %-15s %8.3f s to the first response, %.1f MB" % (
+                name, startKernel(filename, inputs[0][0]), os.path.getsize(filename) / 1e6))
+
+        loaded = aiml.Kernel()
+        loaded.verbose(False)
+        loaded.loadBrain(snapshot)
+        expected, compiledTime = timeMatches(kern._brain, inputs)
+        found, snapshotTime = timeMatches(loaded._brain, inputs)
+        if [m and m.template for m in found] != [m and m.template for m in expected]:
+            sys.exit("the snapshot matches differently!")
+        print("match %d inputs:" % len(inputs))
+        print("  compiled in memory %8.3f s" % compiledTime)
+        print("  snapshot           %8.3f s" % snapshotTime)
+
+        if hasattr(os, "fork"):
+            start = time.time()
+            pids = []
+            for i in range(args.workers):
+                pid = os.fork()
+                if pid == 0:
+                    startKernel(snapshot, inputs[i % len(inputs)][0])
+                    os._exit(0)
+                pids.append(pid)
+            for pid in pids:
+                os.waitpid(pid, 0)
+            print("fork %d workers loading the snapshot %8.3f s" % (args.workers, time.time() - start))
+    finally:
+        shutil.rmtree(tmpdir)
+
+def benchLearn(args):
+    """Time learning synthetic AIML sets of a growing number of files,
+    one file after the other and in parallel processes.
+
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for numFiles in args.files:
+            directory = os.path.join(tmpdir, str(numFiles))
+            os.mkdir(directory)
+            for i in range(numFiles):
+                writeSyntheticAiml(os.path.join(directory, "set%d.aiml" % i), args.categories, seed = i)
+            times = []
+            for workers in (1, args.workers):
+                kern = aiml.Kernel()
+                kern.verbose(False)
+                start = time.time()
+                kern.learn(os.path.join(directory, "*.aiml"), workers = workers)
+                times.append(time.time() - start)
+            print("%4d files: %8.3f s one by one  %8.3f s in %d processes  (%d categories)" % (
+                numFiles, times[0], times[1], args.workers, kern.numCategories()))
+    finally:
+        shutil.rmtree(tmpdir)
+
+def parseAiml(filename, parser):
+    """Parse an AIML file with parser, "sax" or a validation mode of
+    the expat parser, and return its categories.
+
+    """
+    if parser == "sax":
+        saxParser = create_parser()
+        saxParser.parse(filename)
+        return saxParser.getContentHandler().categories
+    handler = AimlExpatHandler(validation = parser)
+    handler.parse(filename)
+    return handler.categories
+
+def benchParse(args):
+    """Compare the throughput of the SAX parser with the one of the
+    expat parser in its three validation modes.
+
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        generated = os.path.join(tmpdir, "generated.aiml")
+        writeTemplateHeavyAiml(generated, args.categories)
+        for filename in (args.aiml, generated):
+            megabytes = os.path.getsize(filename) / 1e6
+            print("%s: %.2f MB" % (os.path.basename(filename), megabytes))
+            reference = None
+            for parser in ("sax", "strict", "fast", "off"):
+                best = None
+                for i in range(args.repeat):
+                    start = time.time()
+                    categories = parseAiml(filename, parser)
+                    elapsed = time.time() - start
+                    if best is None or elapsed < best:
+                        best = elapsed
+                if reference is None:
+                    reference = categories
+                print("  %-7s %8.2f MB/s %10.0f categories/s  %s" % (
+                    parser, megabytes / best, len(categories) / best,
+                    "same categories" if categories == reference else "DIFFERENT categories"))
+    finally:
+        shutil.rmtree(tmpdir)
+
+def cocktailKernel(filename, asynchronous = False):
+    """Return a Kernel that has learned filename, with the <cocktail>
+    element of the cocktail brains registered.
+
+    """
+    sys.path.insert(0, BRAINS_DIR)
+    import cocktail_query
+    kern = aiml.Kernel()
+    kern.verbose(False)
+    engine = cocktail_query.CocktailEngine(os.path.join(BRAINS_DIR, "cocktails.xml"))
+    engine.register(kern, asynchronous = asynchronous)
+    kern.learn(filename)
+    return kern
+
+def converse(kern, sessionID, numRequests, lock = None):
+    """Send numRequests lines of CONVERSATION to the session and return
+    the seconds every response took.  If lock is given, every respond()
+    holds it, like the single Kernel lock of older PyAIML versions did.
+
+    """
+    latencies = []
+    for i in range(numRequests):
+        line = CONVERSATION[i % len(CONVERSATION)]
+        start = time.time()
+        if lock is None:
+            kern.respond(line, sessionID)
+        else:
+            with lock:
+                kern.respond(line, sessionID)
+        latencies.append(time.time() - start)
+    return latencies
+
+async def converseAsync(kern, sessionID, numRequests):
+    """The respondAsync() counterpart of converse()."""
+    latencies = []
+    for i in range(numRequests):
+        start = time.time()
+        await kern.respondAsync(CONVERSATION[i % len(CONVERSATION)], sessionID)
+        latencies.append(time.time() - start)
+    return latencies
+
+def percentile(values, p):
+    """Return the p-th percentile of the sorted list values."""
+    return values[min(len(values) - 1, int(len(values) * p / 100.0))]
+
+def benchStress(args):
+    """Drive concurrent sessions through the cocktail brains with a
+    thread pool, once serialized by one global lock and once with the
+    per-session locks of the Kernel.
+
+    """
+    kern = cocktailKernel(args.aiml)
+    # the first query loads the cocktail index, don't time it.
+    converse(kern, "warm-up", len(CONVERSATION))
+    for name, lock in (("one global lock", threading.Lock()),
+                       ("per-session locks", None)):
+        start = time.time()
+        with ThreadPoolExecutor(args.threads) as pool:
+            futures = [pool.submit(converse, kern, "%s %d" % (name, i), args.requests, lock)
+                       for i in range(args.sessions)]
+            latencies = sorted(sum((f.result() for f in futures), []))
+        printStress("%s, %d sessions on %d threads" % (name, args.sessions, args.threads),
+                    latencies, time.time() - start)
+
+    # the same sessions served by respondAsync() on one event loop, the
+    # <cocktail> queries run in the loop's default executor.
+    kern = cocktailKernel(args.aiml, asynchronous = True)
+    loop = asyncio.get_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(args.threads))
+    start = time.time()
+    results = loop.run_until_complete(asyncio.gather(
+        *[converseAsync(kern, "async %d" % i, args.requests) for i in range(args.sessions)]))
+    printStress("respondAsync, %d sessions on one event loop" % args.sessions,
+                sorted(sum(results, [])), time.time() - start)
+
+def printStress(name, latencies, elapsed):
+    """Print the throughput and the sorted latencies of a stress run."""
+    print("%s:" % name)
+    print("  %8.1f responses/s" % (len(latencies) / elapsed))
+    print("  latency p50 %8.4f s  p95 %8.4f s  max %8.4f s" % (
+        percentile(latencies, 50), percentile(latencies, 95), latencies[-1]))
+
+def recursive(elem):
+    """Return True if the template tree elem responds to new input by
+    <srai> or <sr>, or queries the cocktail index.
+
+    """
+    if elem[0] in ("srai", "sr", "cocktail"):
+        return True
+    return elem[0] != "text" and any(recursive(e) for e in elem[2:])
+
+def processTemplates(kern, sessionID, repeat):
+    """Process every template of the brain that isn't recursive()
+    repeat times, the way _respond() does.  Return the number of
+    templates processed.
+
+    """
+    kern._addSession(sessionID)
+    # give <star/> a match to work with
+    kern.getPredicate(kern._matchStack, sessionID).append(kern._brain.match("HI", "", ""))
+    templates = [t for t in kern._brain.templates() if not recursive(t)]
+    for i in range(repeat):
+        for template in templates:
+            func = kern._templateFunc(template)
+            if func is not None:
+                func(sessionID)
+            else:
+                kern._processElement(template, sessionID)
+    return repeat * len(templates)
+
+def benchTemplates(args):
+    """Compare interpreting the template trees with running the
+    compiled templates, on the cocktail brains: whole responses, and
+    the processing of the templates alone.
+
+    """
+    kern = cocktailKernel(args.aiml)
+    # the first query loads the cocktail index, don't time it.
+    converse(kern, "warm-up", len(CONVERSATION))
+    for name, compiled in (("interpreted", False), ("compiled", True)):
+        kern.compileTemplates(compiled)
+        random.seed(0)
+        start = time.time()
+        for i in range(args.sessions):
+            converse(kern, "%s %d" % (name, i), args.requests)
+        responseRate = args.sessions * args.requests / (time.time() - start)
+        start = time.time()
+        count = processTemplates(kern, name, args.requests)
+        templateRate = count / (time.time() - start)
+        print("%-12s %8.1f responses/s  %8.1f templates/s" % (name, responseRate, templateRate))
+
+def patternInputs(filename):
+    """Return an input for every pattern of the AIML file filename, with
+    its wildcards filled in.
+
+    """
+    text = open(filename, encoding = "utf-8").read()
+    patterns = re.findall(r"<pattern>([^<]*)</pattern>", text)
+    return sorted(set(re.sub(r"[*_]", "please", p).lower() for p in patterns))
+
+def benchCache(args):
+    """Compare responding without and with the response cache on the
+    cocktail brains, and report the hit rate and the memory of the
+    cache.  The sessions of the "conversation" workload say the lines of
+    CONVERSATION; the "first lines" workload says every pattern of the
+    brains as the first line of a new session, like the users of a
+    stateless service do.
+
+    """
+    kern = cocktailKernel(args.aiml)
+    # the first query loads the cocktail index, don't time it.
+    converse(kern, "warm-up", len(CONVERSATION))
+    inputs = patternInputs(args.aiml)
+    for workload in ("conversation", "first lines"):
+        print("%s:" % workload)
+        for name, maxEntries in (("no cache", 0), ("cache", args.max)):
+            kern.setResponseCache(maxEntries)
+            random.seed(0)
+            start = time.time()
+            if workload == "conversation":
+                for i in range(args.sessions):
+                    converse(kern, "%s %d" % (name, i), args.requests)
+                count = args.sessions * args.requests
+            else:
+                for i in range(args.sessions):
+                    for j, line in enumerate(inputs):
+                        kern.respond(line, "%s %d %d" % (name, i, j))
+                count = args.sessions * len(inputs)
+            rate = count / (time.time() - start)
+            cache = kern.responseCache()
+            if cache is None:
+                print("  %-10s %8.1f responses/s" % (name, rate))
+            else:
+                stats = cache.stats()
+                print("  %-10s %8.1f responses/s  hit rate %5.1f%%  %6d entries  %10d bytes" % (
+                    name, rate, stats["hitRate"] * 100, stats["entries"], stats["bytes"]))
+
+def benchSessions(args):
+    """Serve many users that say a few lines each and never come back,
+    with an unlimited session store and with bounded ones, and report
+    the throughput and the memory the sessions are left with.
+
+    """
+    kern = cocktailKernel(args.aiml)
+    converse(kern, "warm-up", len(CONVERSATION))
+    stores = (("unlimited", SessionStore()),
+              ("max %d" % args.max, SessionStore(maxSessions = args.max)),
+              ("max %d, compact" % args.max, SessionStore(maxSessions = args.max, compact = True)))
+    for name, store in stores:
+        kern.setSessionStore(store)
+        start = time.time()
+        for i in range(args.users):
+            converse(kern, "%s %d" % (name, i), args.requests)
+        rate = args.users * args.requests / (time.time() - start)
+        stats = store.stats()
+        print("%-18s %8.1f responses/s  %6d sessions  %10d bytes" % (
+            name, rate, stats["sessions"], stats["bytes"]))
+
+def benchPersistence(args):
+    """Measure the latency an SQLite session store adds to every turn.
+    The sessions take turns, one line each, so that every turn of a
+    session reads it back from the store.
+
+    """
+    kern = cocktailKernel(args.aiml)
+    converse(kern, "warm-up", len(CONVERSATION))
+    tmpdir = tempfile.mkdtemp()
+    try:
+        stores = (("memory", SessionStore()),
+                  ("sqlite, batch 1", SqliteSessionStore(os.path.join(tmpdir, "batch1.db"))),
+                  ("sqlite, batch %d" % args.batch,
+                   SqliteSessionStore(os.path.join(tmpdir, "batch.db"), batchSize = args.batch)))
+        baseline = None
+        for name, store in stores:
+            kern.setSessionStore(store)
+            random.seed(0)
+            latencies = []
+            for turn in range(args.requests):
+                line = CONVERSATION[turn % len(CONVERSATION)]
+                for i in range(args.sessions):
+                    start = time.time()
+                    kern.respond(line, "%s %d" % (name, i))
+                    latencies.append(time.time() - start)
+            latencies.sort()
+            mean = sum(latencies) / len(latencies)
+            if baseline is None:
+                baseline = mean
+            print("%-18s mean %7.3f ms  p95 %7.3f ms  added %7.3f ms/turn" % (
+                name, mean * 1000, percentile(latencies, 95) * 1000, (mean - baseline) * 1000))
+            if isinstance(store, SqliteSessionStore):
+                kern.setSessionStore(SessionStore())
+                store.close()
+    finally:
+        shutil.rmtree(tmpdir)
+
+def benchWordSub(args):
+    """Time the normal substitutions of the conversation inputs, with
+    the default table padded with made-up entries to growing sizes.
+
+    """
+    words = syntheticWords(max(args.sizes))
+    for size in args.sizes:
+        table = dict(defaultNormal)
+        for word in words[:max(size - len(table), 0)]:
+            table[word.lower()] = "x"
+        subber = WordSub(table)
+        subber.sub(CONVERSATION[0]) # builds the lookup structure
+        start = time.time()
+        for i in range(args.repeat):
+            for line in CONVERSATION:
+                subber.sub(line)
+        rate = args.repeat * len(CONVERSATION) / (time.time() - start)
+        print("%6d entries %10.1f subs/s" % (len(table), rate))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "PyAIML benchmarks")
+    commands = parser.add_subparsers(dest = "command")
+    commands.required = True
+
+    match = commands.add_parser("match", help = "pattern matching: node tree vs. compiled matcher")
+    match.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "real AIML set to match against")
+    match.add_argument("--categories", type = int, default = 20000, help = "size of the synthetic AIML set")
+    match.add_argument("--inputs", type = int, default = 5000, help = "number of inputs to match")
+    match.set_defaults(func = benchMatch)
+
+    learn = commands.add_parser("learn", help = "learning many AIML files: one by one vs. in parallel")
+    learn.add_argument("--files", type = int, nargs = "+", default = [1, 10, 50, 200], help = "numbers of files")
+    learn.add_argument("--categories", type = int, default = 500, help = "number of categories per file")
+    learn.add_argument("--workers", type = int, default = os.cpu_count() or 2, help = "number of parsing processes")
+    learn.set_defaults(func = benchLearn)
+
+    parse = commands.add_parser("parse", help = "AIML parsing throughput: SAX vs. expat parser")
+    parse.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "real AIML set to parse")
+    parse.add_argument("--categories", type = int, default = 20000, help = "size of the generated AIML set")
+    parse.add_argument("--repeat", type = int, default = 5, help = "number of runs, the best of which counts")
+    parse.set_defaults(func = benchParse)
+
+    snapshot = commands.add_parser("snapshot", help = "startup: learning vs. loading a brain vs. a snapshot")
+    snapshot.add_argument("--categories", type = int, default = 20000, help = "size of the synthetic AIML set")
+    snapshot.add_argument("--inputs", type = int, default = 5000, help = "number of inputs to match")
+    snapshot.add_argument("--workers", type = int, default = 8, help = "number of workers to fork")
+    snapshot.set_defaults(func = benchSnapshot)
+
+    stress = commands.add_parser("stress", help = "concurrent sessions through the cocktail brains")
+    stress.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "AIML set using the <cocktail> element")
+    stress.add_argument("--sessions", type = int, default = 16, help = "number of concurrent sessions")
+    stress.add_argument("--threads", type = int, default = 8, help = "size of the thread pool")
+    stress.add_argument("--requests", type = int, default = 50, help = "number of inputs per session")
+    stress.set_defaults(func = benchStress)
+
+    templates = commands.add_parser("templates", help = "template processing: interpreted vs. compiled")
+    templates.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "AIML set using the <cocktail> element")
+    templates.add_argument("--sessions", type = int, default = 20, help = "number of sessions")
+    templates.add_argument("--requests", type = int, default = 100, help = "number of inputs per session")
+    templates.set_defaults(func = benchTemplates)
+
+    cache = commands.add_parser("cache", help = "responding without and with the response cache")
+    cache.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "AIML set using the <cocktail> element")
+    cache.add_argument("--sessions", type = int, default = 20, help = "number of sessions")
+    cache.add_argument("--requests", type = int, default = 100, help = "number of inputs per session")
+    cache.add_argument("--max", type = int, default = 10000, help = "number of responses kept by the cache")
+    cache.set_defaults(func = benchCache)
+
+    sessions = commands.add_parser("sessions", help = "session stores: unlimited vs. bounded")
+    sessions.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "AIML set using the <cocktail> element")
+    sessions.add_argument("--users", type = int, default = 2000, help = "number of users, each with a session of its own")
+    sessions.add_argument("--requests", type = int, default = 5, help = "number of inputs per user")
+    sessions.add_argument("--max", type = int, default = 100, help = "number of sessions kept by the bounded stores")
+    sessions.set_defaults(func = benchSessions)
+
+    persistence = commands.add_parser("persistence", help = "per-turn latency of the SQLite session store")
+    persistence.add_argument("--aiml", default = COCKTAIL_BRAINS, help = "AIML set using the <cocktail> element")
+    persistence.add_argument("--sessions", type = int, default = 200, help = "number of sessions")
+    persistence.add_argument("--requests", type = int, default = 10, help = "number of inputs per session")
+    persistence.add_argument("--batch", type = int, default = 50, help = "batch size of the write-behind store")
+    persistence.set_defaults(func = benchPersistence)
+
+    wordsub = commands.add_parser("wordsub", help = "word substitution with growing tables")
+    wordsub.add_argument("--sizes", type = int, nargs = "+", default = [100, 1000, 5000, 20000],
+                         help = "numbers of entries of the substitution table")
+    wordsub.add_argument("--repeat", type = int, default = 2000, help = "number of times every input is substituted")
+    wordsub.set_defaults(func = benchWordSub)
+
+    args = parser.parse_args()
+    args.func(args)